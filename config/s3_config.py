@@ -6,19 +6,35 @@ configuration for the S3 data lake.
 """
 
 import os
+import copy
 import json
 import logging
-from pathlib import Path
+from collections import ChainMap, deque
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; large configs are then parsed in one go
+    ijson = None
+
+# Handlers and levels are left to the application
 logger = logging.getLogger(__name__)
 
+# Config files larger than this are parsed incrementally when ijson is available
+STREAMING_CONFIG_SIZE = 2 * 1024 * 1024
+
 class S3DataLakeConfig:
     """
     Configuration manager for S3 Data Lake settings.
     
     This class handles loading, saving, and validating configuration for the S3 data lake.
+    
+    The effective configuration is a ChainMap of the values loaded from the file
+    (the overrides) layered over the built-in defaults. Updates only touch the overrides.
     """
     
     def __init__(self, config_path=None):
@@ -30,18 +46,37 @@ class S3DataLakeConfig:
                                          Defaults to './config/s3_config.json'.
         """
         self.config_path = config_path or os.path.join('config', 's3_config.json')
+        self._config_dir = os.path.dirname(self.config_path) or '.'
         self.config = self._load_config()
+        self._refresh_sections()
+    
+    def _refresh_sections(self):
+        """Cache the top-level configuration sections used by the accessors."""
+        self._aws = self.config.get('aws', {})
+        self._data_lake = self.config.get('data_lake', {})
+        self._transfer = self.config.get('transfer', {})
     
     def _load_config(self):
         """Load configuration from file if it exists, otherwise use defaults."""
-        default_config = {
+        self._defaults = {
             "aws": {
                 "bucket_name": "ai-knowledge-manager",
                 "region_name": "us-east-1",
-                "profile_name": None
+                "profile_name": None,
+                "max_pool_connections": 64,
+                "http_blocksize": None
+            },
+            "transfer": {
+                "multipart_threshold": 64 * 1024 * 1024,
+                "multipart_chunksize": 16 * 1024 * 1024,
+                "max_concurrency": 10,
+                "io_chunksize": 1024 * 1024,
+                "max_io_queue": 1000,
+                "use_threads": True
             },
             "data_lake": {
                 "zones": ["raw", "processed", "enriched", "curated"],
+                "persist_metadata_index": False,
                 "lifecycle_rules": {
                     "raw": {
                         "days_to_ia": 90,
@@ -55,56 +90,75 @@ class S3DataLakeConfig:
             }
         }
         
+        # Values loaded from the config file, layered over the defaults
+        self._overrides = {}
+        
         # If config file exists, load it
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, 'r') as f:
-                    loaded_config = json.load(f)
+                with open(self.config_path, 'rb') as f:
+                    if ijson and os.fstat(f.fileno()).st_size > STREAMING_CONFIG_SIZE:
+                        # Rebuild the config from its top-level items to bound peak memory
+                        loaded_config = dict(ijson.kvitems(f, '', use_float=True))
+                    else:
+                        raw_config = f.read()
+                        loaded_config = orjson.loads(raw_config) if orjson else json.loads(raw_config)
                 
-                # Merge loaded config with defaults
-                default_config.update(loaded_config)
-                logger.info(f"Loaded configuration from {self.config_path}")
+                # Layer the loaded config over the defaults
+                self._overrides = loaded_config
+                logger.info("Loaded configuration from %s", self.config_path)
             except Exception as e:
-                logger.error(f"Error loading configuration: {str(e)}")
+                logger.error("Error loading configuration: %s", e)
         else:
-            logger.info(f"Configuration file {self.config_path} not found. Using defaults.")
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-            # Save default config
-            self.save_config(default_config)
+            logger.info("Configuration file %s not found. Using defaults.", self.config_path)
+            # Save default config (save_config creates the directory if needed)
+            self.save_config(self._defaults)
         
-        return default_config
+        return ChainMap(self._overrides, self._defaults)
     
     def save_config(self, config=None):
         """
         Save configuration to file.
         
+        By default only the overrides are written. Sections that were never overridden
+        (e.g. transfer) are left out of the file and keep following the built-in
+        defaults when it is loaded again.
+        
         Args:
-            config (dict, optional): Configuration to save. Defaults to current config.
+            config (dict, optional): Configuration to save. Defaults to the current overrides.
         
         Returns:
             bool: True if save was successful, False otherwise
         """
-        config_to_save = config or self.config
+        config_to_save = config or self._overrides
         
         try:
             # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
+            os.makedirs(self._config_dir, exist_ok=True)
             
             # Save configuration
-            with open(self.config_path, 'w') as f:
-                json.dump(config_to_save, f, indent=4)
+            if orjson:
+                with open(self.config_path, 'wb') as f:
+                    f.write(orjson.dumps(config_to_save, option=orjson.OPT_INDENT_2))
+            else:
+                # Serialize first so the file is written with a single call
+                with open(self.config_path, 'w') as f:
+                    f.write(json.dumps(config_to_save, indent=4))
             
-            logger.info(f"Saved configuration to {self.config_path}")
+            logger.info("Saved configuration to %s", self.config_path)
             return True
         
         except Exception as e:
-            logger.error(f"Error saving configuration: {str(e)}")
+            logger.error("Error saving configuration: %s", e)
             return False
     
     def update_config(self, updates):
         """
-        Update configuration with new values.
+        Update configuration with new values and save the overrides.
+        
+        Nested dictionaries are merged key by key. A section updated for the first time
+        is seeded from its defaults, so the saved file holds the whole section; sections
+        that were not updated are not written (see save_config).
         
         Args:
             updates (dict): Dictionary with updated values
@@ -112,20 +166,36 @@ class S3DataLakeConfig:
         Returns:
             bool: True if update was successful, False otherwise
         """
-        # Helper function to update nested dictionaries
+        # Helper function to update nested dictionaries without recursion
         def update_nested_dict(d, u):
-            for k, v in u.items():
-                if isinstance(v, dict) and k in d and isinstance(d[k], dict):
-                    update_nested_dict(d[k], v)
-                else:
-                    d[k] = v
+            pending = deque([(d, u)])
+            while pending:
+                dst, src = pending.popleft()
+                
+                # Fast path: no overlapping keys, nothing to merge recursively
+                if not (dst.keys() & src.keys()):
+                    dst.update(src)
+                    continue
+                
+                for k, v in src.items():
+                    if isinstance(v, dict) and k in dst and isinstance(dst[k], dict):
+                        pending.append((dst[k], v))
+                    else:
+                        dst[k] = v
         
         try:
-            update_nested_dict(self.config, updates)
+            # Seed overridden sections from the defaults so a partial update keeps the
+            # remaining default keys of that section
+            for k, v in updates.items():
+                if isinstance(v, dict) and k not in self._overrides and isinstance(self._defaults.get(k), dict):
+                    self._overrides[k] = copy.deepcopy(self._defaults[k])
+            
+            update_nested_dict(self._overrides, updates)
+            self._refresh_sections()
             return self.save_config()
         
         except Exception as e:
-            logger.error(f"Error updating configuration: {str(e)}")
+            logger.error("Error updating configuration: %s", e)
             return False
     
     def validate_config(self):
@@ -137,14 +207,15 @@ class S3DataLakeConfig:
         """
         try:
             # Check required AWS settings
-            if not self.config.get('aws', {}).get('bucket_name'):
+            aws = self._aws
+            if not aws.get('bucket_name'):
                 return False, "AWS bucket name is required"
             
-            if not self.config.get('aws', {}).get('region_name'):
+            if not aws.get('region_name'):
                 return False, "AWS region name is required"
             
             # Check if zones are defined
-            if not self.config.get('data_lake', {}).get('zones'):
+            if not self._data_lake.get('zones'):
                 return False, "Data lake zones are required"
             
             return True, "Configuration is valid"
@@ -159,7 +230,7 @@ class S3DataLakeConfig:
         Returns:
             dict: AWS configuration
         """
-        return self.config.get('aws', {})
+        return self._aws
     
     def get_data_lake_config(self):
         """
@@ -168,7 +239,16 @@ class S3DataLakeConfig:
         Returns:
             dict: Data lake configuration
         """
-        return self.config.get('data_lake', {})
+        return self._data_lake
+    
+    def get_transfer_config(self):
+        """
+        Get S3 transfer settings (keyword arguments for boto3's TransferConfig).
+        
+        Returns:
+            dict: Transfer configuration
+        """
+        return self._transfer
     
     def get_bucket_name(self):
         """
@@ -177,7 +257,7 @@ class S3DataLakeConfig:
         Returns:
             str: Bucket name
         """
-        return self.config.get('aws', {}).get('bucket_name')
+        return self._aws.get('bucket_name')
     
     def get_region_name(self):
         """
@@ -186,7 +266,7 @@ class S3DataLakeConfig:
         Returns:
             str: Region name
         """
-        return self.config.get('aws', {}).get('region_name')
+        return self._aws.get('region_name')
     
     def get_profile_name(self):
         """
@@ -195,4 +275,31 @@ class S3DataLakeConfig:
         Returns:
             str: Profile name or None
         """
-        return self.config.get('aws', {}).get('profile_name')
\ No newline at end of file
+        return self._aws.get('profile_name')
+    
+    def get_max_pool_connections(self):
+        """
+        Get the size of the S3 client's HTTP connection pool.
+        
+        Returns:
+            int: Maximum number of pooled connections
+        """
+        return self._aws.get('max_pool_connections', self._defaults['aws']['max_pool_connections'])
+    
+    def get_http_blocksize(self):
+        """
+        Get the HTTP connection block size override.
+        
+        Returns:
+            int: Block size in bytes or None to keep the library defaults
+        """
+        return self._aws.get('http_blocksize')
+    
+    def get_persist_metadata_index(self):
+        """
+        Get whether metadata searches store their index in the bucket.
+        
+        Returns:
+            bool: True to persist the per-zone metadata index, False to keep it in memory
+        """
+        return self._data_lake.get('persist_metadata_index', self._defaults['data_lake']['persist_metadata_index'])
\ No newline at end of file
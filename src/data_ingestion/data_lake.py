@@ -10,17 +10,77 @@ It handles:
 """
 
 import boto3
+import http.client
+import io
 import os
+import time
+import tempfile
+import threading
+import concurrent.futures
+import itertools
 import json
 import logging
-from pathlib import Path
 from datetime import datetime
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+try:
+    import aioboto3
+except ImportError:
+    aioboto3 = None
+
+# Handlers and levels are left to the application
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent requests for batch operations
+MAX_WORKERS = 10
+
+# Default size of the S3 client's HTTP connection pool
+MAX_POOL_CONNECTIONS = 64
+
+# Part of the InvalidRequest message CopyObject returns for sources over its 5 GiB limit
+COPY_SIZE_LIMIT_MESSAGE = 'maximum allowable size for a copy source'
+
+# Keys per DeleteObjects request (the S3 maximum) and concurrent delete requests
+DELETE_BATCH_SIZE = 1000
+DELETE_WORKERS = 8
+
+# Seconds a cached get_file_metadata result is served before going back to S3
+METADATA_CACHE_TTL = 30
+
+# Prefix of the per-zone objects that index user metadata for searches, when persisted.
+# It lies outside the zone prefixes, so zone listings and lifecycle rules never match it.
+METADATA_INDEX_PREFIX = '.metadata-index/'
+
+
+def set_http_blocksize(blocksize):
+    """
+    Set the block size new HTTP connections use to send request bodies.
+    The 8-16 KB defaults of http.client and urllib3 cost noticeable CPU on fast links.
+    This changes process-wide defaults, so it affects every client created afterwards.
+    
+    Args:
+        blocksize (int): Block size in bytes
+    """
+    defaults = http.client.HTTPConnection.__init__.__defaults__
+    http.client.HTTPConnection.__init__.__defaults__ = defaults[:-1] + (blocksize,)
+    
+    try:
+        from urllib3.connection import HTTPConnection
+    except ImportError:
+        return
+    # urllib3 2.x takes blocksize as a keyword-only argument with its own default
+    kwdefaults = HTTPConnection.__init__.__kwdefaults__
+    if kwdefaults and 'blocksize' in kwdefaults:
+        kwdefaults['blocksize'] = blocksize
+
+
+def _format_timestamp(timestamp):
+    """Format an S3 timestamp (UTC) as 'YYYY-MM-DD HH:MM:SS'."""
+    return timestamp.replace(tzinfo=None).isoformat(sep=' ', timespec='seconds')
+
+
 class S3DataLake:
     """
     S3DataLake class to manage the AWS S3 data lake infrastructure for the AI Knowledge Manager.
@@ -32,7 +92,8 @@ class S3DataLake:
     - Moving files across zones as they are processed
     """
     
-    def __init__(self, bucket_name, region_name='us-east-1', profile_name=None):
+    def __init__(self, bucket_name, region_name='us-east-1', profile_name=None, max_pool_connections=None,
+                 transfer_config=None, persist_metadata_index=False):
         """
         Initialize the S3DataLake with a bucket name and optional region.
         
@@ -40,35 +101,108 @@ class S3DataLake:
             bucket_name (str): The name of the S3 bucket to use for the data lake
             region_name (str, optional): AWS region. Defaults to 'us-east-1'.
             profile_name (str, optional): AWS profile name for credentials. Defaults to None.
+            max_pool_connections (int, optional): Size of the client's HTTP connection pool.
+                                                  Raise this to match the number of threads
+                                                  issuing requests concurrently. Defaults to
+                                                  MAX_POOL_CONNECTIONS.
+            transfer_config (TransferConfig, optional): Settings for managed uploads, downloads
+                                                        and copies. Defaults to 8 MB parts with
+                                                        10 threads.
+            persist_metadata_index (bool, optional): Whether metadata searches store their index in
+                                                     the bucket, so other processes can reuse it.
+                                                     This writes an object per zone whenever a
+                                                     search finds changes. Defaults to False
+                                                     (the index is kept in memory only).
         """
         self.bucket_name = bucket_name
         self.region_name = region_name
+        self.profile_name = profile_name
         
         # Set up AWS session
         if profile_name:
-            session = boto3.Session(profile_name=profile_name, region_name=region_name)
+            self._session = boto3.Session(profile_name=profile_name, region_name=region_name)
         else:
-            session = boto3.Session(region_name=region_name)
-        
-        self.s3 = session.client('s3')
-        self.s3_resource = session.resource('s3')
+            self._session = boto3.Session(region_name=region_name)
+        
+        # Size the connection pool for concurrent batch operations and back off
+        # adaptively when S3 throttles with 503 Slow Down
+        self.max_pool_connections = max_pool_connections or MAX_POOL_CONNECTIONS
+        self._client_config = Config(
+            max_pool_connections=self.max_pool_connections,
+            retries={'mode': 'adaptive', 'max_attempts': 10},
+            tcp_keepalive=True
+        )
+        self.s3 = self._session.client('s3', config=self._client_config)
+        
+        # Batch operations use at most MAX_WORKERS threads; the rest of the pool is
+        # headroom for managed transfers and callers' own threads
+        self._max_workers = min(MAX_WORKERS, self.max_pool_connections)
+        self._s3_resource = None
+        
+        # In-process caches for HEAD results and presigned URLs, keyed by S3 key
+        self._metadata_cache = {}
+        self._metadata_index = {}
+        self._metadata_index_lock = threading.Lock()
+        self._persist_metadata_index = persist_metadata_index
+        self._metadata_index_writable = True
+        self._presigned_url_cache = {}
+        self._presigned_url_sweep = 0
+        
+        # Transfer settings shared by uploads and downloads
+        self._transfer_config = transfer_config or TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=8 * 1024 * 1024,
+            max_concurrency=10,
+            use_threads=True
+        )
         
         # Define the data lake zones
         self.zones = ['raw', 'processed', 'enriched', 'curated']
+        self._zone_set = frozenset(self.zones)
         
         # Create the data lake if it doesn't exist
         self._ensure_data_lake_exists()
     
+    @property
+    def s3_resource(self):
+        """S3 service resource, created on first use."""
+        if self._s3_resource is None:
+            self._s3_resource = self._session.resource('s3')
+        return self._s3_resource
+    
+    def async_client(self):
+        """
+        Create an asyncio S3 client with the same credentials and client settings.
+        Requires the optional aioboto3 package.
+        
+        Returns:
+            An async context manager yielding the aioboto3 S3 client
+        
+        Raises:
+            ImportError: If aioboto3 is not installed
+        """
+        if aioboto3 is None:
+            raise ImportError("aioboto3 is required for async S3 access. Install it with 'pip install aioboto3'.")
+        
+        session = aioboto3.Session(profile_name=self.profile_name, region_name=self.region_name)
+        return session.client('s3', config=self._client_config)
+    
+    @property
+    def transfer_config(self):
+        """Transfer settings shared by uploads, downloads and managed copies."""
+        return self._transfer_config
+    
     def _ensure_data_lake_exists(self):
         """Ensure the data lake bucket and its zone prefixes exist."""
         try:
             # Check if bucket exists
             self.s3.head_bucket(Bucket=self.bucket_name)
-            logger.info(f"Bucket {self.bucket_name} already exists.")
+            logger.info("Bucket %s already exists.", self.bucket_name)
+            bucket_existed = True
         except ClientError as e:
             # If a 404 error, then the bucket does not exist
             if e.response['Error']['Code'] == '404':
-                logger.info(f"Creating bucket {self.bucket_name} in region {self.region_name}")
+                logger.info("Creating bucket %s in region %s", self.bucket_name, self.region_name)
                 if self.region_name == 'us-east-1':
                     self.s3.create_bucket(Bucket=self.bucket_name)
                 else:
@@ -76,6 +210,7 @@ class S3DataLake:
                         Bucket=self.bucket_name,
                         CreateBucketConfiguration={'LocationConstraint': self.region_name}
                     )
+                bucket_existed = False
             else:
                 # If another error (e.g., access denied), raise it
                 raise
@@ -83,13 +218,15 @@ class S3DataLake:
         # Ensure lifecycle policies are set up for the bucket
         self._setup_lifecycle_policies()
         
-        # Create zone folders if they don't exist
-        for zone in self.zones:
-            self.s3.put_object(
-                Bucket=self.bucket_name,
-                Key=f'{zone}/'
-            )
-            logger.info(f"Created or confirmed zone: {zone}")
+        # Create zone folders for a new bucket; an existing bucket already has them
+        if not bucket_existed:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(self.zones)) as executor:
+                list(executor.map(self._create_zone, self.zones))
+    
+    def _create_zone(self, zone):
+        """Create the folder marker for a zone."""
+        self.s3.put_object(Bucket=self.bucket_name, Key=f'{zone}/')
+        logger.info("Created zone: %s", zone)
     
     def _setup_lifecycle_policies(self):
         """Set up lifecycle policies for the data lake."""
@@ -129,9 +266,9 @@ class S3DataLake:
                 Bucket=self.bucket_name,
                 LifecycleConfiguration=lifecycle_config
             )
-            logger.info(f"Lifecycle policies set up for bucket {self.bucket_name}")
+            logger.info("Lifecycle policies set up for bucket %s", self.bucket_name)
         except ClientError as e:
-            logger.error(f"Error setting lifecycle policies: {str(e)}")
+            logger.error("Error setting lifecycle policies: %s", e)
     
     def upload_file(self, local_file_path, zone='raw', s3_file_path=None, metadata=None):
         """
@@ -146,63 +283,133 @@ class S3DataLake:
         Returns:
             bool: True if upload was successful, False otherwise
         """
-        if zone not in self.zones:
-            logger.error(f"Invalid zone '{zone}'. Must be one of {self.zones}")
+        if zone not in self._zone_set:
+            logger.error("Invalid zone '%s'. Must be one of %s", zone, self.zones)
             return False
         
         try:
             # If no specific S3 path is given, use the filename
             if s3_file_path is None:
-                filename = os.path.basename(local_file_path)
-                s3_file_path = filename
+                s3_file_path = os.path.basename(local_file_path)
             
             # Construct full S3 key
             key = f"{zone}/{s3_file_path}"
             
-            # Prepare extra args with metadata if provided
-            extra_args = {}
-            if metadata:
-                extra_args['Metadata'] = metadata
+            # Only pass extra args when there is metadata to attach
+            extra_args = {'Metadata': metadata} if metadata else None
             
             # Upload the file
             self.s3.upload_file(
                 local_file_path, 
                 self.bucket_name, 
                 key,
-                ExtraArgs=extra_args
+                ExtraArgs=extra_args,
+                Config=self._transfer_config
             )
             
-            logger.info(f"Successfully uploaded {local_file_path} to {key}")
+            self.invalidate_cache(key)
+            logger.info("Successfully uploaded %s to %s", local_file_path, key)
             return True
         
         except ClientError as e:
-            logger.error(f"Error uploading file: {str(e)}")
+            logger.error("Error uploading file: %s", e)
             return False
     
-    def download_file(self, s3_key, local_path):
+    def upload_fileobj(self, fileobj, zone, s3_file_path, metadata=None):
+        """
+        Upload the content of a binary file-like object to a specific zone in the data lake.
+        
+        Args:
+            fileobj: Readable binary file-like object, read from its current position
+            zone (str): Data lake zone
+            s3_file_path (str): Path in the zone
+            metadata (dict, optional): Metadata for the file. Defaults to None.
+        
+        Returns:
+            bool: True if upload was successful, False otherwise
+        """
+        if zone not in self._zone_set:
+            logger.error("Invalid zone '%s'. Must be one of %s", zone, self.zones)
+            return False
+        
+        try:
+            key = f"{zone}/{s3_file_path}"
+            extra_args = {'Metadata': metadata} if metadata else None
+            
+            self.s3.upload_fileobj(
+                fileobj, 
+                self.bucket_name, 
+                key,
+                ExtraArgs=extra_args,
+                Config=self._transfer_config
+            )
+            
+            self.invalidate_cache(key)
+            logger.info("Successfully uploaded to %s", key)
+            return True
+        
+        except ClientError as e:
+            logger.error("Error uploading file: %s", e)
+            return False
+    
+    def download_file(self, s3_key, local_path, create_dirs=True):
         """
         Download a file from the data lake.
         
         Args:
             s3_key (str): Full S3 key of the file to download
             local_path (str): Local path to save the file to
+            create_dirs (bool, optional): Whether to create the parent directory first.
+                                          Callers that already did so can skip it. Defaults to True.
         
         Returns:
             bool: True if download was successful, False otherwise
         """
         try:
             # Create the directory if it doesn't exist
-            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+            local_dir = os.path.dirname(local_path)
+            if create_dirs and local_dir:
+                os.makedirs(local_dir, exist_ok=True)
             
-            # Download the file
-            self.s3.download_file(self.bucket_name, s3_key, local_path)
-            logger.info(f"Downloaded {s3_key} to {local_path}")
+            # Download into a temporary file next to the target through a 1 MB buffer
+            # to coalesce disk writes; an existing file is only replaced on success
+            temp = tempfile.NamedTemporaryFile(dir=local_dir or '.', prefix=f".{os.path.basename(local_path)}.",
+                                               suffix='.part', delete=False, buffering=1024 * 1024)
+            try:
+                with temp as f:
+                    self.s3.download_fileobj(self.bucket_name, s3_key, f, Config=self._transfer_config)
+                os.replace(temp.name, local_path)
+            except BaseException:
+                os.remove(temp.name)
+                raise
+            
+            logger.info("Downloaded %s to %s", s3_key, local_path)
             return True
         
         except ClientError as e:
-            logger.error(f"Error downloading file: {str(e)}")
+            logger.error("Error downloading file: %s", e)
             return False
     
+    def download_bytes(self, s3_key):
+        """
+        Download a file from the data lake into memory.
+        
+        Args:
+            s3_key (str): Full S3 key of the file to download
+        
+        Returns:
+            io.BytesIO: Buffer with the file content, positioned at the start, or None if error
+        """
+        buffer = io.BytesIO()
+        try:
+            self.s3.download_fileobj(self.bucket_name, s3_key, buffer, Config=self._transfer_config)
+        except ClientError as e:
+            logger.error("Error downloading file: %s", e)
+            return None
+        
+        buffer.seek(0)
+        return buffer
+    
     def list_files(self, zone=None, prefix=None, recursive=True):
         """
         List files in the data lake, optionally filtered by zone and prefix.
@@ -216,42 +423,65 @@ class S3DataLake:
             list: List of file information dictionaries
         """
         try:
-            # Set up the prefix to use
-            if zone and prefix:
-                full_prefix = f"{zone}/{prefix}"
-            elif zone:
-                full_prefix = f"{zone}/"
-            elif prefix:
-                full_prefix = prefix
-            else:
-                full_prefix = ""
-            
-            # Get objects with the prefix
-            paginator = self.s3.get_paginator('list_objects_v2')
-            pages = paginator.paginate(Bucket=self.bucket_name, Prefix=full_prefix)
-            
-            files = []
-            for page in pages:
-                if 'Contents' in page:
-                    for obj in page['Contents']:
-                        # Skip "directory" markers
-                        if obj['Key'].endswith('/'):
-                            continue
-                        
-                        # Add file information to the list
-                        files.append({
-                            'key': obj['Key'],
-                            'size': obj['Size'],
-                            'last_modified': obj['LastModified'].strftime('%Y-%m-%d %H:%M:%S'),
-                            'zone': obj['Key'].split('/')[0] if '/' in obj['Key'] else 'unknown'
-                        })
-            
-            return files
+            return list(self.iter_files(zone, prefix, recursive))
         
         except ClientError as e:
-            logger.error(f"Error listing files: {str(e)}")
+            logger.error("Error listing files: %s", e)
             return []
     
+    def iter_files(self, zone=None, prefix=None, recursive=True):
+        """
+        Iterate over files in the data lake page by page, optionally filtered by zone and prefix.
+        
+        Args:
+            zone (str, optional): Data lake zone to list. Defaults to None (all zones).
+            prefix (str, optional): Additional prefix filter. Defaults to None.
+            recursive (bool, optional): Whether to list files recursively. Defaults to True.
+        
+        Yields:
+            dict: File information dictionary for each file, as soon as its page arrives
+        
+        Raises:
+            ClientError: If a listing request fails
+        """
+        # Set up the prefix to use
+        if zone and prefix:
+            full_prefix = f"{zone}/{prefix}"
+        elif zone:
+            full_prefix = f"{zone}/"
+        elif prefix:
+            full_prefix = prefix
+        else:
+            full_prefix = ""
+        
+        # Get objects with the prefix
+        paginator = self.s3.get_paginator('list_objects_v2')
+        pages = paginator.paginate(
+            Bucket=self.bucket_name,
+            Prefix=full_prefix,
+            PaginationConfig={'PageSize': 1000}
+        )
+        
+        # Yield file information, skipping "directory" markers and metadata indexes
+        for page in pages:
+            for obj in page.get('Contents', ()):
+                key = obj['Key']
+                if not key.endswith('/') and not key.startswith(METADATA_INDEX_PREFIX):
+                    yield self._file_info(obj)
+    
+    @staticmethod
+    def _file_info(obj):
+        """Build the file information dictionary for a listed S3 object."""
+        key = obj['Key']
+        zone, sep, _ = key.partition('/')
+        return {
+            'key': key,
+            'size': obj['Size'],
+            'last_modified': _format_timestamp(obj['LastModified']),
+            'zone': zone if sep else 'unknown',
+            'etag': obj.get('ETag', '').strip('"')
+        }
+    
     def delete_file(self, s3_key):
         """
         Delete a file from the data lake.
@@ -262,14 +492,61 @@ class S3DataLake:
         Returns:
             bool: True if deletion was successful, False otherwise
         """
-        try:
-            self.s3.delete_object(Bucket=self.bucket_name, Key=s3_key)
-            logger.info(f"Deleted {s3_key}")
-            return True
+        return self.delete_files([s3_key])[s3_key]
+    
+    def delete_files(self, s3_keys):
+        """
+        Delete several files from the data lake.
+        Keys are deleted with DeleteObjects requests of up to DELETE_BATCH_SIZE keys,
+        running up to DELETE_WORKERS batches concurrently.
         
+        Args:
+            s3_keys (iterable): Full S3 keys of the files to delete
+        
+        Returns:
+            dict: Mapping of each key to True if its deletion was successful, False otherwise
+        """
+        keys = iter(s3_keys)
+        batches = iter(lambda: list(itertools.islice(keys, DELETE_BATCH_SIZE)), [])
+        
+        first = next(batches, None)
+        if first is None:
+            return {}
+        second = next(batches, None)
+        if second is None:
+            return self._delete_batch(first)
+        
+        results = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(self._max_workers, DELETE_WORKERS)) as executor:
+            for batch_results in executor.map(self._delete_batch, itertools.chain((first, second), batches)):
+                results.update(batch_results)
+        
+        return results
+    
+    def _delete_batch(self, batch):
+        """Delete one batch of at most 1000 keys with a single DeleteObjects request."""
+        try:
+            response = self.s3.delete_objects(
+                Bucket=self.bucket_name,
+                Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+            )
+            # Quiet mode only reports the keys that could not be deleted
+            errors = {error['Key']: error.get('Message', error.get('Code')) for error in response.get('Errors', [])}
         except ClientError as e:
-            logger.error(f"Error deleting file: {str(e)}")
-            return False
+            logger.error("Error deleting files: %s", e)
+            errors = dict.fromkeys(batch, str(e))
+        
+        results = {}
+        for key in batch:
+            if key in errors:
+                logger.error("Error deleting file %s: %s", key, errors[key])
+                results[key] = False
+            else:
+                self.invalidate_cache(key)
+                logger.info("Deleted %s", key)
+                results[key] = True
+        
+        return results
     
     def move_file(self, source_key, target_zone, target_path=None):
         """
@@ -285,39 +562,119 @@ class S3DataLake:
         Returns:
             bool: True if move was successful, False otherwise
         """
-        if target_zone not in self.zones:
-            logger.error(f"Invalid target zone '{target_zone}'. Must be one of {self.zones}")
-            return False
+        return self.move_files([(source_key, target_zone, target_path)])[source_key]
+    
+    def move_files(self, moves):
+        """
+        Move several files in the data lake.
+        The copies run concurrently and the source objects are removed with
+        batched delete requests (up to 1000 keys per request).
         
-        try:
+        Args:
+            moves (list): List of (source_key, target_zone, target_path) tuples.
+                          target_path may be None to keep the original filename.
+        
+        Returns:
+            dict: Mapping of each source key to True if its move was successful, False otherwise
+        """
+        results = {}
+        copies = []
+        
+        for source_key, target_zone, target_path in moves:
+            if target_zone not in self._zone_set:
+                logger.error("Invalid target zone '%s'. Must be one of %s", target_zone, self.zones)
+                results[source_key] = False
+                continue
+            
             # If no target path specified, use the original filename
             if target_path is None:
-                filename = os.path.basename(source_key)
-                target_path = filename
+                target_path = os.path.basename(source_key)
             
-            # Construct full target key
+            # Construct full target key; a move onto itself would delete the only copy
             target_key = f"{target_zone}/{target_path}"
-            
-            # Copy the object
-            self.s3.copy_object(
-                CopySource={'Bucket': self.bucket_name, 'Key': source_key},
-                Bucket=self.bucket_name,
-                Key=target_key
-            )
-            
-            # Delete the source object
-            self.s3.delete_object(Bucket=self.bucket_name, Key=source_key)
-            
-            logger.info(f"Moved {source_key} to {target_key}")
+            if target_key == source_key:
+                logger.error("Cannot move %s onto itself", source_key)
+                results[source_key] = False
+                continue
+            copies.append((source_key, target_key))
+        
+        if not copies:
+            return results
+        
+        # Copy the objects
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(self._max_workers, len(copies))) as executor:
+            copied = list(executor.map(lambda pair: self._try_copy_object(*pair), copies))
+        
+        copied_sources = []
+        for (source_key, _), success in zip(copies, copied):
+            results[source_key] = success
+            if success:
+                copied_sources.append(source_key)
+        
+        # Delete the source objects
+        for source_key, deleted in self.delete_files(copied_sources).items():
+            results[source_key] = deleted
+        
+        for source_key, target_key in copies:
+            self.invalidate_cache(target_key)
+            if results[source_key]:
+                logger.info("Moved %s to %s", source_key, target_key)
+        
+        return results
+    
+    def _try_copy_object(self, source_key, target_key):
+        """
+        Copy an object within the bucket, logging instead of raising on failure.
+        
+        Returns:
+            bool: True if the copy was successful, False otherwise
+        """
+        copy_source = {'Bucket': self.bucket_name, 'Key': source_key}
+        try:
+            try:
+                self.s3.copy_object(
+                    CopySource=copy_source,
+                    Bucket=self.bucket_name,
+                    Key=target_key,
+                    MetadataDirective='COPY'
+                )
+            except ClientError as e:
+                # CopyObject is limited to 5 GiB; larger objects need a multipart copy,
+                # which keeps the content type and user metadata. Other invalid requests
+                # (e.g. copying an object onto itself) are real failures.
+                error = e.response['Error']
+                if error['Code'] != 'InvalidRequest' or COPY_SIZE_LIMIT_MESSAGE not in error.get('Message', ''):
+                    raise
+                self.s3.copy(copy_source, self.bucket_name, target_key, Config=self._transfer_config)
             return True
         
         except ClientError as e:
-            logger.error(f"Error moving file: {str(e)}")
+            logger.error("Error moving file: %s", e)
             return False
     
+    def get_object_etag(self, s3_key):
+        """
+        Get the current ETag of an object, bypassing the metadata cache.
+        
+        Args:
+            s3_key (str): Full S3 key of the file
+        
+        Returns:
+            str: ETag without surrounding quotes, or None if the object does not exist or on error
+        """
+        try:
+            response = self.s3.head_object(Bucket=self.bucket_name, Key=s3_key)
+            return response.get('ETag', '').strip('"')
+        
+        except ClientError as e:
+            if e.response['Error']['Code'] not in ('404', 'NoSuchKey'):
+                logger.error("Error getting ETag for %s: %s", s3_key, e)
+            return None
+    
     def get_file_metadata(self, s3_key):
         """
         Get metadata for a file in the data lake.
+        Results are cached for METADATA_CACHE_TTL seconds.
         
         Args:
             s3_key (str): Full S3 key of the file
@@ -325,18 +682,29 @@ class S3DataLake:
         Returns:
             dict: File metadata or None if error
         """
+        cached = self._metadata_cache.get(s3_key)
+        if cached is not None and time.monotonic() - cached[0] < METADATA_CACHE_TTL:
+            return dict(cached[1])
+        
+        return self._fetch_file_metadata(s3_key)
+    
+    def _fetch_file_metadata(self, s3_key):
+        """Send a HEAD request for a file's metadata and cache the result."""
         try:
             response = self.s3.head_object(Bucket=self.bucket_name, Key=s3_key)
-            return {
+            file_metadata = {
                 'key': s3_key,
                 'size': response['ContentLength'],
-                'last_modified': response['LastModified'].strftime('%Y-%m-%d %H:%M:%S'),
+                'last_modified': _format_timestamp(response['LastModified']),
                 'content_type': response.get('ContentType', 'unknown'),
+                'etag': response.get('ETag', '').strip('"'),
                 'metadata': response.get('Metadata', {})
             }
+            self._metadata_cache[s3_key] = (time.monotonic(), file_metadata)
+            return dict(file_metadata)
         
         except ClientError as e:
-            logger.error(f"Error getting file metadata: {str(e)}")
+            logger.error("Error getting file metadata: %s", e)
             return None
     
     def update_file_metadata(self, s3_key, metadata):
@@ -351,10 +719,7 @@ class S3DataLake:
             bool: True if update was successful, False otherwise
         """
         try:
-            # First, we need to get the existing object metadata to preserve it
-            existing_obj = self.s3.head_object(Bucket=self.bucket_name, Key=s3_key)
-            
-            # Then, copy the object onto itself with the new metadata
+            # Copy the object onto itself with the new metadata
             self.s3.copy_object(
                 CopySource={'Bucket': self.bucket_name, 'Key': s3_key},
                 Bucket=self.bucket_name,
@@ -363,13 +728,132 @@ class S3DataLake:
                 MetadataDirective='REPLACE'
             )
             
-            logger.info(f"Updated metadata for {s3_key}")
+            self.invalidate_cache(s3_key)
+            logger.info("Updated metadata for %s", s3_key)
             return True
         
         except ClientError as e:
-            logger.error(f"Error updating file metadata: {str(e)}")
+            logger.error("Error updating file metadata: %s", e)
             return False
     
+    def get_metadata_index(self, zone, files):
+        """
+        Get user metadata for the files in a zone from the zone's metadata index.
+        Index entries are checked against the listed ETags and modification times;
+        only new or changed files are sent a HEAD request. Metadata updates keep the
+        ETag, so both are compared.
+        
+        The index is kept in memory. With persist_metadata_index it is also read from
+        .metadata-index/<zone>.json with a single conditional GET and written back
+        whenever it changed.
+        
+        Args:
+            zone (str): Data lake zone
+            files (list): File information dictionaries from list_files covering the whole zone
+        
+        Returns:
+            dict: Mapping of S3 key to user metadata for every file that could be read
+        """
+        entries = self._load_metadata_index(zone)
+        
+        # invalidate_cache may remove entries from other threads meanwhile
+        with self._metadata_index_lock:
+            entries = dict(entries)
+        
+        fresh = {}
+        stale = []
+        for file_info in files:
+            entry = entries.get(file_info['key'])
+            if (entry is not None and entry['etag'] == file_info['etag']
+                    and entry.get('last_modified') == file_info['last_modified']):
+                fresh[file_info['key']] = entry
+            else:
+                stale.append(file_info)
+        
+        if stale:
+            # Bypass the HEAD cache: a cached result may predate the listed change
+            stale_keys = [file_info['key'] for file_info in stale]
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(self._max_workers, len(stale))) as executor:
+                for file_info, file_metadata in zip(stale, executor.map(self._fetch_file_metadata, stale_keys)):
+                    if file_metadata is not None:
+                        # Record the listed values, which the next search compares against
+                        fresh[file_info['key']] = {
+                            'etag': file_info['etag'],
+                            'last_modified': file_info['last_modified'],
+                            'metadata': file_metadata['metadata']
+                        }
+        
+        # Persist the index when files were added, changed or removed since it was written
+        if stale or fresh.keys() != entries.keys():
+            self._save_metadata_index(zone, fresh)
+        
+        return {key: entry['metadata'] for key, entry in fresh.items()}
+    
+    def _load_metadata_index(self, zone):
+        """Fetch a zone's metadata index, reusing the cached copy while its ETag is unchanged."""
+        cached = self._metadata_index.get(zone)
+        if not self._persist_metadata_index:
+            return cached[1] if cached is not None else {}
+        
+        index_key = f"{METADATA_INDEX_PREFIX}{zone}.json"
+        request = {'Bucket': self.bucket_name, 'Key': index_key}
+        if cached is not None and cached[0] is not None:
+            request['IfNoneMatch'] = cached[0]
+        
+        try:
+            response = self.s3.get_object(**request)
+            entries = json.loads(response['Body'].read())
+            self._metadata_index[zone] = (response['ETag'], entries)
+            return entries
+        
+        except ClientError as e:
+            code = e.response['Error']['Code']
+            if code == '304' and cached is not None:
+                return cached[1]
+            if code in ('NoSuchKey', '404') and cached is not None and cached[0] is None:
+                # Entries that could not be written are still valid in this process
+                return cached[1]
+            if code not in ('NoSuchKey', '404'):
+                logger.warning("Error reading metadata index %s: %s", index_key, e)
+            self._metadata_index.pop(zone, None)
+            return {}
+        
+        except ValueError as e:
+            logger.warning("Ignoring corrupt metadata index %s: %s", index_key, e)
+            self._metadata_index.pop(zone, None)
+            return {}
+    
+    def _save_metadata_index(self, zone, entries):
+        """
+        Write a zone's metadata index and cache it under the new ETag.
+        If it cannot be written, the entries are kept in memory under the ETag of
+        the index they replace, so later searches in this process still reuse them.
+        """
+        index_key = f"{METADATA_INDEX_PREFIX}{zone}.json"
+        cached = self._metadata_index.get(zone)
+        if not (self._persist_metadata_index and self._metadata_index_writable):
+            self._metadata_index[zone] = (cached[0] if cached else None, entries)
+            return
+        
+        try:
+            response = self.s3.put_object(
+                Bucket=self.bucket_name,
+                Key=index_key,
+                Body=json.dumps(entries).encode('utf-8'),
+                ContentType='application/json'
+            )
+            self._metadata_index[zone] = (response['ETag'], entries)
+        
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('AccessDenied', '403'):
+                # Read-only credentials: stop trying and keep the index in memory only
+                logger.warning("Metadata index %s is not writable, keeping it in memory only: %s",
+                               index_key, e)
+                self._metadata_index_writable = False
+            else:
+                logger.warning("Error writing metadata index %s: %s", index_key, e)
+            self._metadata_index[zone] = (cached[0] if cached else None, entries)
+    
     def create_folder(self, zone, folder_path):
         """
         Create a folder (prefix) in a specific zone.
@@ -381,8 +865,8 @@ class S3DataLake:
         Returns:
             bool: True if creation was successful, False otherwise
         """
-        if zone not in self.zones:
-            logger.error(f"Invalid zone '{zone}'. Must be one of {self.zones}")
+        if zone not in self._zone_set:
+            logger.error("Invalid zone '%s'. Must be one of %s", zone, self.zones)
             return False
         
         try:
@@ -394,16 +878,18 @@ class S3DataLake:
             key = f"{zone}/{folder_path}"
             self.s3.put_object(Bucket=self.bucket_name, Key=key)
             
-            logger.info(f"Created folder {key}")
+            logger.info("Created folder %s", key)
             return True
         
         except ClientError as e:
-            logger.error(f"Error creating folder: {str(e)}")
+            logger.error("Error creating folder: %s", e)
             return False
 
     def get_presigned_url(self, s3_key, expiration=3600):
         """
         Generate a presigned URL for a file in the data lake.
+        URLs are cached for half their lifetime, so a cached URL is always
+        still valid when it is returned.
         
         Args:
             s3_key (str): Full S3 key of the file
@@ -412,14 +898,51 @@ class S3DataLake:
         Returns:
             str: Presigned URL or None if error
         """
+        now = time.monotonic()
+        cached = self._presigned_url_cache.get(s3_key, {}).get(expiration)
+        if cached is not None and now < cached[0]:
+            return cached[1]
+        
+        # Sweep expired URLs at most once a minute so the cache stays bounded
+        # when many distinct keys are signed
+        sweep = int(now // 60)
+        if sweep != self._presigned_url_sweep:
+            self._presigned_url_sweep = sweep
+            self._prune_presigned_urls(now)
+        
         try:
             url = self.s3.generate_presigned_url(
                 'get_object',
                 Params={'Bucket': self.bucket_name, 'Key': s3_key},
                 ExpiresIn=expiration
             )
+            self._presigned_url_cache.setdefault(s3_key, {})[expiration] = (now + expiration / 2, url)
             return url
         
         except ClientError as e:
-            logger.error(f"Error generating presigned URL: {str(e)}")
-            return None
\ No newline at end of file
+            logger.error("Error generating presigned URL: %s", e)
+            return None
+    
+    def _prune_presigned_urls(self, now):
+        """Remove presigned URLs that are past their cache deadline."""
+        for s3_key in list(self._presigned_url_cache):
+            urls = self._presigned_url_cache[s3_key]
+            for expiration in [exp for exp, (deadline, _) in urls.items() if deadline <= now]:
+                del urls[expiration]
+            if not urls:
+                del self._presigned_url_cache[s3_key]
+    
+    def invalidate_cache(self, s3_key):
+        """
+        Drop any cached metadata and presigned URLs for a file.
+        
+        Args:
+            s3_key (str): Full S3 key of the file
+        """
+        self._metadata_cache.pop(s3_key, None)
+        self._presigned_url_cache.pop(s3_key, None)
+        
+        with self._metadata_index_lock:
+            index = self._metadata_index.get(s3_key.partition('/')[0])
+            if index is not None:
+                index[1].pop(s3_key, None)
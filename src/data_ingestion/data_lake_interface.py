@@ -6,20 +6,37 @@ combining the core S3 infrastructure, configuration management, and file utiliti
 """
 
 import os
+import time
+import asyncio
 import logging
-import pandas as pd
-from typing import Dict, List, Any, Optional, Union, Tuple, Callable
-import uuid
-from datetime import datetime
+import tempfile
+from typing import Dict, List, Any, Optional, Union, Tuple, Callable, Iterator, NamedTuple
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, as_completed, wait
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
 
-from src.data_ingestion.data_lake import S3DataLake
+from src.data_ingestion.data_lake import S3DataLake, set_http_blocksize
 from src.data_ingestion.file_utils import S3FileUtils
+from src.data_ingestion.upload_cache import UploadCache, compute_etag
 from config.s3_config import S3DataLakeConfig
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# Handlers and levels are left to the application
 logger = logging.getLogger(__name__)
 
+# Default number of concurrent S3 requests for bulk operations
+DEFAULT_MAX_WORKERS = 16
+
+class PipelineStep(NamedTuple):
+    """
+    One planned step of a data pipeline input. number counts from 1; zone, file_name
+    and metadata are None for steps whose result is not uploaded.
+    """
+    number: int
+    process_func: Callable
+    file_name: Optional[str]
+    zone: Optional[str]
+    metadata: Optional[Dict[str, str]]
+
 class DataLakeInterface:
     """
     Main interface for interacting with the S3 data lake.
@@ -44,17 +61,30 @@ class DataLakeInterface:
         if not valid:
             raise ValueError(f"Invalid configuration: {message}")
         
+        # Read the connection settings once
+        self._bucket_name = self.config.get_bucket_name()
+        self._region_name = self.config.get_region_name()
+        self._profile_name = self.config.get_profile_name()
+        
+        # Optionally enlarge HTTP send blocks before any connection is opened
+        http_blocksize = self.config.get_http_blocksize()
+        if http_blocksize:
+            set_http_blocksize(http_blocksize)
+        
         # Initialize S3 data lake
         self.data_lake = S3DataLake(
-            bucket_name=self.config.get_bucket_name(),
-            region_name=self.config.get_region_name(),
-            profile_name=self.config.get_profile_name()
+            bucket_name=self._bucket_name,
+            region_name=self._region_name,
+            profile_name=self._profile_name,
+            max_pool_connections=self.config.get_max_pool_connections(),
+            transfer_config=TransferConfig(**self.config.get_transfer_config()),
+            persist_metadata_index=self.config.get_persist_metadata_index()
         )
         
         # Initialize file utilities
         self.file_utils = S3FileUtils(self.data_lake)
         
-        logger.info(f"Initialized data lake interface with bucket {self.config.get_bucket_name()}")
+        logger.info("Initialized data lake interface with bucket %s", self._bucket_name)
     
     def upload_file(self, local_file_path: str, zone: str = 'raw', 
                    s3_file_path: Optional[str] = None, metadata: Optional[Dict[str, str]] = None) -> Optional[str]:
@@ -71,8 +101,9 @@ class DataLakeInterface:
             str: S3 key of the uploaded file or None if error
         """
         if metadata is None:
-            # Auto-extract metadata if not provided
-            metadata = self.file_utils.extract_metadata(local_file_path)
+            # Auto-extract cheap metadata if not provided; the full
+            # extractor reads the whole file and is kept for explicit calls
+            metadata = self.file_utils.extract_metadata_fast(local_file_path)
         
         if self.data_lake.upload_file(local_file_path, zone, s3_file_path, metadata):
             if s3_file_path is None:
@@ -81,18 +112,19 @@ class DataLakeInterface:
         else:
             return None
     
-    def download_file(self, s3_key: str, local_path: str) -> bool:
+    def download_file(self, s3_key: str, local_path: str, create_dirs: bool = True) -> bool:
         """
         Download a file from the data lake.
         
         Args:
             s3_key (str): Full S3 key of the file to download
             local_path (str): Local path to save the file to
+            create_dirs (bool, optional): Whether to create the parent directory first. Defaults to True.
         
         Returns:
             bool: True if download was successful, False otherwise
         """
-        return self.data_lake.download_file(s3_key, local_path)
+        return self.data_lake.download_file(s3_key, local_path, create_dirs)
     
     def list_files(self, zone: Optional[str] = None, prefix: Optional[str] = None, 
                   recursive: bool = True) -> List[Dict[str, Any]]:
@@ -109,6 +141,21 @@ class DataLakeInterface:
         """
         return self.data_lake.list_files(zone, prefix, recursive)
     
+    def iter_files(self, zone: Optional[str] = None, prefix: Optional[str] = None,
+                   recursive: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over files in the data lake without building the full listing first.
+        
+        Args:
+            zone (str, optional): Data lake zone to list. Defaults to None (all zones).
+            prefix (str, optional): Additional prefix filter. Defaults to None.
+            recursive (bool, optional): Whether to list files recursively. Defaults to True.
+        
+        Returns:
+            Iterator[Dict[str, Any]]: File information dictionaries, one listing page at a time
+        """
+        return self.data_lake.iter_files(zone, prefix, recursive)
+    
     def delete_file(self, s3_key: str) -> bool:
         """
         Delete a file from the data lake.
@@ -121,6 +168,18 @@ class DataLakeInterface:
         """
         return self.data_lake.delete_file(s3_key)
     
+    def bulk_delete(self, keys: List[str]) -> Dict[str, bool]:
+        """
+        Delete several files from the data lake with batched DeleteObjects requests.
+        
+        Args:
+            keys (List[str]): Full S3 keys of the files to delete
+        
+        Returns:
+            Dict[str, bool]: Mapping of each key to True if its deletion was successful
+        """
+        return self.data_lake.delete_files(keys)
+    
     def move_file(self, source_key: str, target_zone: str, target_path: Optional[str] = None) -> bool:
         """
         Move a file from one zone to another in the data lake.
@@ -135,6 +194,19 @@ class DataLakeInterface:
         """
         return self.data_lake.move_file(source_key, target_zone, target_path)
     
+    def move_files(self, moves: List[Tuple[str, str, Optional[str]]]) -> Dict[str, bool]:
+        """
+        Move several files between zones in the data lake.
+        
+        Args:
+            moves (List[Tuple[str, str, Optional[str]]]): List of (source_key, target_zone, target_path)
+                                                          tuples. target_path may be None.
+        
+        Returns:
+            Dict[str, bool]: Mapping of each source key to True if its move was successful
+        """
+        return self.data_lake.move_files(moves)
+    
     def get_file_metadata(self, s3_key: str) -> Optional[Dict[str, Any]]:
         """
         Get metadata for a file in the data lake.
@@ -173,7 +245,9 @@ class DataLakeInterface:
         return self.file_utils.download_and_parse(s3_key)
     
     def save_and_upload(self, content: Any, file_name: str, zone: str = 'processed',
-                        s3_path: Optional[str] = None, metadata: Optional[Dict[str, str]] = None) -> Optional[str]:
+                        s3_path: Optional[str] = None, metadata: Optional[Dict[str, str]] = None,
+                        presign: bool = False, expiration: int = 3600
+                        ) -> Union[Optional[str], Tuple[Optional[str], Optional[str]]]:
         """
         Save content to a file and upload it to the data lake.
         
@@ -183,112 +257,282 @@ class DataLakeInterface:
             zone (str, optional): Data lake zone. Defaults to 'processed'.
             s3_path (str, optional): Custom path in S3. Defaults to file_name.
             metadata (dict, optional): Metadata for the file. Defaults to None.
+            presign (bool, optional): Also return a presigned URL so consumers can read the
+                                      file straight from S3. Defaults to False.
+            expiration (int, optional): Presigned URL lifetime in seconds. Defaults to 3600 (1 hour).
         
         Returns:
-            str: S3 key of the uploaded file or None if error
+            str: S3 key of the uploaded file or None if error,
+                 or a (s3_key, presigned_url) tuple if presign is True
         """
-        return self.file_utils.save_and_upload(content, file_name, zone, s3_path, metadata)
+        s3_key = self.file_utils.save_and_upload(content, file_name, zone, s3_path, metadata)
+        if not presign:
+            return s3_key
+        
+        return s3_key, self.get_presigned_url(s3_key, expiration) if s3_key else None
     
-    def process_data_pipeline(self, input_files: List[str], process_funcs: List[Callable]) -> List[str]:
+    def process_data_pipeline(self, input_files: List[str], process_funcs: List[Callable],
+                              checkpoint_every: Optional[int] = 1) -> List[str]:
         """
         Process data through a pipeline of functions and store results in the data lake.
+        Content is handed from step to step in memory; only checkpoint steps and the
+        final step are uploaded.
         
         Args:
             input_files (List[str]): List of local file paths or S3 keys to process
             process_funcs (List[callable]): List of processing functions to apply sequentially
+            checkpoint_every (int, optional): Upload the result of every n-th step. None or 0
+                                              uploads only the final step. Defaults to 1 (every step).
         
         Returns:
             List[str]: List of S3 keys for the final processed files
         """
         results = []
         
-        for input_file in input_files:
-            try:
-                current_content = None
-                current_zone = 'raw'
-                current_path = None
-                
-                # Check if the input is a local file or an S3 key
-                if os.path.exists(input_file):
-                    # If local file, upload to raw zone first
-                    filename = os.path.basename(input_file)
-                    s3_key = self.upload_file(input_file, zone='raw')
-                    if not s3_key:
-                        logger.error(f"Failed to upload {input_file} to raw zone")
+        with ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS) as uploader:
+            for input_file in input_files:
+                try:
+                    # Check if the input is a local file or an S3 key
+                    is_local = self._is_local_input(input_file)
+                    current_zone, current_path = self._input_location(input_file, is_local)
+                    
+                    raw_upload = None
+                    if is_local:
+                        # If local file, upload to raw zone in the background
+                        # and parse the local copy instead of downloading it again
+                        raw_upload = uploader.submit(self.upload_file, input_file, 'raw')
+                        current_content, mime_type = self.file_utils.parse_local(input_file)
+                    else:
+                        # If it's an S3 key, parse it directly
+                        current_content, mime_type = self.parse_file(input_file)
+                    
+                    if current_content is None:
+                        logger.error("Failed to parse %s", input_file)
                         continue
                     
-                    # Parse the uploaded file
-                    current_content, mime_type = self.parse_file(s3_key)
-                    current_path = filename
+                    # Apply processing functions sequentially
+                    for step in self._pipeline_steps(input_file, process_funcs, checkpoint_every):
+                        try:
+                            processed_content = step.process_func(current_content)
+                            
+                            # Save the processed content and upload to the target zone
+                            # if this step is a checkpoint
+                            if step.zone is not None:
+                                if not self.save_and_upload(processed_content, step.file_name,
+                                                            step.zone, metadata=step.metadata):
+                                    logger.error("Failed to save processed file for %s at step %d",
+                                                 input_file, step.number)
+                                    break
+                                current_zone, current_path = step.zone, step.file_name
+                            
+                            # Update for next step in the pipeline
+                            current_content = processed_content
+                            
+                        except Exception as e:
+                            logger.error("Error processing %s at step %d: %s", input_file, step.number, e)
+                            break
                     
-                else:
-                    # If it's an S3 key, parse it directly
-                    current_content, mime_type = self.parse_file(input_file)
-                    current_path = os.path.basename(input_file)
+                    if raw_upload is not None and not raw_upload.result():
+                        logger.error("Failed to upload %s to raw zone", input_file)
+                        continue
                     
-                    # Determine the zone from the S3 key
-                    parts = input_file.split('/')
-                    if len(parts) > 1:
-                        current_zone = parts[0]
-                
-                if current_content is None:
-                    logger.error(f"Failed to parse {input_file}")
-                    continue
-                
-                # Apply processing functions sequentially
-                for i, process_func in enumerate(process_funcs):
-                    # Determine target zone based on processing step
-                    if i == 0:
-                        target_zone = 'processed'
-                    elif i == len(process_funcs) - 1:
-                        target_zone = 'curated'
-                    else:
-                        target_zone = 'enriched'
+                    # Add the last uploaded file to results if processing completed
+                    result = self._pipeline_result(current_zone, current_path)
+                    if result:
+                        results.append(result)
                     
-                    # Apply the processing function
+                except Exception as e:
+                    logger.error("Error in data pipeline for %s: %s", input_file, e)
+            
+        return results
+    
+    async def process_data_pipeline_async(self, input_files: List[str], process_funcs: List[Callable],
+                                          checkpoint_every: Optional[int] = 1,
+                                          max_concurrency: int = DEFAULT_MAX_WORKERS) -> List[str]:
+        """
+        Process data through a pipeline of functions on an asyncio event loop.
+        Behaves like process_data_pipeline, but runs the inputs concurrently and does
+        its S3 I/O with one aioboto3 client. Parsing, saving and the processing
+        functions run in worker threads. Requires the optional aioboto3 package.
+        
+        Args:
+            input_files (List[str]): List of local file paths or S3 keys to process
+            process_funcs (List[callable]): List of processing functions to apply sequentially
+            checkpoint_every (int, optional): Upload the result of every n-th step. None or 0
+                                              uploads only the final step. Defaults to 1 (every step).
+            max_concurrency (int, optional): Maximum number of inputs processed at once.
+                                             Defaults to DEFAULT_MAX_WORKERS.
+        
+        Returns:
+            List[str]: List of S3 keys for the final processed files, in input order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async with self.data_lake.async_client() as client:
+            async def run(input_file):
+                async with semaphore:
                     try:
-                        processed_content = process_func(current_content)
-                        
-                        # Generate a unique filename for the processed file
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        name_parts = os.path.splitext(current_path)
-                        processed_file_name = f"{name_parts[0]}_{i+1}_{timestamp}{name_parts[1]}"
-                        
-                        # Save the processed content and upload to the target zone
-                        s3_key = self.save_and_upload(
+                        return await self._process_input_async(client, input_file, process_funcs, checkpoint_every)
+                    except Exception as e:
+                        logger.error("Error in data pipeline for %s: %s", input_file, e)
+                        return None
+            
+            results = await asyncio.gather(*(run(input_file) for input_file in input_files))
+        
+        return [s3_key for s3_key in results if s3_key]
+    
+    async def _process_input_async(self, client, input_file: str, process_funcs: List[Callable],
+                                   checkpoint_every: Optional[int]) -> Optional[str]:
+        """Run one input through the pipeline; returns the last uploaded key if it counts as a result."""
+        is_local = self._is_local_input(input_file)
+        current_zone, current_path = self._input_location(input_file, is_local)
+        
+        raw_upload = None
+        try:
+            if is_local:
+                # Upload to the raw zone in the background and parse the local copy
+                metadata = self.file_utils.extract_metadata_fast(input_file)
+                raw_upload = asyncio.ensure_future(
+                    self.file_utils.upload_async(client, input_file, f"raw/{current_path}", metadata))
+                current_content, _ = await asyncio.to_thread(self.file_utils.parse_local, input_file)
+            else:
+                current_content = await self._parse_s3_async(client, input_file)
+            
+            if current_content is None:
+                logger.error("Failed to parse %s", input_file)
+                if raw_upload is not None:
+                    await raw_upload
+                return None
+            
+            for step in self._pipeline_steps(input_file, process_funcs, checkpoint_every):
+                try:
+                    processed_content = await asyncio.to_thread(step.process_func, current_content)
+                    
+                    if step.zone is not None:
+                        saved = await self.file_utils.save_and_upload_async(
+                            client,
                             processed_content,
-                            processed_file_name,
-                            target_zone,
-                            metadata={
-                                'original_file': input_file,
-                                'processing_step': f"step_{i+1}",
-                                'processor': process_func.__name__ if hasattr(process_func, '__name__') else 'unknown'
-                            }
+                            step.file_name,
+                            f"{step.zone}/{step.file_name}",
+                            step.metadata
                         )
                         
-                        if s3_key:
-                            # Update for next step in the pipeline
-                            current_content = processed_content
-                            current_zone = target_zone
-                            current_path = processed_file_name
-                        else:
-                            logger.error(f"Failed to save processed file for {input_file} at step {i+1}")
+                        if not saved:
+                            logger.error("Failed to save processed file for %s at step %d",
+                                         input_file, step.number)
                             break
-                        
-                    except Exception as e:
-                        logger.error(f"Error processing {input_file} at step {i+1}: {str(e)}")
-                        break
-                
-                # Add the final processed file to results if processing completed
-                if current_zone == 'curated' or current_zone == 'enriched':
-                    results.append(f"{current_zone}/{current_path}")
+                        current_zone, current_path = step.zone, step.file_name
+                    
+                    current_content = processed_content
                 
-            except Exception as e:
-                logger.error(f"Error in data pipeline for {input_file}: {str(e)}")
+                except Exception as e:
+                    logger.error("Error processing %s at step %d: %s", input_file, step.number, e)
+                    break
+            
+            if raw_upload is not None and not await raw_upload:
+                logger.error("Failed to upload %s to raw zone", input_file)
+                return None
+            
+            return self._pipeline_result(current_zone, current_path)
+        
+        finally:
+            # On errors the raw upload may still be running; cancel it and collect
+            # its outcome so it does not outlive the input
+            if raw_upload is not None and not raw_upload.done():
+                raw_upload.cancel()
+                await asyncio.gather(raw_upload, return_exceptions=True)
+    
+    async def _parse_s3_async(self, client, s3_key: str) -> Any:
+        """Download an object with the async client and parse it; returns None on error."""
+        try:
+            response = await client.get_object(Bucket=self._bucket_name, Key=s3_key)
+            async with response['Body'] as stream:
+                body = await stream.read()
+        except ClientError as e:
+            logger.error("Error downloading file: %s", e)
+            return None
         
-        return results
+        # Parsers dispatch on the extension, so keep the original name as the suffix.
+        # The file is closed before it is parsed, as Windows cannot open it twice.
+        fd, temp_path = tempfile.mkstemp(suffix=f"_{os.path.basename(s3_key)}", dir=self.file_utils.temp_dir)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(body)
+            content, _ = await asyncio.to_thread(self.file_utils.parse_local, temp_path)
+        finally:
+            os.remove(temp_path)
+        return content
+    
+    def _pipeline_steps(self, input_file: str, process_funcs: List[Callable],
+                        checkpoint_every: Optional[int]) -> Iterator[PipelineStep]:
+        """
+        Plan the steps of one pipeline input, shared by the sync and async pipelines.
+        Output names are stamped when the first step is planned, after the input was parsed.
+        """
+        # Processed files are named after the input, stamped once per input
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        stem, ext = os.path.splitext(os.path.basename(input_file))
+        steps = len(process_funcs)
+        
+        for i, process_func in enumerate(process_funcs):
+            stem = f"{stem}_{i+1}_{timestamp}"
+            if self._is_checkpoint(i, steps, checkpoint_every):
+                yield PipelineStep(i + 1, process_func, f"{stem}{ext}", self._step_zone(i, steps),
+                                   self._step_metadata(input_file, i, process_func))
+            else:
+                yield PipelineStep(i + 1, process_func, None, None, None)
+    
+    @staticmethod
+    def _input_location(input_file: str, is_local: bool) -> Tuple[str, str]:
+        """Zone and file name a pipeline input starts from: an S3 key's zone, else raw."""
+        zone, sep, _ = input_file.partition('/')
+        if sep and not is_local:
+            return zone, os.path.basename(input_file)
+        return 'raw', os.path.basename(input_file)
+    
+    @staticmethod
+    def _pipeline_result(zone: str, file_name: str) -> Optional[str]:
+        """S3 key a pipeline input reports, if its last upload went to a result zone."""
+        if zone == 'curated' or zone == 'enriched':
+            return f"{zone}/{file_name}"
+        return None
+    
+    @staticmethod
+    def _step_zone(step: int, steps: int) -> str:
+        """Zone a pipeline step writes to: processed first, curated last, enriched in between."""
+        if step == 0:
+            return 'processed'
+        if step == steps - 1:
+            return 'curated'
+        return 'enriched'
+    
+    @staticmethod
+    def _is_checkpoint(step: int, steps: int, checkpoint_every: Optional[int]) -> bool:
+        """Whether a pipeline step's result is uploaded."""
+        return step == steps - 1 or bool(checkpoint_every and (step + 1) % checkpoint_every == 0)
+    
+    @staticmethod
+    def _step_metadata(input_file: str, step: int, process_func: Callable) -> Dict[str, str]:
+        """S3 metadata recorded on the output of a pipeline step."""
+        return {
+            'original_file': input_file,
+            'processing_step': f"step_{step+1}",
+            'processor': process_func.__name__ if hasattr(process_func, '__name__') else 'unknown'
+        }
+    
+    @staticmethod
+    def _is_local_input(input_file: str) -> bool:
+        """Tell whether a pipeline input names a local file rather than an S3 key."""
+        if '://' in input_file:
+            return False
+        if os.path.isabs(input_file) or input_file.startswith(('./', '../')):
+            return True
+        # Bare relative names such as "raw/data.csv" could be either
+        return os.path.exists(input_file)
     
-    def bulk_upload(self, directory: str, zone: str = 'raw', recursive: bool = True) -> List[str]:
+    def bulk_upload(self, directory: str, zone: str = 'raw', recursive: bool = True,
+                    max_workers: int = DEFAULT_MAX_WORKERS, skip_unchanged: bool = False,
+                    cache_path: Optional[str] = None) -> List[str]:
         """
         Upload all files in a directory to the data lake.
         
@@ -296,41 +540,99 @@ class DataLakeInterface:
             directory (str): Path to the local directory
             zone (str, optional): Data lake zone. Defaults to 'raw'.
             recursive (bool, optional): Whether to upload files recursively. Defaults to True.
+            max_workers (int, optional): Number of concurrent uploads. Defaults to DEFAULT_MAX_WORKERS.
+            skip_unchanged (bool, optional): Skip files whose S3 object already has the same
+                                             content, checked by ETag. Defaults to False.
+            cache_path (str, optional): Upload cache database used with skip_unchanged.
+                                        Defaults to the UploadCache default path.
         
         Returns:
-            List[str]: List of S3 keys for the uploaded files
+            List[str]: List of S3 keys for the uploaded files, including skipped unchanged files
         """
         uploaded_files = []
+        upload_cache = UploadCache(cache_path) if skip_unchanged else None
+        transfer_config = self.data_lake.transfer_config
+        
+        def iter_files():
+            # scandir entries cache their type, so no extra stat per entry
+            pending = [directory]
+            while pending:
+                path = pending.pop()
+                try:
+                    entries = os.scandir(path)
+                except OSError as e:
+                    # Like os.walk, skip missing or unreadable directories
+                    logger.warning("Skipping directory %s: %s", path, e)
+                    continue
+                with entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            yield entry.path
+                        elif recursive and entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+        
+        def upload(file_path):
+            rel_path = os.path.relpath(file_path, directory)
+            s3_file_path = rel_path.replace('\\', '/') if '\\' in rel_path else rel_path
+            if upload_cache is None:
+                return self.upload_file(file_path, zone, s3_file_path)
+            
+            # Hash only files that changed since they were last recorded,
+            # then compare with the ETag of the object in S3
+            s3_key = f"{zone}/{s3_file_path}"
+            stat = os.stat(file_path)
+            etag = upload_cache.get_etag(file_path, s3_key, stat) or compute_etag(
+                file_path, transfer_config.multipart_threshold, transfer_config.multipart_chunksize)
+            
+            if self.data_lake.get_object_etag(s3_key) == etag:
+                upload_cache.put(file_path, s3_key, stat, etag)
+                logger.debug("Skipping unchanged %s", file_path)
+                return s3_key
+            
+            if not self.upload_file(file_path, zone, s3_file_path):
+                return None
+            upload_cache.put(file_path, s3_key, stat, etag)
+            return s3_key
         
-        # Collect all files
-        if recursive:
-            file_paths = []
-            for root, _, files in os.walk(directory):
-                for file in files:
-                    file_paths.append(os.path.join(root, file))
-        else:
-            file_paths = [os.path.join(directory, f) for f in os.listdir(directory) 
-                         if os.path.isfile(os.path.join(directory, f))]
-        
-        # Upload each file
-        for file_path in file_paths:
+        def collect(future):
+            file_path = futures.pop(future)
             try:
-                rel_path = os.path.relpath(file_path, directory)
-                s3_file_path = rel_path.replace('\\', '/') if '\\' in rel_path else rel_path
-                
-                s3_key = self.upload_file(file_path, zone, s3_file_path)
+                s3_key = future.result()
                 if s3_key:
                     uploaded_files.append(s3_key)
-                    logger.info(f"Uploaded {file_path} to {s3_key}")
+                    if log_each:
+                        logger.info("Uploaded %s to %s", file_path, s3_key)
                 else:
-                    logger.error(f"Failed to upload {file_path}")
+                    logger.error("Failed to upload %s", file_path)
             
             except Exception as e:
-                logger.error(f"Error uploading {file_path}: {str(e)}")
+                logger.error("Error uploading %s: %s", file_path, e)
+        
+        # Per-file progress logging is decided once for the whole batch
+        log_each = logger.isEnabledFor(logging.INFO)
+        
+        # Upload the files concurrently as the directory is walked,
+        # keeping at most 2 * max_workers uploads outstanding
+        futures = {}
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for file_path in iter_files():
+                    if len(futures) >= 2 * max_workers:
+                        done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            collect(future)
+                    futures[executor.submit(upload, file_path)] = file_path
+                
+                for future in as_completed(list(futures)):
+                    collect(future)
+        finally:
+            if upload_cache is not None:
+                upload_cache.close()
         
         return uploaded_files
     
-    def bulk_download(self, s3_prefix: str, local_directory: str, flatten: bool = False) -> int:
+    def bulk_download(self, s3_prefix: str, local_directory: str, flatten: bool = False,
+                      max_workers: int = DEFAULT_MAX_WORKERS) -> int:
         """
         Download all files with a prefix from the data lake.
         
@@ -338,6 +640,9 @@ class DataLakeInterface:
             s3_prefix (str): S3 prefix to filter files
             local_directory (str): Local directory to save files to
             flatten (bool, optional): Whether to flatten the directory structure. Defaults to False.
+            max_workers (int, optional): Number of concurrent downloads, capped at the
+                                         S3 client's connection pool size (aws.max_pool_connections).
+                                         Defaults to DEFAULT_MAX_WORKERS.
         
         Returns:
             int: Number of files downloaded
@@ -348,41 +653,72 @@ class DataLakeInterface:
             # Create the local directory if it doesn't exist
             os.makedirs(local_directory, exist_ok=True)
             
-            # List all files with the prefix
-            files = self.list_files(prefix=s3_prefix)
-            
-            # Download each file
-            for file_info in files:
-                s3_key = file_info['key']
-                
+            def local_path_for(s3_key):
                 if flatten:
                     # If flattening, use just the filename
-                    local_path = os.path.join(local_directory, os.path.basename(s3_key))
-                else:
-                    # Otherwise, maintain the directory structure (minus the prefix)
-                    relative_path = s3_key
-                    if s3_prefix:
-                        if s3_key.startswith(s3_prefix):
-                            relative_path = s3_key[len(s3_prefix):].lstrip('/')
+                    return os.path.join(local_directory, os.path.basename(s3_key))
+                
+                # Otherwise, maintain the directory structure (minus the prefix)
+                relative_path = s3_key
+                if s3_prefix:
+                    if s3_key.startswith(s3_prefix):
+                        relative_path = s3_key[len(s3_prefix):].lstrip('/')
+                
+                return os.path.join(local_directory, relative_path)
+            
+            def collect(future):
+                nonlocal count
+                s3_key, local_path = futures.pop(future)
+                try:
+                    if future.result():
+                        count += 1
+                        if log_each:
+                            logger.info("Downloaded %s to %s", s3_key, local_path)
+                    else:
+                        logger.error("Failed to download %s", s3_key)
+                
+                except Exception as e:
+                    logger.error("Error downloading %s: %s", s3_key, e)
+            
+            # Per-file progress logging is decided once for the whole batch
+            log_each = logger.isEnabledFor(logging.INFO)
+            
+            # Download files concurrently as listing pages arrive,
+            # keeping at most 2 * workers downloads outstanding
+            workers = min(max_workers, self.data_lake.max_pool_connections)
+            futures = {}
+            created_dirs = {local_directory}
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for file_info in self.iter_files(prefix=s3_prefix):
+                    s3_key = file_info['key']
+                    local_path = local_path_for(s3_key)
                     
-                    local_path = os.path.join(local_directory, relative_path)
-                    os.makedirs(os.path.dirname(local_path), exist_ok=True)
+                    # Create each local directory only once, so the workers can skip it
+                    directory = os.path.dirname(local_path)
+                    if directory not in created_dirs:
+                        os.makedirs(directory, exist_ok=True)
+                        created_dirs.add(directory)
+                    
+                    if len(futures) >= 2 * workers:
+                        done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            collect(future)
+                    futures[executor.submit(self.download_file, s3_key, local_path, False)] = (s3_key, local_path)
                 
-                if self.download_file(s3_key, local_path):
-                    count += 1
-                    logger.info(f"Downloaded {s3_key} to {local_path}")
-                else:
-                    logger.error(f"Failed to download {s3_key}")
+                for future in as_completed(list(futures)):
+                    collect(future)
             
             return count
             
         except Exception as e:
-            logger.error(f"Error in bulk download: {str(e)}")
+            logger.error("Error in bulk download: %s", e)
             return count
     
     def search_files_by_metadata(self, metadata_filters: Dict[str, str], zone: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Search for files by metadata in the data lake.
+        Metadata is read from the per-zone sidecar indexes, so only new or
+        changed files need a HEAD request.
         
         Args:
             metadata_filters (Dict[str, str]): Key-value pairs to match in metadata
@@ -391,32 +727,38 @@ class DataLakeInterface:
         Returns:
             List[Dict[str, Any]]: List of matching file information dictionaries
         """
-        results = []
-        
         try:
-            # List all files
-            files = self.list_files(zone=zone)
+            # List all files and group them by zone; listing order keeps each zone contiguous
+            files_by_zone = {}
+            for file_info in self.iter_files(zone=zone):
+                files_by_zone.setdefault(file_info['zone'], []).append(file_info)
             
-            # Check each file's metadata
-            for file_info in files:
-                s3_key = file_info['key']
-                metadata = self.get_file_metadata(s3_key)
-                
-                if metadata and 'metadata' in metadata:
-                    # Check if all filters match
-                    matches = True
-                    for key, value in metadata_filters.items():
-                        if key not in metadata['metadata'] or metadata['metadata'][key] != value:
-                            matches = False
-                            break
-                    
-                    if matches:
-                        results.append(file_info)
+            # Read metadata from each zone's index; HEAD files outside the zones
+            metadata = {}
+            unindexed = []
+            for file_zone, zone_files in files_by_zone.items():
+                if file_zone in self.data_lake.zones:
+                    metadata.update(self.data_lake.get_metadata_index(file_zone, zone_files))
+                else:
+                    unindexed.extend(file_info['key'] for file_info in zone_files)
+            
+            if unindexed:
+                with ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS) as executor:
+                    for key, file_metadata in zip(unindexed, executor.map(self.get_file_metadata, unindexed)):
+                        if file_metadata and 'metadata' in file_metadata:
+                            metadata[key] = file_metadata['metadata']
             
-            return results
+            # Keep the files whose metadata matches all filters
+            filters = metadata_filters.items()
+            return [
+                file_info
+                for zone_files in files_by_zone.values()
+                for file_info in zone_files
+                if file_info['key'] in metadata and filters <= metadata[file_info['key']].items()
+            ]
             
         except Exception as e:
-            logger.error(f"Error searching files by metadata: {str(e)}")
+            logger.error("Error searching files by metadata: %s", e)
             return []
     
     def get_presigned_url(self, s3_key: str, expiration: int = 3600) -> Optional[str]:
@@ -7,18 +7,134 @@ like CSV, JSON, YAML, Excel, PDF, etc. when working with the data lake.
 
 import os
 import io
+import asyncio
 import json
 import csv
+import contextlib
 import logging
+import functools
+import tempfile
+import threading
+import zipfile
+import xml.etree.ElementTree as ElementTree
+from types import MappingProxyType
+import numpy as np
 import pandas as pd
 import yaml
-from pathlib import Path
-from typing import Dict, List, Union, Any, Optional, Tuple
+from typing import Dict, List, Union, Any, Optional, Tuple, BinaryIO, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from botocore.exceptions import ClientError
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+try:
+    import magic
+except ImportError:
+    magic = None
+
+try:
+    import pyarrow
+    from pyarrow import csv as pacsv
+except ImportError:
+    pyarrow = None
+    pacsv = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    # Picks the fastest available backend, e.g. the yajl2_c C extension
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import python_calamine
+except ImportError:
+    python_calamine = None
+
+# Handlers and levels are left to the application
 logger = logging.getLogger(__name__)
 
+# Bytes read from the start of a file to sniff its MIME type
+MAGIC_SNIFF_SIZE = 4096
+
+# Map of extensions to MIME types
+_CONTENT_TYPES = MappingProxyType({
+    '.csv': 'text/csv',
+    '.tsv': 'text/tab-separated-values',
+    '.json': 'application/json',
+    '.yaml': 'application/yaml',
+    '.yml': 'application/yaml',
+    '.xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    '.xls': 'application/vnd.ms-excel',
+    '.txt': 'text/plain',
+    '.pdf': 'application/pdf',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    '.doc': 'application/msword',
+    '.pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
+    '.ppt': 'application/vnd.ms-powerpoint',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.mp3': 'audio/mpeg',
+    '.mp4': 'video/mp4',
+    '.wav': 'audio/wav',
+    '.html': 'text/html',
+    '.htm': 'text/html',
+    '.xml': 'application/xml',
+    '.zip': 'application/zip'
+})
+
+# libyaml's C loader and dumper when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+# Serialized outputs larger than this spill from memory to a temporary file before upload
+SPOOL_MAX_SIZE = 256 * 1024 * 1024
+
+# Parsed JSON object and array types, including simdjson's lazy proxies when available
+JSON_OBJECT_TYPES = (dict, simdjson.Object) if simdjson is not None else (dict,)
+JSON_ARRAY_TYPES = (list, simdjson.Array) if simdjson is not None else (list,)
+
+# JSON files larger than this are streamed when a json_path is given
+JSON_STREAM_THRESHOLD = 128 * 1024 * 1024
+
+# Files batch_process_files_async processes at once
+ASYNC_MAX_CONCURRENCY = 64
+
+# Sheet element of an XLSX workbook.xml part
+XLSX_SHEET_TAG = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}sheet'
+
+# pandas read_csv options: the multithreaded Arrow parser and Arrow-backed columns when available
+CSV_READ_OPTIONS = {'engine': 'pyarrow', 'dtype_backend': 'pyarrow'} if pyarrow is not None else {}
+
+# Bytes per block handed to each of pyarrow's CSV parsing threads
+CSV_BLOCK_SIZE = 8 * 1024 * 1024
+
+# pandas read_excel engine: the native calamine reader when available, else the pandas default
+EXCEL_ENGINE = 'calamine' if python_calamine is not None else None
+
+# pandas to_excel engine; XLSX is the only format written
+EXCEL_WRITE_ENGINE = 'openpyxl'
+
+
+@functools.lru_cache(maxsize=4096)
+def _file_extension(file_path: str) -> str:
+    """Lowercase extension of a path, as os.path.splitext returns it, cached per path."""
+    name = file_path[max(file_path.rfind('/'), file_path.rfind(os.sep)) + 1:]
+    dot = name.rfind('.')
+    if dot <= 0 or not name[:dot].strip('.'):
+        return ''
+    return name[dot:].lower()
+
+
 class S3FileUtils:
     """
     Utilities for working with different file types in the S3 data lake.
@@ -27,16 +143,80 @@ class S3FileUtils:
     YAML, Excel, PDF, etc. when working with the data lake.
     """
     
-    def __init__(self, s3_data_lake):
+    def __init__(self, s3_data_lake, spool_max_size: int = SPOOL_MAX_SIZE):
         """
         Initialize the file utilities with a reference to the S3 data lake.
         
         Args:
             s3_data_lake: Instance of S3DataLake class
+            spool_max_size: Size in bytes up to which save_and_upload keeps serialized
+                            content in memory. Defaults to SPOOL_MAX_SIZE (256 MiB).
         """
         self.s3_data_lake = s3_data_lake
+        self.spool_max_size = spool_max_size
         self.temp_dir = os.path.join(os.getcwd(), 'temp')
         os.makedirs(self.temp_dir, exist_ok=True)
+        
+        # Per-thread parser state, e.g. reusable simdjson parsers
+        self._local = threading.local()
+        
+        # Fast metadata keyed on (path, mtime_ns, size), so changed files are re-read
+        self._fast_metadata = functools.lru_cache(maxsize=1024)(self._read_fast_metadata)
+        
+        # Extension -> (parser, MIME type); a parser takes a path or a binary buffer
+        excel_mime = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+        self._parsers = {
+            '.csv': (self._parse_csv, 'text/csv'),
+            '.tsv': (functools.partial(self._parse_csv, delimiter='\t'), 'text/csv'),
+            '.json': (self._parse_json, 'application/json'),
+            '.yaml': (self._parse_yaml, 'application/yaml'),
+            '.yml': (self._parse_yaml, 'application/yaml'),
+            '.xlsx': (self._parse_excel, excel_mime),
+            '.xls': (self._parse_excel, excel_mime),
+            '.txt': (self._parse_text, 'text/plain'),
+            # This would require additional libraries like PyPDF2 or pdfplumber
+            '.pdf': (None, 'application/pdf')
+        }
+        
+        # Extension -> saver; a saver takes the content and a path or a binary buffer.
+        # There is no .xls saver: pandas can no longer write the legacy format, and
+        # writing XLSX bytes under that name would mislabel the file.
+        self._savers = {
+            '.csv': self._save_csv,
+            '.tsv': functools.partial(self._save_csv, sep='\t'),
+            '.json': self._save_json,
+            '.yaml': self._save_yaml,
+            '.yml': self._save_yaml,
+            '.xlsx': self._save_excel,
+            '.txt': self._save_text
+        }
+    
+    def register_parser(self, ext: str, parser: Optional[Callable[[Union[str, BinaryIO]], Any]],
+                        mime_type: str) -> None:
+        """
+        Register the parser for a file extension, replacing any existing one.
+        
+        Args:
+            ext: File extension including the dot, e.g. '.parquet'
+            parser: Function taking a file path or binary buffer and returning the parsed
+                    content, or None to declare the MIME type without a parser
+            mime_type: MIME type reported for parsed files
+        """
+        self._parsers[ext.lower()] = (parser, mime_type)
+    
+    def register_saver(self, ext: str, saver: Callable[[Any, Union[str, BinaryIO]], None]) -> None:
+        """
+        Register the saver for a file extension, replacing any existing one.
+        
+        Args:
+            ext: File extension including the dot, e.g. '.parquet'
+            saver: Function taking the content and a file path or writable binary buffer
+        """
+        self._savers[ext.lower()] = saver
+    
+    def _get_parser(self, ext: str) -> Optional[Callable]:
+        """Get the parser for an extension, or None if there is none."""
+        return self._parsers.get(ext, (None, None))[0]
     
     def _get_file_extension(self, file_path: str) -> str:
         """
@@ -48,156 +228,393 @@ class S3FileUtils:
         Returns:
             str: File extension (lowercase) including the dot
         """
-        return os.path.splitext(file_path)[1].lower()
+        return _file_extension(file_path)
     
     def download_and_parse(self, s3_key: str, local_dir: Optional[str] = None) -> Tuple[Any, Optional[str]]:
         """
         Download a file from S3 and parse it based on its extension.
+        The file is downloaded into memory unless local_dir is given, in which case
+        it is saved there and kept.
         
         Args:
             s3_key (str): Full S3 key of the file
-            local_dir (str, optional): Local directory to save the file to. Defaults to self.temp_dir.
+            local_dir (str, optional): Local directory to save the file to. Defaults to None.
         
         Returns:
             tuple: (parsed_content, mime_type) or (None, None) if error
         """
-        if local_dir is None:
-            local_dir = self.temp_dir
-            
         try:
-            # Create temp directory if it doesn't exist
-            os.makedirs(local_dir, exist_ok=True)
+            ext = self._get_file_extension(s3_key)
+            
+            # Don't download files there is no parser for
+            if self._get_parser(ext) is None:
+                return self._parse_source(None, ext)
+            
+            if local_dir is None:
+                buffer = self.s3_data_lake.download_bytes(s3_key)
+                if buffer is None:
+                    return None, None
+                return self._parse_source(buffer, ext)
             
             # Generate local path
             local_path = os.path.join(local_dir, os.path.basename(s3_key))
             
-            # Download the file
+            # Download the file; download_file creates the directory if needed
             if not self.s3_data_lake.download_file(s3_key, local_path):
                 return None, None
             
-            # Parse the file based on extension
-            ext = self._get_file_extension(local_path)
-            
-            if ext in ['.csv', '.tsv']:
-                content = self._parse_csv(local_path)
-                mime_type = 'text/csv'
-            elif ext == '.json':
-                content = self._parse_json(local_path)
-                mime_type = 'application/json'
-            elif ext in ['.yaml', '.yml']:
-                content = self._parse_yaml(local_path)
-                mime_type = 'application/yaml'
-            elif ext in ['.xlsx', '.xls']:
-                content = self._parse_excel(local_path)
-                mime_type = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-            elif ext == '.txt':
-                content = self._parse_text(local_path)
-                mime_type = 'text/plain'
-            elif ext == '.pdf':
-                # This would require additional libraries like PyPDF2 or pdfplumber
-                content = None
-                mime_type = 'application/pdf'
-                logger.warning("PDF parsing not implemented. Install additional libraries for PDF support.")
-            else:
-                content = None
-                mime_type = 'application/octet-stream'
-                logger.warning(f"No parser implemented for extension {ext}")
-            
-            # Clean up - remove the temporary file
-            os.remove(local_path)
-            
-            return content, mime_type
+            return self._parse_source(local_path, ext)
         
         except Exception as e:
-            logger.error(f"Error parsing file {s3_key}: {str(e)}")
+            logger.error("Error parsing file %s: %s", s3_key, e)
             return None, None
     
-    def _parse_csv(self, file_path: str) -> List[Dict[str, Any]]:
+    def parse_local(self, file_path: str) -> Tuple[Any, Optional[str]]:
+        """
+        Parse a local file based on its extension.
+        
+        Args:
+            file_path (str): Path to the local file
+        
+        Returns:
+            tuple: (parsed_content, mime_type) or (None, None) if error
+        """
+        try:
+            return self._parse_source(file_path, self._get_file_extension(file_path))
+        
+        except Exception as e:
+            logger.error("Error parsing file %s: %s", file_path, e)
+            return None, None
+    
+    def _parse_source(self, source: Union[str, BinaryIO, None], ext: str) -> Tuple[Any, Optional[str]]:
+        """
+        Parse a file path or binary buffer with the parser for an extension.
+        
+        Args:
+            source: Path to the file or a binary buffer with its content
+            ext: File extension (lowercase) including the dot
+        
+        Returns:
+            tuple: (parsed_content, mime_type)
+        """
+        parser, mime_type = self._parsers.get(ext, (None, 'application/octet-stream'))
+        if parser is None:
+            logger.warning("No parser implemented for extension %s", ext)
+            return None, mime_type
+        
+        return parser(source), mime_type
+    
+    def _parse_csv(self, file_path: Union[str, BinaryIO], columns: Optional[List[str]] = None,
+                   dtypes: Optional[Dict[str, Any]] = None,
+                   schema_hint: Optional[Dict[str, Any]] = None,
+                   delimiter: str = ',') -> pd.DataFrame:
         """
         Parse CSV file.
+        The data stays columnar; use to_records where a list of dictionaries is needed.
         
         Args:
-            file_path: Path to the CSV file
+            file_path: Path to the CSV file or a binary buffer with its content
+            columns: Only parse these columns. Defaults to all columns.
+            dtypes: Column name -> dtype mapping, skipping type inference for those columns
+            schema_hint: Column name -> numeric dtype mapping for files known to hold only
+                         numbers in those columns. They are loaded with the numeric fast path;
+                         if that fails the file is parsed normally.
+            delimiter: Field delimiter. Defaults to ','.
             
         Returns:
-            List[Dict[str, Any]]: List of records as dictionaries
+            pd.DataFrame: Parsed table
         """
+        if schema_hint:
+            try:
+                return self._parse_csv_numeric(file_path, schema_hint, delimiter)
+            except (ValueError, KeyError) as e:
+                logger.warning("Numeric schema does not fit %s, parsing normally: %s", file_path, e)
+                self._rewind(file_path)
+        
+        options = dict(CSV_READ_OPTIONS, usecols=columns, dtype=dtypes, sep=delimiter)
         try:
-            return pd.read_csv(file_path).to_dict('records')
+            if pacsv is not None and not dtypes:
+                return self._parse_csv_arrow(file_path, columns, delimiter)
+            return pd.read_csv(file_path, **options)
         except Exception:
             # Try with different encodings and delimiters if the default fails
             try:
-                return pd.read_csv(file_path, encoding='latin1').to_dict('records')
+                self._rewind(file_path)
+                return pd.read_csv(file_path, encoding='latin1', **options)
             except Exception as e:
-                logger.error(f"Error parsing CSV {file_path}: {str(e)}")
+                logger.error("Error parsing CSV %s: %s", file_path, e)
                 
                 # Fall back to simple csv reader
-                with open(file_path, 'r', newline='', encoding='utf-8-sig') as f:
-                    reader = csv.DictReader(f)
-                    return list(reader)
+                self._rewind(file_path)
+                with self._open_text(file_path, encoding='utf-8-sig', newline='') as f:
+                    reader = csv.DictReader(f, delimiter=delimiter)
+                    df = pd.DataFrame(list(reader))
+                return df[columns] if columns else df
     
-    def _parse_json(self, file_path: str) -> Any:
+    @staticmethod
+    def _parse_csv_arrow(file_path: Union[str, BinaryIO], columns: Optional[List[str]],
+                         delimiter: str) -> pd.DataFrame:
+        """
+        Parse a CSV file with pyarrow's multithreaded block parser.
+        
+        Args:
+            file_path: Path to the CSV file or a binary buffer with its content
+            columns: Only parse these columns, or None for all columns
+            delimiter: Field delimiter
+            
+        Returns:
+            pd.DataFrame: Parsed table with Arrow-backed columns
+        """
+        table = pacsv.read_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE),
+            parse_options=pacsv.ParseOptions(delimiter=delimiter),
+            convert_options=pacsv.ConvertOptions(include_columns=columns) if columns else None
+        )
+        # Convert column by column, freeing each Arrow buffer once pandas owns the data
+        return table.to_pandas(split_blocks=True, self_destruct=True, types_mapper=pd.ArrowDtype)
+    
+    def _parse_csv_numeric(self, file_path: Union[str, BinaryIO], schema: Dict[str, Any],
+                           delimiter: str = ',') -> pd.DataFrame:
+        """
+        Parse the numeric columns of a CSV file straight into typed NumPy arrays.
+        numpy.loadtxt tokenizes and converts in C, skipping pandas' type inference and
+        per-value Python objects.
+        
+        Args:
+            file_path: Path to the CSV file or a binary buffer with its content
+            schema: Column name -> numeric dtype mapping of the columns to load
+            delimiter: Field delimiter. Defaults to ','.
+            
+        Returns:
+            pd.DataFrame: Table with the schema's columns
+            
+        Raises:
+            KeyError: If a schema column is missing from the header
+            ValueError: If a value cannot be converted to its column's dtype
+        """
+        # Read the buffer directly so it stays open for the fallback parser
+        f = open(file_path, 'rb') if isinstance(file_path, str) else file_path
+        try:
+            header = next(csv.reader([f.readline().decode('utf-8-sig')], delimiter=delimiter), [])
+            positions = {name: i for i, name in enumerate(header)}
+            names = list(schema)
+            data = np.loadtxt(
+                f,
+                delimiter=delimiter,
+                usecols=[positions[name] for name in names],
+                dtype=[(name, schema[name]) for name in names],
+                encoding='utf-8',
+                ndmin=1
+            )
+        finally:
+            if f is not file_path:
+                f.close()
+        
+        return pd.DataFrame({name: data[name] for name in names})
+    
+    @staticmethod
+    def to_records(content: Any) -> Any:
+        """
+        Convert parsed tabular content to lists of records.
+        
+        Args:
+            content: Parsed content, e.g. a DataFrame from a CSV file or the
+                     sheet name -> DataFrame dictionary from an Excel file
+            
+        Returns:
+            Any: List of dictionaries for a DataFrame, a dictionary of such lists for
+                 a dictionary of DataFrames, otherwise the content unchanged
+        """
+        if isinstance(content, pd.DataFrame):
+            return content.to_dict('records')
+        if isinstance(content, dict) and content and all(isinstance(v, pd.DataFrame) for v in content.values()):
+            return {name: df.to_dict('records') for name, df in content.items()}
+        return content
+    
+    def _parse_json(self, file_path: Union[str, BinaryIO], columns: Optional[List[str]] = None,
+                    json_path: Optional[str] = None) -> Any:
         """
         Parse JSON file.
         
+        Args:
+            file_path: Path to the JSON file or a binary buffer with its content
+            columns: Only keep these fields of an object or of a list of records.
+                     Defaults to all fields.
+            json_path: ijson-style prefix of the items to return, e.g. 'item' for the
+                       elements of a top-level array or 'records.item' for those of a
+                       'records' array. Files larger than JSON_STREAM_THRESHOLD are then
+                       streamed when ijson is installed.
+            
+        Returns:
+            Any: Parsed JSON content (dict, list, etc.). With json_path, a list of the
+                 selected items, or an iterator over them when the file is streamed.
+        """
+        if json_path:
+            if (ijson is not None and isinstance(file_path, str)
+                    and os.path.getsize(file_path) > JSON_STREAM_THRESHOLD):
+                return self._parse_json_stream(file_path, json_path, columns)
+            
+            items = self._select_items(self._parse_json(file_path), json_path)
+            return self._project_fields(items, columns) if columns else items
+        
+        if isinstance(file_path, str):
+            with open(file_path, 'rb') as f:
+                data = f.read()
+        else:
+            data = file_path.read()
+        
+        if simdjson is not None:
+            # The document is lazy; only the returned (projected) values are materialized
+            content = self._simdjson_parse(data)
+        elif orjson is not None:
+            content = orjson.loads(data)
+        else:
+            content = json.loads(data)
+        
+        if columns:
+            return self._project_fields(content, columns)
+        return self._materialize(content)
+    
+    def _parse_json_stream(self, file_path: str, json_path: str,
+                           columns: Optional[List[str]] = None) -> Iterator[Any]:
+        """
+        Stream the items at a prefix of a JSON file with ijson, keeping only one item in memory.
+        
         Args:
             file_path: Path to the JSON file
+            json_path: ijson prefix of the items to yield
+            columns: Only keep these fields of object items. Defaults to all fields.
+            
+        Yields:
+            Any: Each item at the prefix
+        """
+        with open(file_path, 'rb') as f:
+            for item in ijson.items(f, json_path, use_float=True):
+                yield self._project_fields(item, columns) if columns else item
+    
+    @staticmethod
+    def _select_items(content: Any, json_path: str) -> List[Any]:
+        """Select the items at an ijson-style prefix of parsed JSON content."""
+        values = [content]
+        for key in json_path.split('.'):
+            if key == 'item':
+                values = [item for value in values if isinstance(value, list) for item in value]
+            else:
+                values = [value[key] for value in values if isinstance(value, dict) and key in value]
+        return values
+    
+    def _simdjson_parse(self, data: bytes) -> Any:
+        """
+        Parse JSON with the calling thread's reusable simdjson parser, whose buffers are
+        kept between files.
+        
+        Args:
+            data: JSON document
             
         Returns:
-            Any: Parsed JSON content (dict, list, etc.)
+            Any: Lazy simdjson document
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        parser = getattr(self._local, 'json_parser', None)
+        if parser is None:
+            parser = self._local.json_parser = simdjson.Parser()
+        try:
+            return parser.parse(data)
+        except RuntimeError:
+            # Values of the previous document are still referenced, so the parser cannot be reused
+            parser = self._local.json_parser = simdjson.Parser()
+            return parser.parse(data)
+    
+    @staticmethod
+    def _materialize(value: Any) -> Any:
+        """Convert a lazy simdjson object or array to a dict or list; other values are returned unchanged."""
+        if simdjson is not None:
+            if isinstance(value, simdjson.Object):
+                return value.as_dict()
+            if isinstance(value, simdjson.Array):
+                return value.as_list()
+        return value
     
-    def _parse_yaml(self, file_path: str) -> Any:
+    @classmethod
+    def _project_fields(cls, content: Any, columns: List[str]) -> Any:
+        """
+        Keep only the given fields of a JSON object or of each record in a list.
+        
+        Args:
+            content: Parsed JSON content, plain or a lazy simdjson document
+            columns: Field names to keep
+            
+        Returns:
+            Any: Projected content; other values are returned unchanged
+        """
+        if isinstance(content, JSON_OBJECT_TYPES):
+            return {k: cls._materialize(content[k]) for k in columns if k in content}
+        if isinstance(content, JSON_ARRAY_TYPES):
+            return [
+                {k: cls._materialize(record[k]) for k in columns if k in record}
+                if isinstance(record, JSON_OBJECT_TYPES) else cls._materialize(record)
+                for record in content
+            ]
+        return cls._materialize(content)
+    
+    def _parse_yaml(self, file_path: Union[str, BinaryIO]) -> Any:
         """
         Parse YAML file.
         
         Args:
-            file_path: Path to the YAML file
+            file_path: Path to the YAML file or a binary buffer with its content
             
         Returns:
             Any: Parsed YAML content
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        with self._open_text(file_path, encoding='utf-8') as f:
+            return yaml.load(f, Loader=YAML_LOADER)
     
-    def _parse_excel(self, file_path: str) -> Dict[str, List[Dict[str, Any]]]:
+    def _parse_excel(self, file_path: Union[str, BinaryIO]) -> Dict[str, pd.DataFrame]:
         """
         Parse Excel file.
+        All sheets are read in one pass over the workbook.
         
         Args:
-            file_path: Path to the Excel file
+            file_path: Path to the Excel file or a binary buffer with its content
             
         Returns:
-            Dict[str, List[Dict[str, Any]]]: Dictionary mapping sheet names to lists of records
+            Dict[str, pd.DataFrame]: Dictionary mapping sheet names to tables
         """
-        # Read all sheets into a dict
-        xl = pd.ExcelFile(file_path)
-        result = {}
-        
-        for sheet_name in xl.sheet_names:
-            result[sheet_name] = pd.read_excel(file_path, sheet_name=sheet_name).to_dict('records')
-        
-        return result
+        return pd.read_excel(file_path, sheet_name=None, engine=EXCEL_ENGINE)
     
-    def _parse_text(self, file_path: str) -> str:
+    def _parse_text(self, file_path: Union[str, BinaryIO]) -> str:
         """
         Parse plain text file.
         
         Args:
-            file_path: Path to the text file
+            file_path: Path to the text file or a binary buffer with its content
             
         Returns:
             str: Text content
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with self._open_text(file_path, encoding='utf-8') as f:
             return f.read()
     
+    @staticmethod
+    def _open_text(file_path: Union[str, BinaryIO], encoding: str, newline: Optional[str] = None):
+        """Open a path, or wrap a binary buffer, as a text stream."""
+        if isinstance(file_path, str):
+            return open(file_path, 'r', encoding=encoding, newline=newline)
+        return io.TextIOWrapper(file_path, encoding=encoding, newline=newline)
+    
+    @staticmethod
+    def _rewind(file_path: Union[str, BinaryIO]) -> None:
+        """Move a buffer back to its start before it is parsed again."""
+        if not isinstance(file_path, str):
+            file_path.seek(0)
+    
     def save_and_upload(self, content: Any, file_name: str, zone: str = 'processed', 
                         s3_path: Optional[str] = None, metadata: Optional[Dict[str, str]] = None) -> Optional[str]:
         """
-        Save content to a file and upload it to S3.
+        Serialize content in the format given by the file name and upload it to S3.
+        The content is serialized in memory; only outputs larger than spool_max_size
+        spill to a temporary file.
         
         Args:
             content: Content to save
@@ -210,32 +627,15 @@ class S3FileUtils:
             str: S3 key of the uploaded file or None if error
         """
         try:
-            # Generate local path
-            local_path = os.path.join(self.temp_dir, file_name)
-            
-            # Save content based on file extension
-            ext = self._get_file_extension(file_name)
-            
-            if ext in ['.csv', '.tsv']:
-                self._save_csv(content, local_path)
-            elif ext == '.json':
-                self._save_json(content, local_path)
-            elif ext in ['.yaml', '.yml']:
-                self._save_yaml(content, local_path)
-            elif ext in ['.xlsx', '.xls']:
-                self._save_excel(content, local_path)
-            elif ext == '.txt':
-                self._save_text(content, local_path)
-            else:
-                logger.warning(f"No saver implemented for extension {ext}")
-                return None
-            
-            # Upload the file
-            s3_file_path = s3_path or file_name
-            success = self.s3_data_lake.upload_file(local_path, zone, s3_file_path, metadata)
-            
-            # Clean up - remove the temporary file
-            os.remove(local_path)
+            with tempfile.SpooledTemporaryFile(max_size=self.spool_max_size, dir=self.temp_dir) as buffer:
+                # Save content based on file extension
+                if not self._save(content, buffer, self._get_file_extension(file_name)):
+                    return None
+                buffer.seek(0)
+                
+                # Upload the buffer
+                s3_file_path = s3_path or file_name
+                success = self.s3_data_lake.upload_fileobj(buffer, zone, s3_file_path, metadata)
             
             if success:
                 return f"{zone}/{s3_file_path}"
@@ -243,58 +643,112 @@ class S3FileUtils:
                 return None
         
         except Exception as e:
-            logger.error(f"Error saving and uploading file {file_name}: {str(e)}")
+            logger.error("Error saving and uploading file %s: %s", file_name, e)
             return None
     
-    def _save_csv(self, content: Union[List[Dict[str, Any]], pd.DataFrame], file_path: str) -> None:
+    def save_local(self, content: Any, file_path: str) -> bool:
+        """
+        Save content to a local file in the format given by its extension.
+        
+        Args:
+            content: Content to save
+            file_path (str): Path of the file to write
+        
+        Returns:
+            bool: True if a saver exists for the extension, False otherwise
+        """
+        return self._save(content, file_path, self._get_file_extension(file_path))
+    
+    def _save(self, content: Any, target: Union[str, BinaryIO], ext: str) -> bool:
+        """
+        Save content to a file path or binary buffer with the saver for an extension.
+        
+        Args:
+            content: Content to save
+            target: Path of the file to write or a writable binary buffer
+            ext: File extension (lowercase) including the dot
+        
+        Returns:
+            bool: True if a saver exists for the extension, False otherwise
+        """
+        saver = self._savers.get(ext)
+        if saver is None:
+            logger.warning("No saver implemented for extension %s", ext)
+            return False
+        
+        saver(content, target)
+        return True
+    
+    def _save_csv(self, content: Union[List[Dict[str, Any]], pd.DataFrame], file_path: Union[str, BinaryIO],
+                  sep: str = ',') -> None:
         """
         Save content as CSV file.
         
         Args:
             content: Data to save (list of dictionaries or pandas DataFrame)
-            file_path: Path to save the CSV file
+            file_path: Path to save the CSV file or a binary buffer
+            sep: Field delimiter, e.g. '\t' for TSV files. Defaults to ','.
         """
         if isinstance(content, list) and content and isinstance(content[0], dict):
-            pd.DataFrame(content).to_csv(file_path, index=False)
+            pd.DataFrame(content).to_csv(file_path, index=False, sep=sep)
         elif isinstance(content, pd.DataFrame):
-            content.to_csv(file_path, index=False)
+            content.to_csv(file_path, index=False, sep=sep)
         else:
             raise ValueError("Content must be a list of dictionaries or a pandas DataFrame")
     
-    def _save_json(self, content: Any, file_path: str) -> None:
+    def _save_json(self, content: Any, file_path: Union[str, BinaryIO]) -> None:
         """
         Save content as JSON file.
         
         Args:
             content: Data to save
-            file_path: Path to save the JSON file
+            file_path: Path to save the JSON file or a binary buffer
         """
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(content, f, indent=4, ensure_ascii=False)
+        # Parsed CSV and Excel files are DataFrames; JSON gets their records
+        content = self.to_records(content)
+        
+        data = None
+        if orjson is not None:
+            try:
+                data = orjson.dumps(
+                    content,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                )
+            except TypeError:
+                # Types orjson does not know (e.g. Decimal, sets) go through the stdlib encoder
+                pass
+        
+        if data is None:
+            data = json.dumps(content, indent=4, ensure_ascii=False).encode('utf-8')
+        
+        with self._open_binary(file_path) as f:
+            f.write(data)
     
-    def _save_yaml(self, content: Any, file_path: str) -> None:
+    def _save_yaml(self, content: Any, file_path: Union[str, BinaryIO]) -> None:
         """
         Save content as YAML file.
         
         Args:
             content: Data to save
-            file_path: Path to save the YAML file
+            file_path: Path to save the YAML file or a binary buffer
         """
-        with open(file_path, 'w', encoding='utf-8') as f:
-            yaml.dump(content, f, default_flow_style=False)
+        content = self.to_records(content)
+        with self._open_binary(file_path) as f:
+            yaml.dump(content, f, Dumper=YAML_DUMPER, default_flow_style=False, encoding='utf-8')
     
     def _save_excel(self, content: Union[Dict[str, List[Dict[str, Any]]], List[Dict[str, Any]], pd.DataFrame], 
-                   file_path: str) -> None:
+                   file_path: Union[str, BinaryIO]) -> None:
         """
-        Save content as Excel file.
+        Save content as XLSX file. The engine is given explicitly, as pandas cannot
+        pick one from the extension when writing to a buffer.
         
         Args:
             content: Data to save (dict of sheet_name -> data, list of dictionaries, or pandas DataFrame)
-            file_path: Path to save the Excel file
+            file_path: Path to save the Excel file or a binary buffer
         """
         if isinstance(content, dict):
             # If it's a dict of sheet_name -> data, save multiple sheets
-            with pd.ExcelWriter(file_path) as writer:
+            with pd.ExcelWriter(file_path, engine=EXCEL_WRITE_ENGINE) as writer:
                 for sheet_name, sheet_data in content.items():
                     if isinstance(sheet_data, pd.DataFrame):
                         sheet_data.to_excel(writer, sheet_name=sheet_name, index=False)
@@ -302,23 +756,30 @@ class S3FileUtils:
                         pd.DataFrame(sheet_data).to_excel(writer, sheet_name=sheet_name, index=False)
         elif isinstance(content, list) and content and isinstance(content[0], dict):
             # If it's a list of dictionaries, save as a single sheet
-            pd.DataFrame(content).to_excel(file_path, index=False)
+            pd.DataFrame(content).to_excel(file_path, index=False, engine=EXCEL_WRITE_ENGINE)
         elif isinstance(content, pd.DataFrame):
             # If it's a pandas DataFrame, save as a single sheet
-            content.to_excel(file_path, index=False)
+            content.to_excel(file_path, index=False, engine=EXCEL_WRITE_ENGINE)
         else:
             raise ValueError("Content must be a dictionary of sheet names to data, a list of dictionaries, or a pandas DataFrame")
     
-    def _save_text(self, content: str, file_path: str) -> None:
+    def _save_text(self, content: str, file_path: Union[str, BinaryIO]) -> None:
         """
         Save content as text file.
         
         Args:
             content: Text to save
-            file_path: Path to save the text file
+            file_path: Path to save the text file or a binary buffer
         """
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        with self._open_binary(file_path) as f:
+            f.write(content.encode('utf-8'))
+    
+    @staticmethod
+    def _open_binary(file_path: Union[str, BinaryIO]):
+        """Open a path for binary writing, or use a binary buffer as is without closing it."""
+        if isinstance(file_path, str):
+            return open(file_path, 'wb')
+        return contextlib.nullcontext(file_path)
     
     def get_file_content_type(self, file_path: str) -> str:
         """
@@ -332,47 +793,23 @@ class S3FileUtils:
         """
         ext = self._get_file_extension(file_path)
         
-        # Map of extensions to MIME types
-        content_types = {
-            '.csv': 'text/csv',
-            '.tsv': 'text/tab-separated-values',
-            '.json': 'application/json',
-            '.yaml': 'application/yaml',
-            '.yml': 'application/yaml',
-            '.xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            '.xls': 'application/vnd.ms-excel',
-            '.txt': 'text/plain',
-            '.pdf': 'application/pdf',
-            '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            '.doc': 'application/msword',
-            '.pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
-            '.ppt': 'application/vnd.ms-powerpoint',
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.png': 'image/png',
-            '.gif': 'image/gif',
-            '.mp3': 'audio/mpeg',
-            '.mp4': 'video/mp4',
-            '.wav': 'audio/wav',
-            '.html': 'text/html',
-            '.htm': 'text/html',
-            '.xml': 'application/xml',
-            '.zip': 'application/zip'
-        }
-        
-        return content_types.get(ext, 'application/octet-stream')
+        return _CONTENT_TYPES.get(ext, 'application/octet-stream')
     
-    def extract_metadata(self, file_path: str) -> Dict[str, Any]:
+    def extract_metadata(self, file_path: str, count_rows: bool = True) -> Dict[str, Any]:
         """
         Extract metadata from a file.
         
         Args:
             file_path: Path to the file
+            count_rows: Whether to scan CSV files for a row count. Without it only the
+                        header is read. Defaults to True.
             
         Returns:
             Dict[str, Any]: Metadata dictionary
         """
         try:
+            ext = self._get_file_extension(file_path)
+            
             # Basic metadata
             stats = os.stat(file_path)
             metadata = {
@@ -380,106 +817,349 @@ class S3FileUtils:
                 'size_bytes': stats.st_size,
                 'created_time': stats.st_ctime,
                 'modified_time': stats.st_mtime,
-                'content_type': self.get_file_content_type(file_path)
+                'content_type': _CONTENT_TYPES.get(ext, 'application/octet-stream')
             }
             
             # Extension-specific metadata
-            ext = self._get_file_extension(file_path)
             
             # Extract more metadata based on file type
             if ext in ['.csv', '.tsv']:
                 try:
-                    df = pd.read_csv(file_path, nrows=10)  # Read just a sample
-                    metadata.update({
-                        'columns': df.columns.tolist(),
-                        'row_count_estimate': sum(1 for _ in open(file_path)) - 1  # Approximate count
-                    })
+                    df = pd.read_csv(file_path, nrows=0, sep='\t' if ext == '.tsv' else ',')  # Read just the header
+                    metadata['columns'] = df.columns.tolist()
+                    if count_rows:
+                        metadata['row_count_estimate'] = self._count_lines(file_path) - 1  # Approximate count
                 except Exception as e:
-                    logger.warning(f"Could not extract CSV metadata: {str(e)}")
+                    logger.warning("Could not extract CSV metadata: %s", e)
                     
             elif ext in ['.xlsx', '.xls']:
                 try:
-                    xl = pd.ExcelFile(file_path)
+                    if ext == '.xlsx':
+                        sheet_names = self._xlsx_sheet_names(file_path)
+                    elif python_calamine is not None:
+                        # Lists the sheets without loading them
+                        sheet_names = python_calamine.CalamineWorkbook.from_path(file_path).sheet_names
+                    else:
+                        sheet_names = pd.ExcelFile(file_path).sheet_names
                     metadata.update({
-                        'sheets': xl.sheet_names
+                        'sheets': sheet_names
                     })
                 except Exception as e:
-                    logger.warning(f"Could not extract Excel metadata: {str(e)}")
+                    logger.warning("Could not extract Excel metadata: %s", e)
                     
             # Add more file type specific metadata extraction as needed
             
             return metadata
             
         except Exception as e:
-            logger.error(f"Error extracting metadata for {file_path}: {str(e)}")
+            logger.error("Error extracting metadata for %s: %s", file_path, e)
             return {'filename': os.path.basename(file_path)}
     
+    @staticmethod
+    def _xlsx_sheet_names(file_path: str) -> List[str]:
+        """
+        List the sheets of an XLSX workbook from its xl/workbook.xml part.
+        No worksheet or shared string is decompressed or parsed.
+        
+        Args:
+            file_path: Path to the XLSX file
+            
+        Returns:
+            List[str]: Sheet names in workbook order
+        """
+        with zipfile.ZipFile(file_path) as workbook:
+            root = ElementTree.fromstring(workbook.read('xl/workbook.xml'))
+        return [sheet.get('name') for sheet in root.iter(XLSX_SHEET_TAG)]
+    
+    @staticmethod
+    def _count_lines(file_path: str) -> int:
+        """Count the lines of a file by counting newlines in 1 MB blocks."""
+        count = 0
+        last = b''
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                count += block.count(b'\n')
+                last = block
+        
+        # A final line without a trailing newline still counts
+        if last and not last.endswith(b'\n'):
+            count += 1
+        return count
+    
+    def extract_metadata_fast(self, file_path: str) -> Dict[str, str]:
+        """
+        Extract cheap metadata for uploads from a file's stat fields and content type.
+        At most the first 4 KB are read, to sniff the MIME type when python-magic is
+        installed. Values are strings, as S3 user metadata requires.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            Dict[str, str]: Metadata dictionary
+        """
+        try:
+            stats = os.stat(file_path)
+            return dict(self._fast_metadata(file_path, stats.st_mtime_ns, stats.st_size))
+        
+        except Exception as e:
+            logger.error("Error extracting metadata for %s: %s", file_path, e)
+            return {'filename': os.path.basename(file_path)}
+    
+    def _read_fast_metadata(self, file_path: str, mtime_ns: int, size: int) -> Dict[str, str]:
+        """Build the extract_metadata_fast result; mtime_ns and size only key the cache."""
+        content_type = None
+        if magic is not None:
+            with open(file_path, 'rb') as f:
+                content_type = magic.from_buffer(f.read(MAGIC_SNIFF_SIZE), mime=True)
+        
+        # Text formats sniff as text/plain, so prefer the extension for those
+        if content_type is None or content_type in ('text/plain', 'application/octet-stream'):
+            content_type = self.get_file_content_type(file_path)
+        
+        return {
+            'filename': os.path.basename(file_path),
+            'size_bytes': str(size),
+            'modified_time': str(mtime_ns / 1e9),
+            'content_type': content_type
+        }
+    
     def batch_process_files(self, file_paths: List[str], target_zone: str = 'processed', 
-                           process_func=None) -> Dict[str, str]:
+                           process_func=None, max_workers: Optional[int] = None,
+                           columns: Optional[List[str]] = None,
+                           dtypes: Optional[Dict[str, Any]] = None,
+                           schema_hint: Optional[Dict[str, Any]] = None,
+                           json_path: Optional[str] = None) -> Dict[str, str]:
         """
         Process multiple files and upload them to the data lake.
+        Files are processed concurrently on a thread pool.
         
         Args:
             file_paths: List of file paths to process
             target_zone: Data lake zone to upload to
             process_func: Function to apply to each file's content before uploading
                          If None, files are uploaded as-is
+            max_workers: Number of files processed at once. Defaults to min(32, 4 * CPU count).
+            columns: Only parse these CSV columns / JSON fields for process_func.
+                     Defaults to all of them.
+            dtypes: Column name -> dtype mapping used when parsing CSV files for process_func
+            schema_hint: Column name -> numeric dtype mapping of CSV files holding only
+                         numbers in those columns, loading them with the numeric fast path
+            json_path: ijson-style prefix of the items process_func gets from JSON files.
+                       Large files are streamed to it as an iterator.
         
         Returns:
             Dict[str, str]: Dictionary mapping input file paths to their S3 keys
         """
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+        
         results = {}
+        parsers = self._batch_parsers(columns, dtypes, schema_hint, json_path)
         
-        for file_path in file_paths:
-            try:
-                filename = os.path.basename(file_path)
-                
-                if process_func is not None:
-                    # Parse the file
-                    ext = self._get_file_extension(file_path)
-                    
-                    if ext in ['.csv', '.tsv']:
-                        content = self._parse_csv(file_path)
-                    elif ext == '.json':
-                        content = self._parse_json(file_path)
-                    elif ext in ['.yaml', '.yml']:
-                        content = self._parse_yaml(file_path)
-                    elif ext in ['.xlsx', '.xls']:
-                        content = self._parse_excel(file_path)
-                    elif ext == '.txt':
-                        content = self._parse_text(file_path)
-                    else:
-                        logger.warning(f"Skipping {file_path} - unsupported extension {ext}")
-                        continue
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._process_one, file_path, target_zone, process_func, parsers): file_path
+                for file_path in file_paths
+            }
+            
+            # Results are only written here, on the calling thread
+            for future in as_completed(futures):
+                file_path = futures[future]
+                try:
+                    s3_key = future.result()
                     
-                    # Process the content
-                    processed_content = process_func(content)
+                    if s3_key:
+                        results[file_path] = s3_key
+                        logger.info("Processed and uploaded %s to %s", file_path, s3_key)
+                    elif s3_key is None:
+                        logger.error("Failed to process and upload %s", file_path)
                     
-                    # Save and upload
-                    s3_key = self.save_and_upload(
-                        processed_content, 
-                        filename, 
-                        target_zone, 
-                        metadata=self.extract_metadata(file_path)
-                    )
-                else:
-                    # Upload the file directly
-                    if self.s3_data_lake.upload_file(
-                        file_path, 
-                        target_zone, 
-                        metadata=self.extract_metadata(file_path)
-                    ):
-                        s3_key = f"{target_zone}/{filename}"
-                    else:
-                        s3_key = None
-                
-                if s3_key:
-                    results[file_path] = s3_key
-                    logger.info(f"Processed and uploaded {file_path} to {s3_key}")
-                else:
-                    logger.error(f"Failed to process and upload {file_path}")
-                
-            except Exception as e:
-                logger.error(f"Error processing file {file_path}: {str(e)}")
+                except Exception as e:
+                    logger.error("Error processing file %s: %s", file_path, e)
+        
+        return results
+    
+    def _process_one(self, file_path: str, target_zone: str, process_func=None,
+                     parsers: Optional[Dict[str, Callable]] = None) -> Optional[str]:
+        """
+        Process and upload a single file for batch_process_files.
+        
+        Returns:
+            str: S3 key of the uploaded file, '' if the file was skipped, or None if the upload failed
+        """
+        filename = os.path.basename(file_path)
+        
+        if process_func is not None:
+            # Parse the file
+            ext = self._get_file_extension(file_path)
+            
+            parser = (parsers or {}).get(ext) or self._get_parser(ext)
+            if parser is None:
+                logger.warning("Skipping %s - unsupported extension %s", file_path, ext)
+                return ''
+            content = parser(file_path)
+            
+            # Process the content
+            processed_content = process_func(content)
+            
+            # Save and upload
+            return self.save_and_upload(
+                processed_content, 
+                filename, 
+                target_zone, 
+                metadata=self.extract_metadata(file_path)
+            )
+        
+        # Upload the file directly; skip the row count so the file is only read once
+        if self.s3_data_lake.upload_file(
+            file_path, 
+            target_zone, 
+            metadata=self.extract_metadata(file_path, count_rows=False)
+        ):
+            return f"{target_zone}/{filename}"
+        return None
+    
+    def _batch_parsers(self, columns: Optional[List[str]], dtypes: Optional[Dict[str, Any]],
+                       schema_hint: Optional[Dict[str, Any]],
+                       json_path: Optional[str] = None) -> Dict[str, Callable]:
+        """
+        Build the parsers with a batch's parse options bound, overriding the registered
+        parsers for CSV, TSV and JSON files. Empty if there are no options.
+        """
+        if not (columns or dtypes or schema_hint or json_path):
+            return {}
+        
+        csv_parser = functools.partial(self._parse_csv, columns=columns, dtypes=dtypes, schema_hint=schema_hint)
+        return {
+            '.csv': csv_parser,
+            '.tsv': functools.partial(csv_parser, delimiter='\t'),
+            '.json': functools.partial(self._parse_json, columns=columns, json_path=json_path)
+        }
+    
+    async def batch_process_files_async(self, file_paths: List[str], target_zone: str = 'processed',
+                                        process_func=None, max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+                                        columns: Optional[List[str]] = None,
+                                        dtypes: Optional[Dict[str, Any]] = None,
+                                        schema_hint: Optional[Dict[str, Any]] = None,
+                                        json_path: Optional[str] = None) -> Dict[str, str]:
+        """
+        Process multiple files and upload them to the data lake on an asyncio event loop.
+        Behaves like batch_process_files, but does the S3 I/O with one aioboto3 client.
+        Parsing, processing and serializing run in worker threads. Requires the optional
+        aioboto3 package.
+        
+        Args:
+            file_paths: List of file paths to process
+            target_zone: Data lake zone to upload to
+            process_func: Function to apply to each file's content before uploading
+                         If None, files are uploaded as-is
+            max_concurrency: Maximum number of files processed at once. Defaults to 64.
+            columns: Only parse these CSV columns / JSON fields for process_func.
+                     Defaults to all of them.
+            dtypes: Column name -> dtype mapping used when parsing CSV files for process_func
+            schema_hint: Column name -> numeric dtype mapping of CSV files holding only
+                         numbers in those columns, loading them with the numeric fast path
+            json_path: ijson-style prefix of the items process_func gets from JSON files.
+                       Large files are streamed to it as an iterator.
+        
+        Returns:
+            Dict[str, str]: Dictionary mapping input file paths to their S3 keys
+        """
+        if target_zone not in self.s3_data_lake.zones:
+            logger.error("Invalid zone '%s'. Must be one of %s", target_zone, self.s3_data_lake.zones)
+            return {}
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        parsers = self._batch_parsers(columns, dtypes, schema_hint, json_path)
+        
+        async with self.s3_data_lake.async_client() as client:
+            async def run(file_path):
+                async with semaphore:
+                    try:
+                        return await self._process_one_async(client, file_path, target_zone, process_func, parsers)
+                    except Exception as e:
+                        logger.error("Error processing file %s: %s", file_path, e)
+                        return ''
+            
+            s3_keys = await asyncio.gather(*(run(file_path) for file_path in file_paths))
+        
+        results = {}
+        for file_path, s3_key in zip(file_paths, s3_keys):
+            if s3_key:
+                results[file_path] = s3_key
+                logger.info("Processed and uploaded %s to %s", file_path, s3_key)
+            elif s3_key is None:
+                logger.error("Failed to process and upload %s", file_path)
+        
+        return results
+    
+    async def _process_one_async(self, client, file_path: str, target_zone: str, process_func,
+                                 parsers: Dict[str, Callable]) -> Optional[str]:
+        """
+        Process and upload a single file for batch_process_files_async.
+        
+        Returns:
+            str: S3 key of the uploaded file, '' if the file was skipped, or None if the upload failed
+        """
+        filename = os.path.basename(file_path)
+        s3_key = f"{target_zone}/{filename}"
+        
+        if process_func is None:
+            # Upload the file directly; skip the row count so the file is only read once
+            metadata = await asyncio.to_thread(self.extract_metadata, file_path, False)
+            return s3_key if await self.upload_async(client, file_path, s3_key, metadata) else None
+        
+        ext = self._get_file_extension(file_path)
+        parser = parsers.get(ext) or self._get_parser(ext)
+        if parser is None:
+            logger.warning("Skipping %s - unsupported extension %s", file_path, ext)
+            return ''
+        
+        content = await asyncio.to_thread(parser, file_path)
+        processed_content = await asyncio.to_thread(process_func, content)
+        metadata = await asyncio.to_thread(self.extract_metadata, file_path)
+        
+        saved = await self.save_and_upload_async(client, processed_content, filename, s3_key, metadata)
+        return s3_key if saved else None
+    
+    async def save_and_upload_async(self, client, content: Any, file_name: str, s3_key: str,
+                                    metadata: Optional[Dict[str, str]] = None) -> bool:
+        """
+        Serialize content like save_and_upload and upload it with an async client.
+        Serializing runs in a worker thread.
+        
+        Args:
+            client: aioboto3 S3 client, e.g. from S3DataLake.async_client()
+            content: Content to save
+            file_name (str): Name whose extension selects the format
+            s3_key (str): Full S3 key to upload to
+            metadata (dict, optional): Metadata for the file. Defaults to None.
+        
+        Returns:
+            bool: True if the content was saved and uploaded, False otherwise
+        """
+        with tempfile.SpooledTemporaryFile(max_size=self.spool_max_size, dir=self.temp_dir) as buffer:
+            if not await asyncio.to_thread(self._save, content, buffer, self._get_file_extension(file_name)):
+                return False
+            buffer.seek(0)
+            return await self.upload_async(client, buffer, s3_key, metadata)
+    
+    async def upload_async(self, client, source: Union[str, BinaryIO], s3_key: str,
+                           metadata: Optional[Dict[str, str]] = None) -> bool:
+        """Upload a local file or binary buffer with an async client; returns True on success."""
+        extra_args = {'Metadata': metadata} if metadata else None
+        config = self.s3_data_lake.transfer_config
+        try:
+            if isinstance(source, str):
+                await client.upload_file(source, self.s3_data_lake.bucket_name, s3_key,
+                                         ExtraArgs=extra_args, Config=config)
+            else:
+                await client.upload_fileobj(source, self.s3_data_lake.bucket_name, s3_key,
+                                            ExtraArgs=extra_args, Config=config)
+        except ClientError as e:
+            logger.error("Error uploading file: %s", e)
+            return False
         
-        return results
\ No newline at end of file
+        self.s3_data_lake.invalidate_cache(s3_key)
+        return True
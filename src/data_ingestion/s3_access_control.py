@@ -7,14 +7,166 @@ for controlling access to the S3 data lake.
 
 import json
 import logging
+import functools
+import threading
 import boto3
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from botocore.exceptions import ClientError
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, FrozenSet, List, Optional, Sequence, Union, Any
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Handlers and levels are left to the application
 logger = logging.getLogger(__name__)
 
+# Data lake zones, one prefix each in the bucket
+ZONES = ('raw', 'processed', 'enriched', 'curated')
+
+
+def _dumps(document: Any) -> str:
+    """Serialize a policy document; botocore expects policy parameters as str."""
+    if orjson is not None:
+        return orjson.dumps(document).decode('utf-8')
+    return json.dumps(document)
+
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a policy document."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _thread_local_lru_cache(maxsize: Optional[int] = None):
+    """
+    Like functools.lru_cache, but every thread gets its own cache, as boto3 sessions
+    and clients should not be created from several threads at once. cache_clear() drops
+    the entries of all threads: each thread starts a new cache on its next call.
+    """
+    def decorator(func):
+        local = threading.local()
+        generation = [0]
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if getattr(local, 'generation', None) != generation[0]:
+                local.cache = functools.lru_cache(maxsize=maxsize)(func)
+                local.generation = generation[0]
+            return local.cache(*args, **kwargs)
+        
+        def cache_clear():
+            generation[0] += 1
+        
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    
+    return decorator
+
+
+def _catch_client_error(not_found_codes: FrozenSet[str], default: Any = None):
+    """
+    Turn ClientErrors whose code is in not_found_codes into a default return value,
+    for calls where a missing configuration simply means there is none yet. Other
+    errors are raised as usual.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except ClientError as e:
+                if e.response.get('Error', {}).get('Code') in not_found_codes:
+                    return default
+                raise
+        
+        return wrapper
+    
+    return decorator
+
+
+@_thread_local_lru_cache()
+def _get_session(profile_name: Optional[str], region_name: str) -> boto3.Session:
+    """Get the shared boto3 session for a profile and region, creating it on first use."""
+    if profile_name:
+        return boto3.Session(profile_name=profile_name, region_name=region_name)
+    return boto3.Session(region_name=region_name)
+
+
+@_thread_local_lru_cache()
+def _get_client(session: boto3.Session, service_name: str):
+    """Get the shared client of a session for a service, creating it on first use."""
+    return session.client(service_name)
+
+
+# Object actions granted by the IAM policy documents; tuples, so documents can share them
+_READ_ACTIONS = ("s3:GetObject",)
+_WRITE_ACTIONS = ("s3:PutObject", "s3:DeleteObject")
+_READ_WRITE_ACTIONS = _READ_ACTIONS + _WRITE_ACTIONS
+
+# Default bucket policy; "{bucket}" stands in for the bucket name
+_DEFAULT_BUCKET_POLICY_TEMPLATE = {
+    "Version": "2012-10-17",
+    "Statement": [
+        {
+            "Sid": "DenyUnencryptedObjectUploads",
+            "Effect": "Deny",
+            "Principal": "*",
+            "Action": "s3:PutObject",
+            "Resource": "arn:aws:s3:::{bucket}/*",
+            "Condition": {
+                "StringNotEquals": {
+                    "s3:x-amz-server-side-encryption": "AES256"
+                }
+            }
+        },
+        {
+            "Sid": "DenyHTTP",
+            "Effect": "Deny",
+            "Principal": "*",
+            "Action": "s3:*",
+            "Resource": "arn:aws:s3:::{bucket}/*",
+            "Condition": {
+                "Bool": {
+                    "aws:SecureTransport": "false"
+                }
+            }
+        }
+    ]
+}
+
+# Statement added to the default policy when public read access is requested
+_PUBLIC_READ_STATEMENT_TEMPLATE = {
+    "Sid": "AllowPublicRead",
+    "Effect": "Allow",
+    "Principal": "*",
+    "Action": "s3:GetObject",
+    "Resource": "arn:aws:s3:::{bucket}/curated/*"
+}
+
+# Serialized templates, so building a policy is a single string substitution
+_DEFAULT_BUCKET_POLICY_JSON = _dumps(_DEFAULT_BUCKET_POLICY_TEMPLATE)
+_PUBLIC_READ_BUCKET_POLICY_JSON = _dumps({
+    **_DEFAULT_BUCKET_POLICY_TEMPLATE,
+    "Statement": _DEFAULT_BUCKET_POLICY_TEMPLATE["Statement"] + [_PUBLIC_READ_STATEMENT_TEMPLATE]
+})
+
+
+def _instantiate_template(template_json: str, bucket_name: str) -> str:
+    """Fill the bucket name into a serialized policy template."""
+    # S3 bucket names never contain characters that need escaping in JSON
+    return template_json.replace('{bucket}', bucket_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _default_bucket_policy(bucket_name: str, allow_public_read: bool) -> str:
+    """Get the serialized default bucket policy of a bucket, building it on first use."""
+    template_json = _PUBLIC_READ_BUCKET_POLICY_JSON if allow_public_read else _DEFAULT_BUCKET_POLICY_JSON
+    return _instantiate_template(template_json, bucket_name)
+
+
 class S3AccessControl:
     """
     Class for managing S3 data lake access control and policies.
@@ -35,52 +187,111 @@ class S3AccessControl:
         self.bucket_name = bucket_name
         self.region_name = region_name
         
-        # Set up AWS session
-        if profile_name:
-            session = boto3.Session(profile_name=profile_name, region_name=region_name)
-        else:
-            session = boto3.Session(region_name=region_name)
-        
-        self.s3 = session.client('s3')
-        self.iam = session.client('iam')
-        self.kms = session.client('kms')
+        # Resource ARNs used by the policy builders
+        self._bucket_arn = f"arn:aws:s3:::{bucket_name}"
+        self._zone_arns = {zone: f"{self._bucket_arn}/{zone}/*" for zone in ZONES}
+        
+        # Last bucket policy read or written by this instance, possibly still serialized;
+        # None with a clean cache means the bucket has no policy
+        self._policy_cache = None
+        self._policy_cache_dirty = True
+        
+        # Sessions and clients are shared by all instances with the same profile and region
+        # on a thread, so credentials are resolved and service models loaded only once
+        self._session = _get_session(profile_name, region_name)
+        self.s3 = _get_client(self._session, 's3')
+        self.iam = _get_client(self._session, 'iam')
+        self.kms = _get_client(self._session, 'kms')
+    
+    @classmethod
+    def cache_clear(cls) -> None:
+        """
+        Drop the shared sessions and clients, e.g. after credentials change or between
+        tests that patch boto3.Session.
+        """
+        _get_session.cache_clear()
+        _get_client.cache_clear()
+    
+    def _zone_arn(self, zone: str) -> str:
+        """ARN of the objects in a zone."""
+        return self._zone_arns.get(zone) or f"{self._bucket_arn}/{zone}/*"
     
-    def set_bucket_policy(self, policy: Dict[str, Any]) -> bool:
+    def set_bucket_policy(self, policy: Union[Dict[str, Any], str]) -> bool:
         """
         Set a bucket policy for the S3 bucket.
         
         Args:
-            policy (Dict[str, Any]): The bucket policy as a dictionary
+            policy (Union[Dict[str, Any], str]): The bucket policy as a dictionary or an
+                                                 already serialized JSON string
         
         Returns:
             bool: True if the policy was set successfully, False otherwise
         """
         try:
-            policy_str = json.dumps(policy)
+            if isinstance(policy, str):
+                policy_str = policy
+            else:
+                policy_str = _dumps(policy)
             self.s3.put_bucket_policy(Bucket=self.bucket_name, Policy=policy_str)
-            logger.info(f"Bucket policy set for {self.bucket_name}")
+            # A serialized policy is cached as is and only parsed if it is read back
+            self._policy_cache = policy if isinstance(policy, str) else self._copy_policy(policy)
+            self._policy_cache_dirty = False
+            logger.info("Bucket policy set for %s", self.bucket_name)
             return True
         except ClientError as e:
-            logger.error(f"Error setting bucket policy: {str(e)}")
+            self._policy_cache_dirty = True
+            logger.error("Error setting bucket policy: %s", e)
             return False
     
-    def get_bucket_policy(self) -> Optional[Dict[str, Any]]:
+    def get_bucket_policy(self, refresh: bool = False) -> Optional[Dict[str, Any]]:
         """
         Get the current bucket policy.
+        The policy last read or written by this instance is reused; pass refresh=True
+        to pick up changes made elsewhere.
+        
+        Args:
+            refresh (bool, optional): Whether to fetch the policy even if it is cached. Defaults to False.
         
         Returns:
             Optional[Dict[str, Any]]: The bucket policy as a dictionary, or None if no policy exists
         """
+        if not (refresh or self._policy_cache_dirty):
+            if isinstance(self._policy_cache, str):
+                self._policy_cache = _loads(self._policy_cache)
+            return self._copy_policy(self._policy_cache)
+        
         try:
-            response = self.s3.get_bucket_policy(Bucket=self.bucket_name)
-            return json.loads(response['Policy'])
+            policy_str = self._fetch_bucket_policy()
         except ClientError as e:
-            if e.response['Error']['Code'] == 'NoSuchBucketPolicy':
-                logger.info(f"No bucket policy exists for {self.bucket_name}")
-                return None
-            else:
-                logger.error(f"Error getting bucket policy: {str(e)}")
-                return None
+            logger.error("Error getting bucket policy: %s", e)
+            self._policy_cache_dirty = True
+            return None
+        
+        if policy_str is None:
+            logger.info("No bucket policy exists for %s", self.bucket_name)
+            self._policy_cache = None
+        else:
+            self._policy_cache = _loads(policy_str)
+        self._policy_cache_dirty = False
+        return self._copy_policy(self._policy_cache)
+    
+    @_catch_client_error(frozenset({'NoSuchBucketPolicy'}))
+    def _fetch_bucket_policy(self) -> Optional[str]:
+        """Fetch the serialized bucket policy, or None if the bucket has none."""
+        return self.s3.get_bucket_policy(Bucket=self.bucket_name)['Policy']
+    
+    @staticmethod
+    def _copy_policy(policy: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Copy a policy's top level and statement list, so callers can add or remove
+        statements without touching the cached policy. Statements are shared.
+        """
+        if policy is None:
+            return None
+        copied = dict(policy)
+        if 'Statement' in copied:
+            copied['Statement'] = list(copied['Statement'])
+        return copied
     
     def create_default_bucket_policy(self, allow_public_read: bool = False) -> bool:
         """
@@ -92,56 +303,23 @@ class S3AccessControl:
         Returns:
             bool: True if the policy was created and set successfully, False otherwise
         """
-        policy = {
-            "Version": "2012-10-17",
-            "Statement": [
-                {
-                    "Sid": "DenyUnencryptedObjectUploads",
-                    "Effect": "Deny",
-                    "Principal": "*",
-                    "Action": "s3:PutObject",
-                    "Resource": f"arn:aws:s3:::{self.bucket_name}/*",
-                    "Condition": {
-                        "StringNotEquals": {
-                            "s3:x-amz-server-side-encryption": "AES256"
-                        }
-                    }
-                },
-                {
-                    "Sid": "DenyHTTP",
-                    "Effect": "Deny",
-                    "Principal": "*",
-                    "Action": "s3:*",
-                    "Resource": f"arn:aws:s3:::{self.bucket_name}/*",
-                    "Condition": {
-                        "Bool": {
-                            "aws:SecureTransport": "false"
-                        }
-                    }
-                }
-            ]
-        }
-        
-        # Add public read access if requested (not recommended for production)
-        if allow_public_read:
-            policy["Statement"].append({
-                "Sid": "AllowPublicRead",
-                "Effect": "Allow",
-                "Principal": "*",
-                "Action": "s3:GetObject",
-                "Resource": f"arn:aws:s3:::{self.bucket_name}/curated/*"
-            })
-        
-        return self.set_bucket_policy(policy)
+        return self.set_bucket_policy(_default_bucket_policy(self.bucket_name, allow_public_read))
     
-    def create_role_based_access_policy(self, role_arn: str, read_zones: List[str], write_zones: List[str]) -> bool:
+    def create_role_based_access_policy(self, role_arn: str, read_zones: List[str], write_zones: List[str],
+                                        current_policy: Optional[Dict[str, Any]] = None,
+                                        merge: bool = True) -> bool:
         """
         Create a bucket policy that grants access to specific zones based on IAM role.
+        The role's statements are merged into the current bucket policy unless merge is False.
         
         Args:
             role_arn (str): The ARN of the IAM role
             read_zones (List[str]): List of zones to grant read access to
             write_zones (List[str]): List of zones to grant write access to
+            current_policy (Dict[str, Any], optional): The current bucket policy, if the caller
+                                                       already has it; saves fetching it. Defaults to None.
+            merge (bool, optional): Whether to keep the other statements of the current policy.
+                                    If False, the policy is replaced without being fetched. Defaults to True.
         
         Returns:
             bool: True if the policy was created and set successfully, False otherwise
@@ -153,7 +331,7 @@ class S3AccessControl:
         
         # Add read permissions
         if read_zones:
-            read_resources = [f"arn:aws:s3:::{self.bucket_name}/{zone}/*" for zone in read_zones]
+            read_resources = [self._zone_arn(zone) for zone in read_zones]
             policy["Statement"].append({
                 "Sid": "AllowRoleRead",
                 "Effect": "Allow",
@@ -162,12 +340,12 @@ class S3AccessControl:
                     "s3:GetObject",
                     "s3:ListBucket"
                 ],
-                "Resource": read_resources + [f"arn:aws:s3:::{self.bucket_name}"]
+                "Resource": read_resources + [self._bucket_arn]
             })
         
         # Add write permissions
         if write_zones:
-            write_resources = [f"arn:aws:s3:::{self.bucket_name}/{zone}/*" for zone in write_zones]
+            write_resources = [self._zone_arn(zone) for zone in write_zones]
             policy["Statement"].append({
                 "Sid": "AllowRoleWrite",
                 "Effect": "Allow",
@@ -179,27 +357,32 @@ class S3AccessControl:
                 "Resource": write_resources
             })
         
-        # Get the current policy (if any)
-        current_policy = self.get_bucket_policy()
+        if not merge:
+            return self.set_bucket_policy(policy)
+        
+        # Get the current policy (if any); a known empty or cached policy needs no request
+        if current_policy is None:
+            current_policy = self.get_bucket_policy()
+        else:
+            current_policy = self._copy_policy(current_policy)
         
         if current_policy:
             # Merge with the existing policy
             current_statements = current_policy.get("Statement", [])
             
             # Remove any statements for the same role to avoid conflicts
-            filtered_statements = [
-                stmt for stmt in current_statements
-                if not (isinstance(stmt.get("Principal", {}), dict) and 
-                       stmt.get("Principal", {}).get("AWS") == role_arn)
-            ]
+            def _keeps(stmt):
+                principal = stmt.get("Principal")
+                return not (type(principal) is dict and principal.get("AWS") == role_arn)
+            
+            filtered_statements = list(filter(_keeps, current_statements))
             
             # Add the new statements
             filtered_statements.extend(policy["Statement"])
             
-            # Update the policy
-            merged_policy = current_policy.copy()
-            merged_policy["Statement"] = filtered_statements
-            return self.set_bucket_policy(merged_policy)
+            # Update the policy; get_bucket_policy returned a copy, so it can be changed in place
+            current_policy["Statement"] = filtered_statements
+            return self.set_bucket_policy(current_policy)
         else:
             # Set the new policy
             return self.set_bucket_policy(policy)
@@ -246,11 +429,11 @@ class S3AccessControl:
                 ServerSideEncryptionConfiguration=encryption_config
             )
             
-            logger.info(f"Encryption enabled for bucket {self.bucket_name}")
+            logger.info("Encryption enabled for bucket %s", self.bucket_name)
             return True
             
         except ClientError as e:
-            logger.error(f"Error enabling bucket encryption: {str(e)}")
+            logger.error("Error enabling bucket encryption: %s", e)
             return False
     
     def create_kms_key(self, description: str = "KMS key for S3 data lake encryption") -> Optional[str]:
@@ -280,11 +463,11 @@ class S3AccessControl:
                 TargetKeyId=key_id
             )
             
-            logger.info(f"Created KMS key {key_id} with alias {alias_name}")
+            logger.info("Created KMS key %s with alias %s", key_id, alias_name)
             return key_id
             
         except ClientError as e:
-            logger.error(f"Error creating KMS key: {str(e)}")
+            logger.error("Error creating KMS key: %s", e)
             return None
     
     def enable_bucket_versioning(self) -> bool:
@@ -300,21 +483,22 @@ class S3AccessControl:
                 VersioningConfiguration={'Status': 'Enabled'}
             )
             
-            logger.info(f"Versioning enabled for bucket {self.bucket_name}")
+            logger.info("Versioning enabled for bucket %s", self.bucket_name)
             return True
             
         except ClientError as e:
-            logger.error(f"Error enabling bucket versioning: {str(e)}")
+            logger.error("Error enabling bucket versioning: %s", e)
             return False
     
-    def create_iam_policy(self, policy_name: str, policy_document: Dict[str, Any], 
+    def create_iam_policy(self, policy_name: str, policy_document: Union[Dict[str, Any], str], 
                          description: str = "IAM policy for S3 data lake access") -> Optional[str]:
         """
         Create an IAM policy for access to the S3 bucket.
         
         Args:
             policy_name (str): Name for the IAM policy
-            policy_document (Dict[str, Any]): Policy document
+            policy_document (Union[Dict[str, Any], str]): Policy document as a dictionary or an
+                                                          already serialized JSON string
             description (str, optional): Description for the policy.
                                        Defaults to "IAM policy for S3 data lake access".
         
@@ -324,16 +508,16 @@ class S3AccessControl:
         try:
             response = self.iam.create_policy(
                 PolicyName=policy_name,
-                PolicyDocument=json.dumps(policy_document),
+                PolicyDocument=policy_document if isinstance(policy_document, str) else _dumps(policy_document),
                 Description=description
             )
             
             policy_arn = response['Policy']['Arn']
-            logger.info(f"Created IAM policy {policy_name} with ARN {policy_arn}")
+            logger.info("Created IAM policy %s with ARN %s", policy_name, policy_arn)
             return policy_arn
             
         except ClientError as e:
-            logger.error(f"Error creating IAM policy: {str(e)}")
+            logger.error("Error creating IAM policy: %s", e)
             return None
     
     def create_data_scientist_policy(self, policy_name: str = "DataLakeDataScientistPolicy") -> Optional[str]:
@@ -348,50 +532,7 @@ class S3AccessControl:
         Returns:
             Optional[str]: Policy ARN if created successfully, None otherwise
         """
-        policy_document = {
-            "Version": "2012-10-17",
-            "Statement": [
-                {
-                    "Sid": "ListBucket",
-                    "Effect": "Allow",
-                    "Action": "s3:ListBucket",
-                    "Resource": f"arn:aws:s3:::{self.bucket_name}",
-                    "Condition": {
-                        "StringLike": {
-                            "s3:prefix": [
-                                "processed/*",
-                                "enriched/*",
-                                "curated/*"
-                            ]
-                        }
-                    }
-                },
-                {
-                    "Sid": "ReadAccess",
-                    "Effect": "Allow",
-                    "Action": [
-                        "s3:GetObject"
-                    ],
-                    "Resource": [
-                        f"arn:aws:s3:::{self.bucket_name}/processed/*",
-                        f"arn:aws:s3:::{self.bucket_name}/curated/*"
-                    ]
-                },
-                {
-                    "Sid": "WriteAccess",
-                    "Effect": "Allow",
-                    "Action": [
-                        "s3:PutObject",
-                        "s3:DeleteObject"
-                    ],
-                    "Resource": [
-                        f"arn:aws:s3:::{self.bucket_name}/enriched/*"
-                    ]
-                }
-            ]
-        }
-        
-        return self.create_iam_policy(policy_name, policy_document, 
+        return self.create_iam_policy(policy_name, self._data_scientist_policy_document, 
                                      "IAM policy for data scientists to access the data lake")
     
     def create_data_engineer_policy(self, policy_name: str = "DataLakeDataEngineerPolicy") -> Optional[str]:
@@ -405,34 +546,7 @@ class S3AccessControl:
         Returns:
             Optional[str]: Policy ARN if created successfully, None otherwise
         """
-        policy_document = {
-            "Version": "2012-10-17",
-            "Statement": [
-                {
-                    "Sid": "ListBucket",
-                    "Effect": "Allow",
-                    "Action": "s3:ListBucket",
-                    "Resource": f"arn:aws:s3:::{self.bucket_name}"
-                },
-                {
-                    "Sid": "ReadWriteAccess",
-                    "Effect": "Allow",
-                    "Action": [
-                        "s3:GetObject",
-                        "s3:PutObject",
-                        "s3:DeleteObject"
-                    ],
-                    "Resource": [
-                        f"arn:aws:s3:::{self.bucket_name}/raw/*",
-                        f"arn:aws:s3:::{self.bucket_name}/processed/*",
-                        f"arn:aws:s3:::{self.bucket_name}/enriched/*",
-                        f"arn:aws:s3:::{self.bucket_name}/curated/*"
-                    ]
-                }
-            ]
-        }
-        
-        return self.create_iam_policy(policy_name, policy_document, 
+        return self.create_iam_policy(policy_name, self._data_engineer_policy_document, 
                                      "IAM policy for data engineers to access the data lake")
     
     def create_read_only_policy(self, policy_name: str = "DataLakeReadOnlyPolicy") -> Optional[str]:
@@ -446,37 +560,67 @@ class S3AccessControl:
         Returns:
             Optional[str]: Policy ARN if created successfully, None otherwise
         """
-        policy_document = {
+        return self.create_iam_policy(policy_name, self._read_only_policy_document, 
+                                     "IAM policy for read-only access to the curated zone")
+    
+    def _list_bucket_statement(self, prefixes: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """ListBucket statement of an IAM policy document, limited to prefixes if given."""
+        statement = {
+            "Sid": "ListBucket",
+            "Effect": "Allow",
+            "Action": "s3:ListBucket",
+            "Resource": self._bucket_arn
+        }
+        if prefixes:
+            statement["Condition"] = {"StringLike": {"s3:prefix": prefixes}}
+        return statement
+    
+    @staticmethod
+    def _object_statement(sid: str, actions: Sequence[str], resources: Sequence[str]) -> Dict[str, Any]:
+        """Statement of an IAM policy document allowing actions on objects."""
+        return {
+            "Sid": sid,
+            "Effect": "Allow",
+            "Action": actions,
+            "Resource": resources
+        }
+    
+    @functools.cached_property
+    def _data_scientist_policy_document(self) -> str:
+        """Serialized policy document of create_data_scientist_policy, built once per instance."""
+        zone_arns = self._zone_arns
+        return _dumps({
             "Version": "2012-10-17",
             "Statement": [
-                {
-                    "Sid": "ListBucket",
-                    "Effect": "Allow",
-                    "Action": "s3:ListBucket",
-                    "Resource": f"arn:aws:s3:::{self.bucket_name}",
-                    "Condition": {
-                        "StringLike": {
-                            "s3:prefix": [
-                                "curated/*"
-                            ]
-                        }
-                    }
-                },
-                {
-                    "Sid": "ReadAccess",
-                    "Effect": "Allow",
-                    "Action": [
-                        "s3:GetObject"
-                    ],
-                    "Resource": [
-                        f"arn:aws:s3:::{self.bucket_name}/curated/*"
-                    ]
-                }
+                self._list_bucket_statement(("processed/*", "enriched/*", "curated/*")),
+                self._object_statement("ReadAccess", _READ_ACTIONS,
+                                       (zone_arns['processed'], zone_arns['curated'])),
+                self._object_statement("WriteAccess", _WRITE_ACTIONS, (zone_arns['enriched'],))
             ]
-        }
-        
-        return self.create_iam_policy(policy_name, policy_document, 
-                                     "IAM policy for read-only access to the curated zone")
+        })
+    
+    @functools.cached_property
+    def _data_engineer_policy_document(self) -> str:
+        """Serialized policy document of create_data_engineer_policy, built once per instance."""
+        return _dumps({
+            "Version": "2012-10-17",
+            "Statement": [
+                self._list_bucket_statement(),
+                self._object_statement("ReadWriteAccess", _READ_WRITE_ACTIONS,
+                                       tuple(self._zone_arns[zone] for zone in ZONES))
+            ]
+        })
+    
+    @functools.cached_property
+    def _read_only_policy_document(self) -> str:
+        """Serialized policy document of create_read_only_policy, built once per instance."""
+        return _dumps({
+            "Version": "2012-10-17",
+            "Statement": [
+                self._list_bucket_statement(("curated/*",)),
+                self._object_statement("ReadAccess", _READ_ACTIONS, (self._zone_arns['curated'],))
+            ]
+        })
     
     def configure_public_website(self, index_document: str = "index.html", 
                                error_document: Optional[str] = None) -> bool:
@@ -504,16 +648,16 @@ class S3AccessControl:
                 WebsiteConfiguration=website_config
             )
             
-            logger.info(f"Website configuration enabled for bucket {self.bucket_name}")
+            logger.info("Website configuration enabled for bucket %s", self.bucket_name)
             
             # Get the website endpoint
             website_endpoint = f"{self.bucket_name}.s3-website-{self.region_name}.amazonaws.com"
-            logger.info(f"Website endpoint: http://{website_endpoint}")
+            logger.info("Website endpoint: http://%s", website_endpoint)
             
             return True
             
         except ClientError as e:
-            logger.error(f"Error configuring website: {str(e)}")
+            logger.error("Error configuring website: %s", e)
             return False
     
     def configure_cors(self, allowed_origins: List[str] = ["*"]) -> bool:
@@ -545,13 +689,41 @@ class S3AccessControl:
                 CORSConfiguration=cors_config
             )
             
-            logger.info(f"CORS configuration enabled for bucket {self.bucket_name}")
+            logger.info("CORS configuration enabled for bucket %s", self.bucket_name)
             return True
             
         except ClientError as e:
-            logger.error(f"Error configuring CORS: {str(e)}")
+            logger.error("Error configuring CORS: %s", e)
             return False
     
+    def bootstrap(self, *, kms_key_id: Optional[str] = None, cors_origins: Sequence[str] = ("*",),
+                  allow_public_read: bool = False) -> bool:
+        """
+        Apply the standard bucket setup: versioning, default encryption, CORS and the
+        default bucket policy. The four settings are independent, so they are applied
+        concurrently.
+        
+        Args:
+            kms_key_id (str, optional): KMS key ID for SSE-KMS encryption.
+                                       If None, uses AES256 (SSE-S3). Defaults to None.
+            cors_origins (Sequence[str], optional): List of allowed CORS origins. Defaults to ("*",).
+            allow_public_read (bool, optional): Whether to allow public read access. Defaults to False.
+        
+        Returns:
+            bool: True if all settings were applied successfully, False otherwise
+        """
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(self.enable_bucket_versioning),
+                executor.submit(self.enable_bucket_encryption, kms_key_id),
+                executor.submit(self.configure_cors, list(cors_origins)),
+                executor.submit(self.create_default_bucket_policy, allow_public_read)
+            ]
+            # Collect every result so one failure does not hide the others
+            results = [future.result() for future in as_completed(futures)]
+        
+        return all(results)
+    
     def add_lifecycle_rule(self, prefix: str, days_to_ia: Optional[int] = None, 
                           days_to_glacier: Optional[int] = None, days_to_expire: Optional[int] = None) -> bool:
         """
@@ -566,60 +738,77 @@ class S3AccessControl:
         Returns:
             bool: True if the rule was added successfully, False otherwise
         """
+        return self.apply_lifecycle_rules([
+            self._build_lifecycle_rule(prefix, days_to_ia, days_to_glacier, days_to_expire)
+        ])
+    
+    @staticmethod
+    def _build_lifecycle_rule(prefix: str, days_to_ia: Optional[int] = None, 
+                              days_to_glacier: Optional[int] = None,
+                              days_to_expire: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Build a lifecycle rule for a prefix without touching the bucket.
+        
+        Args:
+            prefix (str): Prefix for the objects (e.g. 'raw/')
+            days_to_ia (int, optional): Days until transition to IA storage. Defaults to None.
+            days_to_glacier (int, optional): Days until transition to Glacier. Defaults to None.
+            days_to_expire (int, optional): Days until expiration. Defaults to None.
+        
+        Returns:
+            Dict[str, Any]: The lifecycle rule, with ID 'Rule-<prefix>'
+        """
+        new_rule = {
+            'ID': f"Rule-{prefix.replace('/', '-')}",
+            'Status': 'Enabled',
+            'Filter': {
+                'Prefix': prefix
+            }
+        }
+        
+        # Add transitions; 0 days is a valid setting, so only None means "not set"
+        transitions = []
+        if days_to_ia is not None:
+            transitions.append({
+                'Days': days_to_ia,
+                'StorageClass': 'STANDARD_IA'
+            })
+        
+        if days_to_glacier is not None:
+            transitions.append({
+                'Days': days_to_glacier,
+                'StorageClass': 'GLACIER'
+            })
+        
+        if transitions:
+            new_rule['Transitions'] = transitions
+        
+        # Add expiration
+        if days_to_expire is not None:
+            new_rule['Expiration'] = {
+                'Days': days_to_expire
+            }
+        
+        return new_rule
+    
+    def apply_lifecycle_rules(self, rules: List[Dict[str, Any]]) -> bool:
+        """
+        Add lifecycle rules to the bucket with a single configuration update.
+        Existing rules with the same IDs are replaced; other rules are kept.
+        
+        Args:
+            rules (List[Dict[str, Any]]): Rules to add, e.g. from _build_lifecycle_rule
+        
+        Returns:
+            bool: True if the rules were added successfully, False otherwise
+        """
         try:
-            # Get the current lifecycle configuration
-            try:
-                response = self.s3.get_bucket_lifecycle_configuration(Bucket=self.bucket_name)
-                lifecycle_rules = response.get('Rules', [])
-            except ClientError as e:
-                if e.response['Error']['Code'] == 'NoSuchLifecycleConfiguration':
-                    lifecycle_rules = []
-                else:
-                    raise
-            
-            # Create the new rule
-            rule_id = f"Rule-{prefix.replace('/', '-')}"
-            
             # Remove any existing rule with the same ID
-            lifecycle_rules = [rule for rule in lifecycle_rules if rule.get('ID') != rule_id]
-            
-            new_rule = {
-                'ID': rule_id,
-                'Status': 'Enabled',
-                'Filter': {
-                    'Prefix': prefix
-                },
-                'Transitions': [],
-                'Expiration': {}
-            }
-            
-            # Add transitions
-            if days_to_ia:
-                new_rule['Transitions'].append({
-                    'Days': days_to_ia,
-                    'StorageClass': 'STANDARD_IA'
-                })
-            
-            if days_to_glacier:
-                new_rule['Transitions'].append({
-                    'Days': days_to_glacier,
-                    'StorageClass': 'GLACIER'
-                })
-            
-            # Add expiration
-            if days_to_expire:
-                new_rule['Expiration'] = {
-                    'Days': days_to_expire
-                }
-            else:
-                del new_rule['Expiration']
+            rule_ids = {rule['ID'] for rule in rules}
+            lifecycle_rules = [rule for rule in self._fetch_lifecycle_rules() if rule.get('ID') not in rule_ids]
             
-            # If no transitions, remove the key
-            if not new_rule['Transitions']:
-                del new_rule['Transitions']
-            
-            # Add the new rule
-            lifecycle_rules.append(new_rule)
+            # Add the new rules
+            lifecycle_rules.extend(rules)
             
             # Update the lifecycle configuration
             self.s3.put_bucket_lifecycle_configuration(
@@ -627,13 +816,20 @@ class S3AccessControl:
                 LifecycleConfiguration={'Rules': lifecycle_rules}
             )
             
-            logger.info(f"Lifecycle rule added for prefix {prefix}")
+            for rule in rules:
+                logger.info("Lifecycle rule added for prefix %s", rule['Filter']['Prefix'])
             return True
             
         except ClientError as e:
-            logger.error(f"Error adding lifecycle rule: {str(e)}")
+            logger.error("Error adding lifecycle rules: %s", e)
             return False
     
+    @_catch_client_error(frozenset({'NoSuchLifecycleConfiguration'}), default=())
+    def _fetch_lifecycle_rules(self) -> List[Dict[str, Any]]:
+        """Fetch the bucket's lifecycle rules; empty if it has no lifecycle configuration."""
+        response = self.s3.get_bucket_lifecycle_configuration(Bucket=self.bucket_name)
+        return response.get('Rules', [])
+    
     def setup_standard_lifecycle_rules(self) -> bool:
         """
         Set up standard lifecycle rules for the data lake zones.
@@ -641,20 +837,15 @@ class S3AccessControl:
         Returns:
             bool: True if all rules were added successfully, False otherwise
         """
-        success = True
-        
-        # Raw zone: Move to IA after 90 days, Glacier after 180 days
-        if not self.add_lifecycle_rule('raw/', days_to_ia=90, days_to_glacier=180):
-            success = False
-        
-        # Processed zone: Move to IA after 60 days, Glacier after 120 days
-        if not self.add_lifecycle_rule('processed/', days_to_ia=60, days_to_glacier=120):
-            success = False
-        
-        # Enriched zone: Move to IA after 30 days
-        if not self.add_lifecycle_rule('enriched/', days_to_ia=30):
-            success = False
-        
-        # Curated zone: No automatic transitions
-        
-        return success
\ No newline at end of file
+        return self.apply_lifecycle_rules([
+            # Raw zone: Move to IA after 90 days, Glacier after 180 days
+            self._build_lifecycle_rule('raw/', days_to_ia=90, days_to_glacier=180),
+            
+            # Processed zone: Move to IA after 60 days, Glacier after 120 days
+            self._build_lifecycle_rule('processed/', days_to_ia=60, days_to_glacier=120),
+            
+            # Enriched zone: Move to IA after 30 days
+            self._build_lifecycle_rule('enriched/', days_to_ia=30)
+            
+            # Curated zone: No automatic transitions
+        ])
\ No newline at end of file
@@ -0,0 +1,137 @@
+"""
+Local upload cache for the AI Knowledge Manager.
+
+This module provides the UploadCache class, a small SQLite database recording which
+local files have been uploaded to which S3 keys. It lets bulk uploads skip files
+that are unchanged since their last upload:
+- File size and modification time tell whether a cached ETag is still valid
+- compute_etag reproduces the ETag S3 assigns to single-part and multipart uploads
+"""
+
+import os
+import hashlib
+import sqlite3
+import threading
+
+# Default location of the cache database, next to the default configuration file
+DEFAULT_UPLOAD_CACHE_PATH = os.path.join('config', 'upload_cache.sqlite')
+
+# S3 multipart limits, mirrored from boto3's chunk size adjustment
+MAX_PARTS = 10000
+MIN_PART_SIZE = 5 * 1024 * 1024
+MAX_PART_SIZE = 5 * 1024 * 1024 * 1024
+
+# Read size when hashing files
+HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def compute_etag(file_path, multipart_threshold, multipart_chunksize):
+    """
+    Compute the ETag S3 assigns to a file uploaded with boto3's managed transfer.
+    Files below the multipart threshold get the MD5 of their content; larger files get
+    the MD5 of the concatenated part digests followed by the part count. Objects
+    encrypted with SSE-KMS have other ETags and simply never match.
+    
+    Args:
+        file_path (str): Path to the local file
+        multipart_threshold (int): Size in bytes from which uploads are multipart
+        multipart_chunksize (int): Requested multipart part size in bytes
+    
+    Returns:
+        str: ETag without surrounding quotes
+    """
+    size = os.path.getsize(file_path)
+    
+    with open(file_path, 'rb') as f:
+        if size < multipart_threshold:
+            digest = hashlib.md5()
+            for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+                digest.update(block)
+            return digest.hexdigest()
+        
+        # Adjust the part size the same way the transfer manager does: double it until
+        # the part count fits, then clamp it to the S3 part size limits
+        part_size = multipart_chunksize
+        while -(-size // part_size) > MAX_PARTS:
+            part_size *= 2
+        part_size = min(max(part_size, MIN_PART_SIZE), MAX_PART_SIZE)
+        
+        part_digests = [hashlib.md5(part).digest() for part in iter(lambda: f.read(part_size), b'')]
+    
+    return f"{hashlib.md5(b''.join(part_digests)).hexdigest()}-{len(part_digests)}"
+
+
+class UploadCache:
+    """
+    SQLite-backed record of uploaded files.
+    
+    Each entry maps a local path and the S3 key it was uploaded to onto the file's size,
+    modification time and ETag at upload time. The cache is safe to share between the
+    threads of a bulk upload.
+    """
+    
+    def __init__(self, cache_path=None):
+        """
+        Open (and create if needed) the cache database.
+        
+        Args:
+            cache_path (str, optional): Path to the SQLite database.
+                                        Defaults to DEFAULT_UPLOAD_CACHE_PATH.
+        """
+        self.cache_path = cache_path or DEFAULT_UPLOAD_CACHE_PATH
+        cache_dir = os.path.dirname(self.cache_path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS uploads ("
+                "local_path TEXT NOT NULL, s3_key TEXT NOT NULL, size INTEGER NOT NULL, "
+                "mtime_ns INTEGER NOT NULL, etag TEXT NOT NULL, "
+                "PRIMARY KEY (local_path, s3_key))"
+            )
+    
+    def get_etag(self, local_path, s3_key, stat):
+        """
+        Get the cached ETag of a file if it has not changed since it was recorded.
+        
+        Args:
+            local_path (str): Path to the local file
+            s3_key (str): Full S3 key the file is uploaded to
+            stat (os.stat_result): Current stat of the file
+        
+        Returns:
+            str: Cached ETag or None if there is no entry or the file changed
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size, mtime_ns, etag FROM uploads WHERE local_path = ? AND s3_key = ?",
+                (local_path, s3_key)
+            ).fetchone()
+        
+        if row and row[0] == stat.st_size and row[1] == stat.st_mtime_ns:
+            return row[2]
+        return None
+    
+    def put(self, local_path, s3_key, stat, etag):
+        """
+        Record the ETag of an uploaded file.
+        
+        Args:
+            local_path (str): Path to the local file
+            s3_key (str): Full S3 key the file was uploaded to
+            stat (os.stat_result): Stat of the file taken before it was hashed
+            etag (str): ETag of the uploaded content
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO uploads (local_path, s3_key, size, mtime_ns, etag) VALUES (?, ?, ?, ?, ?)",
+                (local_path, s3_key, stat.st_size, stat.st_mtime_ns, etag)
+            )
+    
+    def close(self):
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
@@ -1,5 +1,3 @@
-# Write the test file
-cat > tests/test_data_lake.py << 'EOF'
 """
 Unit tests for the S3 Data Lake implementation.
 
@@ -8,8 +6,12 @@ and the S3AccessControl classes.
 """
 
 import os
+import json
+import asyncio
+import tempfile
 import unittest
-from unittest.mock import patch, MagicMock
+from datetime import datetime
+from unittest.mock import patch, MagicMock, AsyncMock
 import boto3
 from botocore.exceptions import ClientError
 
@@ -18,36 +20,75 @@ from src.data_ingestion.file_utils import S3FileUtils
 from src.data_ingestion.data_lake_interface import DataLakeInterface
 from src.data_ingestion.s3_access_control import S3AccessControl
 
+def mock_async_client(uploaded):
+    """
+    Mock S3DataLake.async_client; the returned client records uploaded buffers by key.
+    
+    Returns:
+        tuple: (async_client mock, aioboto3 client mock)
+    """
+    client = MagicMock()
+    client.upload_file = AsyncMock()
+    client.upload_fileobj = AsyncMock(
+        side_effect=lambda fileobj, bucket, key, **kwargs: uploaded.__setitem__(key, fileobj.read()))
+    client.get_object = AsyncMock()
+    
+    context = MagicMock()
+    context.__aenter__.return_value = client
+    return MagicMock(return_value=context), client
+
 class TestS3DataLake(unittest.TestCase):
     """Test cases for the S3DataLake class."""
     
-    def setUp(self):
-        """Set up test environment."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up the boto3 session mock shared by all tests."""
         # Mock the boto3 session and clients
-        self.mock_session_patcher = patch('boto3.Session')
-        self.mock_session = self.mock_session_patcher.start()
+        cls.mock_session_patcher = patch('boto3.Session')
+        cls.mock_session = cls.mock_session_patcher.start()
         
         # Mock S3 client
-        self.mock_s3 = MagicMock()
-        self.mock_session.return_value.client.return_value = self.mock_s3
-        self.mock_session.return_value.resource.return_value = MagicMock()
+        cls.mock_s3 = MagicMock()
+        cls.mock_session.return_value.client.return_value = cls.mock_s3
+        cls.mock_session.return_value.resource.return_value = MagicMock()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up after all tests."""
+        cls.mock_session_patcher.stop()
+    
+    def setUp(self):
+        """Set up test environment."""
+        # Forget calls and canned responses of the previous test
+        self.mock_s3.reset_mock(return_value=True, side_effect=True)
         
         # Create a test instance
         self.data_lake = S3DataLake('test-bucket')
     
-    def tearDown(self):
-        """Clean up after tests."""
-        self.mock_session_patcher.stop()
-    
     def test_ensure_data_lake_exists(self):
         """Test _ensure_data_lake_exists method."""
-        # Mock head_bucket response
+        # Mock head_bucket response for an existing bucket
         self.mock_s3.head_bucket.return_value = {}
+        self.mock_s3.put_object.reset_mock()
         
         # Call the method
         self.data_lake._ensure_data_lake_exists()
         
-        # Assert that put_object was called for each zone
+        # Assert that no zone markers were re-created
+        self.mock_s3.put_object.assert_not_called()
+    
+    def test_ensure_data_lake_exists_new_bucket(self):
+        """Test _ensure_data_lake_exists method when the bucket is missing."""
+        # Mock head_bucket response for a missing bucket
+        self.mock_s3.head_bucket.side_effect = ClientError(
+            {'Error': {'Code': '404', 'Message': 'Not Found'}}, 'HeadBucket')
+        self.mock_s3.put_object.reset_mock()
+        
+        # Call the method
+        self.data_lake._ensure_data_lake_exists()
+        
+        # Assert that the bucket was created and put_object was called for each zone
+        self.mock_s3.create_bucket.assert_called_once_with(Bucket='test-bucket')
         self.assertEqual(self.mock_s3.put_object.call_count, 4)
 
     def test_upload_file(self):
@@ -69,7 +110,7 @@ class TestS3DataLake(unittest.TestCase):
         mock_paginator.paginate.return_value = [
             {
                 'Contents': [
-                    {'Key': 'raw/file1.txt', 'Size': 100, 'LastModified': '2023-01-01'}
+                    {'Key': 'raw/file1.txt', 'Size': 100, 'LastModified': datetime(2023, 1, 1)}
                 ]
             }
         ]
@@ -80,8 +121,569 @@ class TestS3DataLake(unittest.TestCase):
         # Assert result contains expected files
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]['key'], 'raw/file1.txt')
+        self.assertEqual(result[0]['last_modified'], '2023-01-01 00:00:00')
+        self.assertEqual(result[0]['zone'], 'raw')
+    
+    def test_download_file(self):
+        """Test download_file writes the downloaded content to the local path."""
+        self.mock_s3.download_fileobj.side_effect = lambda bucket, key, f, Config=None: f.write(b'new')
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            local_path = os.path.join(temp_dir, 'nested', 'file1.txt')
+            self.assertTrue(self.data_lake.download_file('raw/file1.txt', local_path))
+            
+            # Assert the file was written and no temporary file remains
+            with open(local_path, 'rb') as f:
+                self.assertEqual(f.read(), b'new')
+            self.assertEqual(os.listdir(os.path.dirname(local_path)), ['file1.txt'])
+    
+    def test_download_file_error_keeps_existing_file(self):
+        """Test a failed download_file leaves an existing local file untouched."""
+        self.mock_s3.download_fileobj.side_effect = ClientError(
+            {'Error': {'Code': '404', 'Message': 'Not Found'}}, 'HeadObject')
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            local_path = os.path.join(temp_dir, 'file1.txt')
+            with open(local_path, 'wb') as f:
+                f.write(b'old')
+            
+            self.assertFalse(self.data_lake.download_file('raw/file1.txt', local_path))
+            
+            # Assert the existing file was kept and the temporary file removed
+            with open(local_path, 'rb') as f:
+                self.assertEqual(f.read(), b'old')
+            self.assertEqual(os.listdir(temp_dir), ['file1.txt'])
+    
+    def test_delete_files_batches(self):
+        """Test delete_files sends at most 1000 keys per DeleteObjects request."""
+        self.mock_s3.delete_objects.return_value = {}
+        keys = [f"raw/{i}.bin" for i in range(2500)]
+        
+        results = self.data_lake.delete_files(keys)
+        
+        # Assert the keys were split into three quiet batches and all deleted
+        batches = [call.kwargs['Delete'] for call in self.mock_s3.delete_objects.call_args_list]
+        self.assertEqual(sorted(len(batch['Objects']) for batch in batches), [500, 1000, 1000])
+        self.assertTrue(all(batch['Quiet'] for batch in batches))
+        self.assertEqual(sorted(key['Key'] for batch in batches for key in batch['Objects']), sorted(keys))
+        self.assertEqual(results, dict.fromkeys(keys, True))
+    
+    def test_delete_files_errors(self):
+        """Test delete_files reports the keys DeleteObjects could not delete."""
+        self.mock_s3.delete_objects.return_value = {
+            'Errors': [{'Key': 'raw/b.bin', 'Code': 'AccessDenied', 'Message': 'Access Denied'}]
+        }
+        
+        results = self.data_lake.delete_files(['raw/a.bin', 'raw/b.bin'])
+        
+        # Assert only the reported key failed
+        self.assertEqual(results, {'raw/a.bin': True, 'raw/b.bin': False})
+        
+        # Assert a failed request marks its whole batch as failed
+        self.mock_s3.delete_objects.side_effect = ClientError(
+            {'Error': {'Code': 'AccessDenied', 'Message': 'Access Denied'}}, 'DeleteObjects')
+        self.assertEqual(self.data_lake.delete_files(['raw/a.bin', 'raw/b.bin']),
+                         {'raw/a.bin': False, 'raw/b.bin': False})
+        
+        # Assert nothing is sent for no keys
+        self.mock_s3.delete_objects.reset_mock()
+        self.assertEqual(self.data_lake.delete_files([]), {})
+        self.mock_s3.delete_objects.assert_not_called()
+    
+    def test_move_file_onto_itself(self):
+        """Test move_file refuses to move a file onto itself."""
+        result = self.data_lake.move_file('raw/x.bin', 'raw')
+        
+        # Assert nothing was copied or deleted
+        self.assertFalse(result)
+        self.mock_s3.copy_object.assert_not_called()
+        self.mock_s3.delete_objects.assert_not_called()
+    
+    def test_move_file_large_object(self):
+        """Test move_file falls back to a multipart copy only for objects over 5 GiB."""
+        self.mock_s3.copy_object.side_effect = ClientError(
+            {'Error': {'Code': 'InvalidRequest', 'Message': 'The specified copy source is larger than '
+                       'the maximum allowable size for a copy source: 5368709120'}}, 'CopyObject')
+        self.mock_s3.delete_objects.return_value = {}
+        
+        self.assertTrue(self.data_lake.move_file('raw/big.bin', 'processed'))
+        
+        # Assert the managed copy was used and the source removed afterwards
+        self.mock_s3.copy.assert_called_once()
+        self.mock_s3.head_object.assert_not_called()
+        self.mock_s3.delete_objects.assert_called_once()
+    
+    def test_move_file_invalid_request(self):
+        """Test move_file keeps the source when a copy fails for another reason."""
+        self.mock_s3.copy_object.side_effect = ClientError(
+            {'Error': {'Code': 'InvalidRequest', 'Message': 'This copy request is illegal'}}, 'CopyObject')
+        
+        self.assertFalse(self.data_lake.move_file('raw/x.bin', 'processed'))
+        
+        # Assert there was no fallback copy and nothing was deleted
+        self.mock_s3.copy.assert_not_called()
+        self.mock_s3.delete_objects.assert_not_called()
+    
+    def test_move_files(self):
+        """Test move_files only deletes the sources that were copied."""
+        def copy_object(CopySource, Bucket, Key, **kwargs):
+            if CopySource['Key'] == 'raw/b.bin':
+                raise ClientError({'Error': {'Code': 'NoSuchKey', 'Message': 'Not Found'}}, 'CopyObject')
+        self.mock_s3.copy_object.side_effect = copy_object
+        self.mock_s3.delete_objects.return_value = {}
+        
+        results = self.data_lake.move_files([
+            ('raw/a.bin', 'processed', None),
+            ('raw/b.bin', 'processed', None),
+            ('raw/c.bin', 'archive', None),
+            ('raw/d.bin', 'curated', 'renamed/d.bin')
+        ])
+        
+        # Assert the failed copy and the invalid zone are reported
+        self.assertEqual(results, {'raw/a.bin': True, 'raw/b.bin': False, 'raw/c.bin': False, 'raw/d.bin': True})
+        
+        # Assert the valid moves were copied to their target keys
+        targets = sorted(call.kwargs['Key'] for call in self.mock_s3.copy_object.call_args_list)
+        self.assertEqual(targets, ['curated/renamed/d.bin', 'processed/a.bin', 'processed/b.bin'])
+        
+        # Assert a single delete request removed only the copied sources
+        self.mock_s3.delete_objects.assert_called_once()
+        deleted = self.mock_s3.delete_objects.call_args.kwargs['Delete']['Objects']
+        self.assertEqual(sorted(key['Key'] for key in deleted), ['raw/a.bin', 'raw/d.bin'])
+    
+    def test_move_files_invalid_zone(self):
+        """Test move_files rejects unknown target zones without touching S3."""
+        self.assertEqual(self.data_lake.move_files([('raw/a.bin', 'archive', None)]), {'raw/a.bin': False})
+        
+        # Assert nothing was copied or deleted
+        self.mock_s3.copy_object.assert_not_called()
+        self.mock_s3.delete_objects.assert_not_called()
+    
+    def _listed_file(self, last_modified):
+        """File information as list_files returns it for raw/file1.txt."""
+        return {'key': 'raw/file1.txt', 'size': 100, 'last_modified': last_modified,
+                'zone': 'raw', 'etag': 'abc'}
+    
+    def _index_response(self, entries):
+        """get_object response for a metadata index holding entries."""
+        body = MagicMock()
+        body.read.return_value = json.dumps(entries).encode('utf-8')
+        return {'Body': body, 'ETag': '"index-1"'}
+    
+    def _head_response(self, metadata):
+        """head_object response for raw/file1.txt with user metadata."""
+        return {'ContentLength': 100, 'LastModified': datetime(2023, 1, 2), 'ETag': '"abc"',
+                'ContentType': 'text/plain', 'Metadata': metadata}
+    
+    def test_get_metadata_index_fresh_entry(self):
+        """Test get_metadata_index reuses an index entry for an unchanged file."""
+        self.data_lake = S3DataLake('test-bucket', persist_metadata_index=True)
+        self.mock_s3.get_object.return_value = self._index_response({
+            'raw/file1.txt': {'etag': 'abc', 'last_modified': '2023-01-01 00:00:00',
+                              'metadata': {'source': 'crm'}}
+        })
+        
+        result = self.data_lake.get_metadata_index('raw', [self._listed_file('2023-01-01 00:00:00')])
+        
+        # Assert the entry was used without a HEAD request or an index write
+        self.assertEqual(result, {'raw/file1.txt': {'source': 'crm'}})
+        self.mock_s3.head_object.assert_not_called()
+        self.mock_s3.put_object.assert_not_called()
+    
+    def test_get_metadata_index_metadata_update(self):
+        """Test get_metadata_index refreshes an entry whose metadata was replaced in place."""
+        self.data_lake = S3DataLake('test-bucket', persist_metadata_index=True)
+        # A metadata update keeps the ETag but changes the modification time
+        self.mock_s3.get_object.return_value = self._index_response({
+            'raw/file1.txt': {'etag': 'abc', 'last_modified': '2023-01-01 00:00:00',
+                              'metadata': {'source': 'crm'}}
+        })
+        self.mock_s3.head_object.return_value = self._head_response({'source': 'erp'})
+        self.mock_s3.put_object.return_value = {'ETag': '"index-2"'}
+        
+        result = self.data_lake.get_metadata_index('raw', [self._listed_file('2023-01-02 00:00:00')])
+        
+        # Assert the file was read again and the index rewritten with the listed values
+        self.assertEqual(result, {'raw/file1.txt': {'source': 'erp'}})
+        self.mock_s3.head_object.assert_called_once()
+        self.assertEqual(self.mock_s3.put_object.call_args[1]['Key'], '.metadata-index/raw.json')
+        saved = json.loads(self.mock_s3.put_object.call_args[1]['Body'])
+        self.assertEqual(saved['raw/file1.txt']['last_modified'], '2023-01-02 00:00:00')
+    
+    def test_get_metadata_index_read_only(self):
+        """Test get_metadata_index keeps the index in memory when it cannot be written."""
+        self.data_lake = S3DataLake('test-bucket', persist_metadata_index=True)
+        self.mock_s3.get_object.side_effect = ClientError(
+            {'Error': {'Code': 'NoSuchKey', 'Message': 'Not Found'}}, 'GetObject')
+        self.mock_s3.head_object.return_value = self._head_response({'source': 'crm'})
+        self.mock_s3.put_object.side_effect = ClientError(
+            {'Error': {'Code': 'AccessDenied', 'Message': 'Access Denied'}}, 'PutObject')
+        files = [self._listed_file('2023-01-02 00:00:00')]
+        
+        # Search twice
+        self.data_lake.get_metadata_index('raw', files)
+        result = self.data_lake.get_metadata_index('raw', files)
+        
+        # Assert the write was tried once and the second search needed no HEAD request
+        self.assertEqual(result, {'raw/file1.txt': {'source': 'crm'}})
+        self.mock_s3.head_object.assert_called_once()
+        self.mock_s3.put_object.assert_called_once()
+    
+    def test_get_metadata_index_in_memory(self):
+        """Test get_metadata_index keeps the index in memory by default."""
+        self.mock_s3.head_object.return_value = self._head_response({'source': 'crm'})
+        files = [self._listed_file('2023-01-02 00:00:00')]
+        
+        # Search twice
+        self.data_lake.get_metadata_index('raw', files)
+        result = self.data_lake.get_metadata_index('raw', files)
+        
+        # Assert the bucket holds no index and the second search needed no HEAD request
+        self.assertEqual(result, {'raw/file1.txt': {'source': 'crm'}})
+        self.mock_s3.get_object.assert_not_called()
+        self.mock_s3.put_object.assert_not_called()
+        self.mock_s3.head_object.assert_called_once()
+    
+    def test_update_file_metadata_invalidates_cache(self):
+        """Test update_file_metadata drops the cached metadata of the file."""
+        self.mock_s3.head_object.return_value = self._head_response({'source': 'crm'})
+        self.data_lake.get_file_metadata('raw/file1.txt')
+        
+        # Update the metadata, then read it again
+        self.assertTrue(self.data_lake.update_file_metadata('raw/file1.txt', {'source': 'erp'}))
+        self.data_lake.get_file_metadata('raw/file1.txt')
+        
+        # Assert the second read went back to S3
+        self.assertEqual(self.mock_s3.head_object.call_count, 2)
+
+class TestDataLakeInterface(unittest.TestCase):
+    """Test cases for the DataLakeInterface class."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up the boto3 session mock shared by all tests."""
+        cls.mock_session_patcher = patch('boto3.Session')
+        cls.mock_session = cls.mock_session_patcher.start()
+        
+        # Mock S3 client
+        cls.mock_s3 = MagicMock()
+        cls.mock_session.return_value.client.return_value = cls.mock_s3
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up after all tests."""
+        cls.mock_session_patcher.stop()
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.mock_s3.reset_mock(return_value=True, side_effect=True)
+        self.temp_dir = tempfile.TemporaryDirectory()
+        
+        # Write the default config and the utilities' temp directory to the test directory
+        with patch('os.getcwd', return_value=self.temp_dir.name):
+            self.interface = DataLakeInterface(os.path.join(self.temp_dir.name, 's3_config.json'))
+        
+        self.uploaded = {}
+        self.interface.data_lake.async_client, self.client = mock_async_client(self.uploaded)
+        
+        self.csv_path = os.path.join(self.temp_dir.name, 'a.csv')
+        with open(self.csv_path, 'w') as f:
+            f.write('x,y\n1,2\n3,4\n')
+    
+    def tearDown(self):
+        """Clean up after tests."""
+        self.temp_dir.cleanup()
+    
+    @staticmethod
+    def _keep_large(df):
+        """Pipeline step keeping the rows with x above 1."""
+        return df[df.x > 1]
+    
+    @staticmethod
+    def _double(df):
+        """Pipeline step doubling y."""
+        return df.assign(y=df.y * 2)
+    
+    def test_process_data_pipeline_async_local_input(self):
+        """Test process_data_pipeline_async uploads a local input and every checkpoint."""
+        results = asyncio.run(self.interface.process_data_pipeline_async(
+            [self.csv_path], [self._keep_large, self._double]))
+        
+        # Assert the input went to the raw zone as a file
+        self.client.upload_file.assert_called_once()
+        self.assertEqual(self.client.upload_file.call_args.args,
+                         (self.csv_path, self.interface.data_lake.bucket_name, 'raw/a.csv'))
+        
+        # Assert both steps were uploaded as buffers and the curated key is the result
+        self.assertEqual(sorted(key.split('/')[0] for key in self.uploaded), ['curated', 'processed'])
+        self.assertEqual(len(results), 1)
+        self.assertTrue(results[0].startswith('curated/a_1_'))
+        self.assertEqual(self.uploaded[results[0]].decode().splitlines(), ['x,y', '3,8'])
+    
+    def test_process_data_pipeline_async_s3_input(self):
+        """Test process_data_pipeline_async parses an S3 input and uploads only the final step."""
+        body = MagicMock()
+        body.__aenter__.return_value.read = AsyncMock(return_value=b'x,y\n1,2\n3,4\n')
+        self.client.get_object.return_value = {'Body': body}
+        
+        results = asyncio.run(self.interface.process_data_pipeline_async(
+            ['processed/b.csv'], [self._keep_large, self._double], checkpoint_every=None))
+        
+        # Assert the input was read from S3 and not uploaded again
+        self.client.get_object.assert_called_once_with(
+            Bucket=self.interface.data_lake.bucket_name, Key='processed/b.csv')
+        self.client.upload_file.assert_not_called()
+        
+        # Assert only the final step was uploaded
+        self.assertEqual(list(self.uploaded), results)
+        self.assertTrue(results[0].startswith('curated/b_1_'))
+        self.assertEqual(self.uploaded[results[0]].decode().splitlines(), ['x,y', '3,8'])
+    
+    def test_bulk_upload(self):
+        """Test bulk_upload walks nested directories and skips unreadable ones."""
+        source_dir = os.path.join(self.temp_dir.name, 'upload')
+        for rel_path in ('a.txt', 'sub/b.txt', 'sub/deeper/c.txt', 'locked/d.txt'):
+            path = os.path.join(source_dir, *rel_path.split('/'))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write('text\n')
+        
+        locked_dir = os.path.join(source_dir, 'locked')
+        scandir = os.scandir
+        def scandir_denying_locked(path):
+            if path == locked_dir:
+                raise PermissionError(13, 'Permission denied', path)
+            return scandir(path)
+        
+        with patch.object(self.interface.data_lake, 'upload_file', return_value=True) as upload_file, \
+                patch('os.scandir', side_effect=scandir_denying_locked):
+            uploaded = self.interface.bulk_upload(source_dir, zone='processed')
+        
+        # Assert the readable files were uploaded under their relative paths
+        self.assertEqual(sorted(uploaded), ['processed/a.txt', 'processed/sub/b.txt', 'processed/sub/deeper/c.txt'])
+        self.assertEqual(sorted(call.args[2] for call in upload_file.call_args_list),
+                         ['a.txt', 'sub/b.txt', 'sub/deeper/c.txt'])
+        
+        # Assert a non-recursive upload stays in the top directory
+        with patch.object(self.interface.data_lake, 'upload_file', return_value=True):
+            self.assertEqual(self.interface.bulk_upload(source_dir, recursive=False), ['raw/a.txt'])
+    
+    def test_bulk_download(self):
+        """Test bulk_download creates nested local directories before the workers download."""
+        keys = ['processed/reports/2024/q1/a.csv', 'processed/reports/b.csv']
+        downloads = []
+        def download_file(s3_key, local_path, create_dirs=True):
+            # Workers are told to skip makedirs, so the directory must already exist
+            downloads.append((s3_key, os.path.relpath(local_path, target_dir), create_dirs,
+                              os.path.isdir(os.path.dirname(local_path))))
+            return True
+        
+        with patch.object(self.interface.data_lake, 'iter_files', return_value=[{'key': key} for key in keys]), \
+                patch.object(self.interface.data_lake, 'download_file', side_effect=download_file):
+            # Assert the prefix is stripped from the local paths
+            target_dir = os.path.join(self.temp_dir.name, 'with_prefix')
+            self.assertEqual(self.interface.bulk_download('processed/reports', target_dir), 2)
+            self.assertEqual(sorted(downloads), [
+                ('processed/reports/2024/q1/a.csv', os.path.join('2024', 'q1', 'a.csv'), False, True),
+                ('processed/reports/b.csv', 'b.csv', False, True)
+            ])
+            
+            # Assert the full keys are kept without a prefix
+            downloads.clear()
+            target_dir = os.path.join(self.temp_dir.name, 'without_prefix')
+            self.assertEqual(self.interface.bulk_download('', target_dir), 2)
+            self.assertEqual(sorted(downloads), [
+                ('processed/reports/2024/q1/a.csv', os.path.join('processed', 'reports', '2024', 'q1', 'a.csv'),
+                 False, True),
+                ('processed/reports/b.csv', os.path.join('processed', 'reports', 'b.csv'), False, True)
+            ])
+            
+            # Assert flattening keeps only the file names
+            downloads.clear()
+            target_dir = os.path.join(self.temp_dir.name, 'flat')
+            self.assertEqual(self.interface.bulk_download('processed/reports', target_dir, flatten=True), 2)
+            self.assertEqual(sorted(download[1] for download in downloads), ['a.csv', 'b.csv'])
+
+class TestS3FileUtils(unittest.TestCase):
+    """Test cases for the S3FileUtils class."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        
+        # Keep the utilities' temp directory out of the working directory
+        with patch('os.getcwd', return_value=self.temp_dir.name):
+            self.file_utils = S3FileUtils(MagicMock())
+        
+        self.csv_path = os.path.join(self.temp_dir.name, 'a.csv')
+        with open(self.csv_path, 'w') as f:
+            f.write('x,y\n1,2\n3,4\n')
+    
+    def tearDown(self):
+        """Clean up after tests."""
+        self.temp_dir.cleanup()
+    
+    def test_save_parsed_csv_as_json(self):
+        """Test saving a parsed CSV file as JSON writes its records."""
+        content, _ = self.file_utils.parse_local(self.csv_path)
+        json_path = os.path.join(self.temp_dir.name, 'c.json')
+        
+        self.assertTrue(self.file_utils.save_local(content, json_path))
+        
+        # Assert the JSON file holds one object per row
+        with open(json_path) as f:
+            self.assertEqual(json.load(f), [{'x': 1, 'y': 2}, {'x': 3, 'y': 4}])
+    
+    def test_save_parsed_csv_as_yaml(self):
+        """Test saving a parsed CSV file as YAML writes its records."""
+        content, _ = self.file_utils.parse_local(self.csv_path)
+        yaml_path = os.path.join(self.temp_dir.name, 'c.yaml')
+        
+        self.assertTrue(self.file_utils.save_local(content, yaml_path))
+        
+        # Assert the YAML file parses back to the records
+        parsed, _ = self.file_utils.parse_local(yaml_path)
+        self.assertEqual(parsed, [{'x': 1, 'y': 2}, {'x': 3, 'y': 4}])
+
+    def test_tsv_round_trip(self):
+        """Test a TSV file keeps its columns when parsed, saved and parsed again."""
+        tsv_path = os.path.join(self.temp_dir.name, 'a.tsv')
+        with open(tsv_path, 'w') as f:
+            f.write('x\ty\n1\t2\n3\t4\n')
+        
+        content, _ = self.file_utils.parse_local(tsv_path)
+        saved_path = os.path.join(self.temp_dir.name, 'b.tsv')
+        self.assertTrue(self.file_utils.save_local(content, saved_path))
+        
+        # Assert the saved file is tab separated and its header is read as such
+        with open(saved_path) as f:
+            self.assertEqual(f.readline(), 'x\ty\n')
+        self.assertEqual(self.file_utils.parse_local(saved_path)[0].columns.tolist(), ['x', 'y'])
+        self.assertEqual(self.file_utils.extract_metadata(saved_path)['columns'], ['x', 'y'])
+
+    def test_save_and_upload_excel(self):
+        """Test save_and_upload writes XLSX content and refuses legacy .xls outputs."""
+        content, _ = self.file_utils.parse_local(self.csv_path)
+        uploaded = []
+        self.file_utils.s3_data_lake.upload_fileobj.side_effect = (
+            lambda fileobj, zone, path, metadata: uploaded.append(fileobj.read()) or True)
+        
+        # Assert the .xlsx output is an XLSX (zip) file
+        self.assertEqual(self.file_utils.save_and_upload(content, 'c.xlsx'), 'processed/c.xlsx')
+        self.assertTrue(uploaded[0].startswith(b'PK'))
+        
+        # Assert nothing is uploaded under an .xls name
+        self.assertIsNone(self.file_utils.save_and_upload(content, 'c.xls'))
+        self.assertEqual(len(uploaded), 1)
+    
+    def test_batch_process_files_async(self):
+        """Test batch_process_files_async uploads processed files and skips unsupported ones."""
+        data_lake = self.file_utils.s3_data_lake
+        data_lake.zones = ['raw', 'processed', 'enriched', 'curated']
+        data_lake.bucket_name = 'test-bucket'
+        uploaded = {}
+        data_lake.async_client, client = mock_async_client(uploaded)
+        
+        bin_path = os.path.join(self.temp_dir.name, 'b.bin')
+        with open(bin_path, 'wb') as f:
+            f.write(b'\x00')
+        
+        results = asyncio.run(self.file_utils.batch_process_files_async(
+            [self.csv_path, bin_path], process_func=lambda df: df[df.x > 1]))
+        
+        # Assert the CSV file was processed and uploaded; the binary file was skipped
+        self.assertEqual(results, {self.csv_path: 'processed/a.csv'})
+        self.assertEqual(uploaded['processed/a.csv'].decode().splitlines(), ['x,y', '3,4'])
+        self.assertIn('columns', client.upload_fileobj.call_args.kwargs['ExtraArgs']['Metadata'])
+        data_lake.invalidate_cache.assert_called_once_with('processed/a.csv')
+    
+    def test_batch_process_files_async_invalid_zone(self):
+        """Test batch_process_files_async rejects unknown zones without opening a client."""
+        self.file_utils.s3_data_lake.zones = ['raw', 'processed']
+        
+        self.assertEqual(asyncio.run(self.file_utils.batch_process_files_async([self.csv_path], 'archive')), {})
+        self.file_utils.s3_data_lake.async_client.assert_not_called()
+
+class TestS3AccessControl(unittest.TestCase):
+    """Test cases for the S3AccessControl class."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up the boto3 session mock shared by all tests."""
+        cls.mock_session_patcher = patch('boto3.Session')
+        cls.mock_session = cls.mock_session_patcher.start()
+        
+        # Mock S3 client; IAM and KMS get the same mock
+        cls.mock_s3 = MagicMock()
+        cls.mock_session.return_value.client.return_value = cls.mock_s3
+        
+        # Drop sessions cached by earlier tests, which hold other mocks
+        S3AccessControl.cache_clear()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up after all tests."""
+        S3AccessControl.cache_clear()
+        cls.mock_session_patcher.stop()
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.mock_s3.reset_mock(return_value=True, side_effect=True)
+        self.access_control = S3AccessControl('test-bucket')
+    
+    def test_create_default_bucket_policy(self):
+        """Test create_default_bucket_policy method."""
+        result = self.access_control.create_default_bucket_policy(allow_public_read=True)
+        
+        # Assert the policy was set with the public read statement for the curated zone
+        self.assertTrue(result)
+        policy = json.loads(self.mock_s3.put_bucket_policy.call_args[1]['Policy'])
+        self.assertEqual([stmt['Sid'] for stmt in policy['Statement']],
+                         ['DenyUnencryptedObjectUploads', 'DenyHTTP', 'AllowPublicRead'])
+        self.assertEqual(policy['Statement'][2]['Resource'], 'arn:aws:s3:::test-bucket/curated/*')
+    
+    def test_create_role_based_access_policy(self):
+        """Test create_role_based_access_policy method replaces the role's statements."""
+        role_arn = 'arn:aws:iam::123456789012:role/analyst'
+        self.mock_s3.get_bucket_policy.side_effect = ClientError(
+            {'Error': {'Code': 'NoSuchBucketPolicy', 'Message': 'Not Found'}}, 'GetBucketPolicy')
+        
+        # Call the method twice; the second call works on the cached policy
+        self.assertTrue(self.access_control.create_role_based_access_policy(role_arn, ['raw'], []))
+        self.assertTrue(self.access_control.create_role_based_access_policy(role_arn, ['curated'], ['curated']))
+        
+        # Assert the policy was fetched once and only the new statements remain
+        self.mock_s3.get_bucket_policy.assert_called_once()
+        policy = json.loads(self.mock_s3.put_bucket_policy.call_args[1]['Policy'])
+        self.assertEqual([stmt['Sid'] for stmt in policy['Statement']], ['AllowRoleRead', 'AllowRoleWrite'])
+        self.assertEqual(policy['Statement'][0]['Resource'],
+                         ['arn:aws:s3:::test-bucket/curated/*', 'arn:aws:s3:::test-bucket'])
+    
+    def test_setup_standard_lifecycle_rules(self):
+        """Test setup_standard_lifecycle_rules method on a bucket without lifecycle rules."""
+        self.mock_s3.get_bucket_lifecycle_configuration.side_effect = ClientError(
+            {'Error': {'Code': 'NoSuchLifecycleConfiguration', 'Message': 'Not Found'}},
+            'GetBucketLifecycleConfiguration')
+        
+        result = self.access_control.setup_standard_lifecycle_rules()
+        
+        # Assert all rules were written with a single update
+        self.assertTrue(result)
+        self.mock_s3.put_bucket_lifecycle_configuration.assert_called_once()
+        rules = self.mock_s3.put_bucket_lifecycle_configuration.call_args[1]['LifecycleConfiguration']['Rules']
+        self.assertEqual([rule['ID'] for rule in rules], ['Rule-raw-', 'Rule-processed-', 'Rule-enriched-'])
+        self.assertNotIn('Expiration', rules[0])
+    
+    def test_bootstrap(self):
+        """Test bootstrap method."""
+        result = self.access_control.bootstrap()
+        
+        # Assert every setting was applied
+        self.assertTrue(result)
+        self.mock_s3.put_bucket_versioning.assert_called_once()
+        self.mock_s3.put_bucket_encryption.assert_called_once()
+        self.mock_s3.put_bucket_cors.assert_called_once()
+        self.mock_s3.put_bucket_policy.assert_called_once()
 
 if __name__ == '__main__':
     unittest.main()
-EOF
-echo "Created test_data_lake.py"
\ No newline at end of file
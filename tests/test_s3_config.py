@@ -0,0 +1,81 @@
+"""
+Unit tests for the S3 Data Lake configuration.
+
+This module contains tests for the S3DataLakeConfig class.
+"""
+
+import os
+import json
+import tempfile
+import unittest
+
+from config.s3_config import S3DataLakeConfig
+
+class TestS3DataLakeConfig(unittest.TestCase):
+    """Test cases for the S3DataLakeConfig class."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.temp_dir.name, 'config', 's3_config.json')
+        self.defaults = S3DataLakeConfig(os.path.join(self.temp_dir.name, 'defaults.json'))
+    
+    def tearDown(self):
+        """Clean up after tests."""
+        self.temp_dir.cleanup()
+    
+    def _saved_config(self):
+        """Parse the config file written by the configuration under test."""
+        with open(self.config_path) as f:
+            return json.load(f)
+    
+    def test_missing_file_saves_defaults(self):
+        """Test a missing config file is created with the defaults."""
+        config = S3DataLakeConfig(self.config_path)
+        
+        # Assert the whole default configuration was written
+        self.assertEqual(self._saved_config(), json.loads(json.dumps(config._defaults)))
+        self.assertTrue(config.validate_config()[0])
+    
+    def test_save_load_round_trip(self):
+        """Test a save/load round trip keeps the overrides and writes only those sections."""
+        config = S3DataLakeConfig(self.config_path)
+        self.assertTrue(config.update_config({'aws': {'region_name': 'eu-west-1'}}))
+        
+        # Assert only the updated section, seeded from its defaults, was written
+        saved = self._saved_config()
+        self.assertEqual(list(saved), ['aws'])
+        self.assertEqual(saved['aws']['bucket_name'], self.defaults.get_bucket_name())
+        
+        # Assert reloading keeps the override and falls back to the defaults elsewhere
+        reloaded = S3DataLakeConfig(self.config_path)
+        self.assertEqual(reloaded.get_region_name(), 'eu-west-1')
+        self.assertEqual(reloaded.get_bucket_name(), self.defaults.get_bucket_name())
+        self.assertEqual(reloaded.get_transfer_config(), self.defaults.get_transfer_config())
+        self.assertEqual(reloaded.get_data_lake_config(), self.defaults.get_data_lake_config())
+        self.assertTrue(reloaded.validate_config()[0])
+    
+    def test_update_config_merges_nested(self):
+        """Test update_config merges nested dictionaries key by key."""
+        config = S3DataLakeConfig(self.config_path)
+        self.assertTrue(config.update_config({'data_lake': {'lifecycle_rules': {'raw': {'days_to_ia': 30}}}}))
+        self.assertTrue(config.update_config({'data_lake': {'lifecycle_rules': {'curated': {'days_to_ia': 365}}}}))
+        
+        # Assert the updated keys changed and their siblings kept their values
+        data_lake = config.get_data_lake_config()
+        self.assertEqual(data_lake['zones'], self.defaults.get_data_lake_config()['zones'])
+        self.assertEqual(data_lake['lifecycle_rules'], {
+            'raw': {'days_to_ia': 30, 'days_to_glacier': None},
+            'processed': {'days_to_ia': None, 'days_to_glacier': 180},
+            'curated': {'days_to_ia': 365}
+        })
+        
+        # Assert the defaults were not modified by the merge
+        self.assertEqual(config._defaults['data_lake']['lifecycle_rules']['raw']['days_to_ia'], 90)
+        self.assertNotIn('curated', config._defaults['data_lake']['lifecycle_rules'])
+        
+        # Assert the merged section is what was saved
+        self.assertEqual(S3DataLakeConfig(self.config_path).get_data_lake_config(), data_lake)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Unit tests for the local upload cache.
+
+This module contains tests for compute_etag and the UploadCache class.
+"""
+
+import os
+import hashlib
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from s3transfer.utils import ChunksizeAdjuster
+
+from src.data_ingestion import upload_cache
+from src.data_ingestion.upload_cache import UploadCache, compute_etag
+
+MiB = 1024 * 1024
+
+class TestComputeEtag(unittest.TestCase):
+    """Test cases for compute_etag."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, 'data.bin')
+        self.content = os.urandom(12 * MiB)
+        with open(self.file_path, 'wb') as f:
+            f.write(self.content)
+    
+    def tearDown(self):
+        """Clean up after tests."""
+        self.temp_dir.cleanup()
+    
+    def _multipart_etag(self, part_size):
+        """ETag S3 assigns to the test file uploaded in parts of part_size bytes."""
+        parts = [self.content[i:i + part_size] for i in range(0, len(self.content), part_size)]
+        digests = b''.join(hashlib.md5(part).digest() for part in parts)
+        return f"{hashlib.md5(digests).hexdigest()}-{len(parts)}"
+    
+    def test_single_part(self):
+        """Test compute_etag for a file below the multipart threshold."""
+        etag = compute_etag(self.file_path, 16 * MiB, 8 * MiB)
+        
+        # Assert the ETag is the MD5 of the content
+        self.assertEqual(etag, hashlib.md5(self.content).hexdigest())
+    
+    def test_multipart(self):
+        """Test compute_etag for a file uploaded in parts."""
+        etag = compute_etag(self.file_path, 8 * MiB, 5 * MiB)
+        
+        # Assert the ETag covers parts of 5, 5 and 2 MiB
+        self.assertEqual(etag, self._multipart_etag(5 * MiB))
+        self.assertTrue(etag.endswith('-3'))
+    
+    def test_multipart_part_size_adjustment(self):
+        """Test compute_etag adjusts the part size like the transfer manager."""
+        # Below the S3 minimum part size, and too many parts for the limit
+        with patch.object(upload_cache, 'MAX_PARTS', 2):
+            etag = compute_etag(self.file_path, 8 * MiB, 1 * MiB)
+        
+        # Assert the part size matches s3transfer's adjustment
+        part_size = ChunksizeAdjuster(max_parts=2).adjust_chunksize(1 * MiB, len(self.content))
+        self.assertEqual(etag, self._multipart_etag(part_size))
+
+class TestUploadCache(unittest.TestCase):
+    """Test cases for the UploadCache class."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.temp_dir.name, 'data.txt')
+        with open(self.file_path, 'w') as f:
+            f.write('a,b\n1,2\n')
+        
+        self.cache = UploadCache(os.path.join(self.temp_dir.name, 'cache', 'upload_cache.sqlite'))
+    
+    def tearDown(self):
+        """Clean up after tests."""
+        self.cache.close()
+        self.temp_dir.cleanup()
+    
+    def test_cache_hit(self):
+        """Test get_etag for an unchanged file."""
+        stat = os.stat(self.file_path)
+        self.cache.put(self.file_path, 'raw/data.txt', stat, 'abc')
+        
+        # Assert the recorded ETag is returned
+        self.assertEqual(self.cache.get_etag(self.file_path, 'raw/data.txt', os.stat(self.file_path)), 'abc')
+    
+    def test_cache_miss(self):
+        """Test get_etag for unknown keys and changed files."""
+        stat = os.stat(self.file_path)
+        self.cache.put(self.file_path, 'raw/data.txt', stat, 'abc')
+        
+        # Assert another S3 key has no entry
+        self.assertIsNone(self.cache.get_etag(self.file_path, 'processed/data.txt', stat))
+        
+        # Change the file; its size and modification time no longer match
+        with open(self.file_path, 'a') as f:
+            f.write('3,4\n')
+        os.utime(self.file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        
+        # Assert the entry is no longer valid
+        self.assertIsNone(self.cache.get_etag(self.file_path, 'raw/data.txt', os.stat(self.file_path)))
+
+if __name__ == '__main__':
+    unittest.main()